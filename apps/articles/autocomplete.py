@@ -0,0 +1,88 @@
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Case, IntegerField, Value, When
+from django.db.models.functions import Length
+from taggit.models import Tag
+
+from ..users.models import User
+from .helpers.utils import filter_queryset
+from .models import Article
+
+AUTOCOMPLETE_LIMIT = 5
+MAX_AUTOCOMPLETE_LIMIT = 10
+AUTOCOMPLETE_CACHE_TIMEOUT = 30
+# Shorter queries have no complete trigram, so only prefixes are matched
+TRIGRAM_MIN_LENGTH = 3
+
+
+def trigram_search_enabled(query):
+    return connection.vendor == "postgresql" and len(query) >= TRIGRAM_MIN_LENGTH
+
+
+def suggest(queryset, field, query, limit):
+    """
+    The values of field matching query, prefix matches and shorter values
+    first. On PostgreSQL, prefix matches are served by text_pattern_ops
+    indexes on UPPER(field), and queries long enough for the pg_trgm
+    indexes also match inside the values.
+    """
+
+    if not trigram_search_enabled(query):
+        queryset = queryset.filter(**{f"{field}__istartswith": query})
+    else:
+        queryset = queryset.filter(**{f"{field}__icontains": query})
+
+    prefix_first = Case(
+        When(**{f"{field}__istartswith": query}, then=Value(0)),
+        default=Value(1),
+        output_field=IntegerField(),
+    )
+
+    return queryset.order_by(prefix_first, Length(field), field)[:limit]
+
+
+def get_users(user):
+    """The users whose usernames are suggested, all of them only to admins"""
+
+    users = User.objects.filter(is_active=True)
+
+    if user.is_admin:
+        return users
+
+    return users.filter(pkid=user.pkid)
+
+
+def get_suggestions(query, limit, user):
+    titles = filter_queryset(Article.objects.all(), user)
+
+    return {
+        "titles": list(suggest(titles, "title", query, limit).values("title", "slug")),
+        "tags": list(
+            suggest(Tag.objects.all(), "name", query, limit).values_list(
+                "name", flat=True
+            )
+        ),
+        "usernames": list(
+            suggest(get_users(user), "username", query, limit).values("id", "username")
+        ),
+    }
+
+
+def get_autocomplete_cache_key(query, limit, user):
+    # Titles and usernames are filtered for everyone but admins
+    scope = "all" if user.is_admin else user.pkid
+
+    return f"autocomplete:{scope}:{limit}:{query.lower()}"
+
+
+def autocomplete(query, limit, user):
+    """Suggestions for a typeahead query, cached for a short while"""
+
+    key = get_autocomplete_cache_key(query, limit, user)
+    suggestions = cache.get(key)
+
+    if suggestions is None:
+        suggestions = get_suggestions(query, limit, user)
+        cache.set(key, suggestions, AUTOCOMPLETE_CACHE_TIMEOUT)
+
+    return suggestions
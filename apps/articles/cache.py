@@ -0,0 +1,55 @@
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import Article
+
+# Bump when the ArticleDisplaySerializer output or the entries change shape
+ARTICLE_CACHE_VERSION = 2
+ARTICLE_CACHE_TIMEOUT = 60 * 15
+
+
+def get_article_cache_key(slug):
+    return f"article:{slug}"
+
+
+def get_cached_article(slug, host):
+    """
+    Return the author pk, the article pk and the payload cached for the slug
+    and host.
+
+    Payloads are stored per host because the author avatar is rendered as an
+    absolute URL.
+    """
+
+    entry = cache.get(get_article_cache_key(slug), version=ARTICLE_CACHE_VERSION)
+
+    if not entry:
+        return None, None, None
+
+    return entry["author"], entry["pkid"], entry["data"].get(host)
+
+
+def cache_article(article, host, data, replace=False):
+    key = get_article_cache_key(article.slug)
+    entry = None if replace else cache.get(key, version=ARTICLE_CACHE_VERSION)
+
+    if not entry or entry["author"] != article.author_id:
+        entry = {"author": article.author_id, "pkid": article.pkid, "data": {}}
+
+    entry["data"][host] = data
+    cache.set(key, entry, ARTICLE_CACHE_TIMEOUT, version=ARTICLE_CACHE_VERSION)
+
+
+def invalidate_articles(slugs):
+    keys = [get_article_cache_key(slug) for slug in slugs]
+
+    if keys:
+        transaction.on_commit(
+            lambda: cache.delete_many(keys, version=ARTICLE_CACHE_VERSION)
+        )
+
+
+def invalidate_author_articles(author_id):
+    invalidate_articles(
+        Article.objects.filter(author_id=author_id).values_list("slug", flat=True)
+    )
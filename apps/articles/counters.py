@@ -0,0 +1,100 @@
+from django.db import connection, transaction
+from django.db.models import Case, F, Value, When
+
+from ..common.store import get_store
+from .models import Article
+from .trending import update_trending_articles
+
+# Hash of article pkid to the views not flushed to Article.view_count yet
+ARTICLE_VIEWS_KEY = "article:views"
+# The views taken by a flush, kept until they are committed to the database
+ARTICLE_VIEWS_PROCESSING_KEY = "article:views:processing"
+VIEWS_FLUSH_BATCH_SIZE = 1000
+
+
+def record_article_view(pkid):
+    get_store().hincrby(ARTICLE_VIEWS_KEY, pkid, 1)
+
+
+def get_article_view_count(article):
+    """The flushed views of an article plus the ones still buffered"""
+
+    with get_store().pipeline() as pipeline:
+        pipeline.hget(ARTICLE_VIEWS_KEY, article.pkid)
+        pipeline.hget(ARTICLE_VIEWS_PROCESSING_KEY, article.pkid)
+        buffered = pipeline.execute()
+
+    return article.view_count + sum(int(count or 0) for count in buffered)
+
+
+def take_article_views():
+    """
+    Move the buffered views to the processing hash, unless a flush that
+    failed or was killed left views there, which are flushed first.
+    """
+
+    store = get_store()
+
+    # Only the flush removes the buffer, so it can't be gone by the rename
+    if not store.exists(ARTICLE_VIEWS_PROCESSING_KEY) and store.exists(
+        ARTICLE_VIEWS_KEY
+    ):
+        store.rename(ARTICLE_VIEWS_KEY, ARTICLE_VIEWS_PROCESSING_KEY)
+
+    views = store.hgetall(ARTICLE_VIEWS_PROCESSING_KEY)
+
+    return {int(pkid): int(count) for pkid, count in views.items()}
+
+
+def add_article_views(views):
+    """
+    Add view counts to the articles with a single UPDATE per batch, joined
+    against a VALUES list on PostgreSQL.
+    """
+
+    table = connection.ops.quote_name(Article._meta.db_table)
+    items = list(views.items())
+
+    for start in range(0, len(items), VIEWS_FLUSH_BATCH_SIZE):
+        end = start + VIEWS_FLUSH_BATCH_SIZE
+        batch = items[start:end]
+
+        if connection.vendor != "postgresql":
+            Article.objects.filter(pkid__in=[pkid for pkid, _ in batch]).update(
+                view_count=F("view_count")
+                + Case(*[When(pkid=pkid, then=Value(count)) for pkid, count in batch])
+            )
+            continue
+
+        values = ", ".join(["(%s, %s)"] * len(batch))
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {table} SET view_count = {table}.view_count + v.views "
+                f"FROM (VALUES {values}) AS v(pkid, views) "
+                f"WHERE {table}.pkid = v.pkid",
+                [value for item in batch for value in item],
+            )
+
+
+def flush_article_views():
+    """
+    Move the buffered views to Article.view_count and the trending ranking.
+
+    The views stay in the processing hash until the update is committed,
+    so that the next flush adds them when this one fails or its worker is
+    killed. Flushes run one at a time, each periodic run scheduling the
+    next one, and outside of any transaction.
+    """
+
+    views = take_article_views()
+
+    if views:
+        with transaction.atomic():
+            add_article_views(views)
+
+        get_store().delete(ARTICLE_VIEWS_PROCESSING_KEY)
+
+    update_trending_articles(views)
+
+    return len(views)
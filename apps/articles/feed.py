@@ -0,0 +1,121 @@
+from itertools import islice
+
+from ..common.store import get_store
+from ..users.models import Follow
+from .models import Article
+
+# Newest articles kept in each timeline
+FEED_LENGTH = 800
+# Authors with more followers aren't fanned out on write, their articles are
+# merged into the feeds of their followers on read
+FAN_OUT_LIMIT = 10000
+FAN_OUT_BATCH_SIZE = 1000
+POPULAR_AUTHORS_KEY = "feed:popular-authors"
+
+
+def get_feed_key(user_pkid):
+    """Sorted set of the article pkids in a user's timeline, scored by pkid"""
+
+    return f"feed:{user_pkid}"
+
+
+def add_to_timelines(user_pkids, pkids):
+    mapping = {pkid: pkid for pkid in pkids}
+
+    with get_store().pipeline(transaction=False) as pipeline:
+        for user_pkid in user_pkids:
+            key = get_feed_key(user_pkid)
+            pipeline.zadd(key, mapping)
+            pipeline.zremrangebyrank(key, 0, -FEED_LENGTH - 1)
+
+        pipeline.execute()
+
+
+def is_popular_author(author_pkid):
+    return Follow.objects.filter(followed_id=author_pkid)[FAN_OUT_LIMIT:].exists()
+
+
+def fan_out_articles(author_pkid, pkids):
+    """
+    Push new articles of an author to the timelines of their followers.
+
+    Authors with more than FAN_OUT_LIMIT followers are marked as popular
+    instead and read from the database by get_feed_page.
+    """
+
+    if is_popular_author(author_pkid):
+        get_store().sadd(POPULAR_AUTHORS_KEY, author_pkid)
+        return 0
+
+    followers = (
+        Follow.objects.filter(followed_id=author_pkid)
+        .values_list("follower_id", flat=True)
+        .iterator(chunk_size=FAN_OUT_BATCH_SIZE)
+    )
+    count = 0
+
+    while batch := list(islice(followers, FAN_OUT_BATCH_SIZE)):
+        add_to_timelines(batch, pkids)
+        count += len(batch)
+
+    return count
+
+
+def add_author_to_feed(follower_pkid, author_pkid):
+    """Backfill the timeline of a new follower with the author's articles"""
+
+    if str(author_pkid) in get_store().smembers(POPULAR_AUTHORS_KEY):
+        return
+
+    pkids = Article.objects.filter(author_id=author_pkid).order_by("-pkid")
+    pkids = list(pkids.values_list("pkid", flat=True)[:FEED_LENGTH])
+
+    if pkids:
+        add_to_timelines([follower_pkid], pkids)
+
+
+def remove_author_from_feed(follower_pkid, author_pkid):
+    key = get_feed_key(follower_pkid)
+    store = get_store()
+    timeline = store.zrevrangebyscore(key, "+inf", "-inf")
+    pkids = Article.objects.filter(pkid__in=timeline, author_id=author_pkid)
+    pkids = list(pkids.values_list("pkid", flat=True))
+
+    if pkids:
+        store.zrem(key, *pkids)
+
+
+def get_feed_page(user, limit, before=None):
+    """
+    Return the pkids of a page of the user's feed, newest first and older
+    than the before pkid, and whether there are more pages.
+
+    The timeline and the articles of the followed popular authors are each
+    read for one page, so the cost doesn't grow with the number of follows.
+    """
+
+    store = get_store()
+    page_end = limit + 1
+    max_score = "+inf" if before is None else f"({before}"
+    timeline = store.zrevrangebyscore(
+        get_feed_key(user.pkid), max_score, "-inf", start=0, num=page_end
+    )
+    pkids = {int(pkid) for pkid in timeline}
+    popular_authors = store.smembers(POPULAR_AUTHORS_KEY)
+
+    if popular_authors:
+        articles = Article.objects.filter(
+            author__in=Follow.objects.filter(
+                follower=user, followed_id__in=popular_authors
+            ).values("followed_id")
+        )
+
+        if before is not None:
+            articles = articles.filter(pkid__lt=before)
+
+        articles = articles.order_by("-pkid").values_list("pkid", flat=True)
+        pkids.update(articles[:page_end])
+
+    pkids = sorted(pkids, reverse=True)
+
+    return pkids[:limit], len(pkids) > limit
@@ -0,0 +1,96 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import IntegrityError, transaction
+from taggit.models import Tag, TaggedItem
+
+from ...common.jobs import enqueue_on_commit
+from ..feed import fan_out_articles
+from ..models import Article
+from ..related import index_related_articles
+from ..search import update_author_search_vectors
+from .utils import SLUG_CREATE_ATTEMPTS, generate_slugs
+
+
+def get_or_create_tags(names):
+    """Resolve tag names to Tag rows with bulk queries"""
+
+    tags = {tag.name: tag for tag in Tag.objects.filter(name__in=names)}
+    missing = [name for name in names if name not in tags]
+
+    if missing:
+        Tag.objects.bulk_create(
+            [Tag(name=name, slug=Tag().slugify(name)) for name in missing],
+            ignore_conflicts=True,
+        )
+        tags.update({tag.name: tag for tag in Tag.objects.filter(name__in=missing)})
+
+    # Names whose slug clashed with another tag go through Tag.save, which
+    # knows how to pick a free slug
+    for name in names:
+        if name not in tags:
+            tags[name] = Tag.objects.get_or_create(name=name)[0]
+
+    return tags
+
+
+def insert_articles(author, items):
+    slugs = generate_slugs([item["title"] for item in items])
+    articles = [
+        Article(
+            title=item["title"],
+            body=item["body"],
+            slug=slug,
+            author=author,
+            tag_names=sorted(set(item.get("tags", []))),
+        )
+        for item, slug in zip(items, slugs)
+    ]
+
+    # bulk_create skips Article.save, so fill in the body summary here
+    for article in articles:
+        article.update_summary()
+
+    Article.objects.bulk_create(articles)
+
+    names = {name for item in items for name in item.get("tags", [])}
+    tags = get_or_create_tags(names)
+    content_type = ContentType.objects.get_for_model(Article)
+    TaggedItem.objects.bulk_create(
+        [
+            TaggedItem(
+                content_type=content_type,
+                object_id=article.pkid,
+                tag=tags[name],
+            )
+            for article, item in zip(articles, items)
+            for name in set(item.get("tags", []))
+        ]
+    )
+
+    return articles
+
+
+def bulk_create_articles(author, items):
+    """
+    Insert validated articles with one slug query, one article insert and
+    bulk tag inserts. The whole batch is retried in a savepoint when a
+    concurrent request took one of the allocated slugs.
+    """
+
+    if not items:
+        return []
+
+    for attempt in range(1, SLUG_CREATE_ATTEMPTS + 1):
+        try:
+            with transaction.atomic():
+                articles = insert_articles(author, items)
+                break
+        except IntegrityError:
+            if attempt == SLUG_CREATE_ATTEMPTS:
+                raise
+
+    pkids = [article.pkid for article in articles]
+    update_author_search_vectors(author, pkids=pkids)
+    enqueue_on_commit(fan_out_articles, author.pkid, pkids)
+    enqueue_on_commit(index_related_articles, pkids)
+
+    return articles
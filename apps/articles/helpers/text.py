@@ -0,0 +1,18 @@
+import math
+
+from django.utils.text import Truncator
+
+EXCERPT_WORDS = 50
+WORDS_PER_MINUTE = 200
+
+
+def get_body_summary(body):
+    """Return the excerpt, word count and reading time (in minutes) of a body"""
+
+    word_count = len(body.split())
+
+    return {
+        "excerpt": Truncator(body).words(EXCERPT_WORDS),
+        "word_count": word_count,
+        "reading_time": max(1, math.ceil(word_count / WORDS_PER_MINUTE)),
+    }
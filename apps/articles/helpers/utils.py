@@ -1,21 +1,103 @@
-import random
-import string
+import re
+
+from django.db import IntegrityError, transaction
+from django.db.models import Q
 
 from ..models import Article
 
+SLUG_CREATE_ATTEMPTS = 3
+# Slugs that would be shadowed by other article routes
+RESERVED_SLUGS = {"autocomplete", "bulk", "feed", "trending"}
+
+
+def get_base_slug(title):
+    return "-".join(title.split(" ")).lower()
+
+
+def get_taken_slugs(bases):
+    """
+    Fetch every existing slug equal to one of the bases or starting with
+    "<base>-" in a single query, served by the slug prefix index.
+    """
+
+    query = Q()
+
+    for base in bases:
+        query |= Q(slug=base) | Q(slug__startswith=f"{base}-")
+
+    return set(Article.objects.filter(query).values_list("slug", flat=True))
+
+
+def allocate_slug(base, taken_slugs):
+    if base not in taken_slugs and base not in RESERVED_SLUGS:
+        return base
+
+    pattern = re.compile(rf"^{re.escape(base)}-(\d+)$")
+    suffixes = [
+        int(match.group(1))
+        for match in (pattern.match(slug) for slug in taken_slugs)
+        if match
+    ]
+
+    return f"{base}-{max(suffixes, default=0) + 1}"
+
+
+def generate_slug(title):
+    base = get_base_slug(title)
+
+    return allocate_slug(base, get_taken_slugs([base]))
+
 
-def generate_slug(title, prefix=None):
-    slug = "-".join(title.split(" ")).lower()
-    slug = slug + f"-{prefix}" if prefix else slug
+def generate_slugs(titles):
+    """Allocate distinct free slugs for a batch of titles with one query"""
 
-    if not Article.objects.filter(slug=slug).exists():
-        return slug
+    bases = [get_base_slug(title) for title in titles]
+    taken_slugs = get_taken_slugs(set(bases))
+    slugs = []
 
-    else:
-        random_str = "".join(
-            random.choices(string.ascii_lowercase + string.digits, k=7)
-        )
-        return generate_slug(title, random_str)
+    for base in bases:
+        slug = allocate_slug(base, taken_slugs)
+        taken_slugs.add(slug)
+        slugs.append(slug)
+
+    return slugs
+
+
+def create_with_unique_slug(title, create):
+    """
+    Call create(slug) with a freshly allocated slug inside a savepoint and
+    allocate again if a concurrent request took the slug in the meantime.
+    """
+
+    for attempt in range(1, SLUG_CREATE_ATTEMPTS + 1):
+        slug = generate_slug(title)
+
+        try:
+            with transaction.atomic():
+                return create(slug)
+        except IntegrityError:
+            slug_taken = Article.objects.filter(slug=slug).exists()
+
+            if not slug_taken or attempt == SLUG_CREATE_ATTEMPTS:
+                raise
+
+
+def get_display_queryset():
+    """Articles with everything ArticleDisplaySerializer reads loaded up front"""
+
+    return (
+        Article.objects.select_related("author__profile")
+        .prefetch_related("tags")
+        .defer("search_vector")
+    )
+
+
+def get_in_order(queryset, pkids):
+    """Load the articles with the given pkids, in the order of pkids"""
+
+    articles = queryset.in_bulk(pkids)
+
+    return [articles[pkid] for pkid in pkids if pkid in articles]
 
 
 def filter_queryset(queryset, user):
@@ -23,3 +105,16 @@ def filter_queryset(queryset, user):
         return queryset
 
     return queryset.filter(author=user)
+
+
+def get_article_versions(request, slug):
+    """
+    The timestamps an article representation is built from. Tag changes
+    touch the article's updated_at so they are covered too.
+    """
+
+    return (
+        filter_queryset(Article.objects.filter(slug=slug), request.user)
+        .values_list("updated_at", "author__updated_at", "author__profile__updated_at")
+        .first()
+    )
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from apps.articles.models import Article
+from apps.articles.related import index_related_articles
+
+
+class Command(BaseCommand):
+    help = "Rebuild the related articles index from the article tags"
+
+    def handle(self, *args, **options):
+        pkids = list(Article.objects.values_list("pkid", flat=True))
+        index_related_articles(pkids)
+
+        self.stdout.write(f"Indexed {len(pkids)} articles")
@@ -0,0 +1,16 @@
+from taggit.managers import _TaggableManager
+
+
+class ArticleTagManager(_TaggableManager):
+    """
+    Tag manager of the articles, flagging the set() calls so that the
+    removals and additions they are made of update the article once.
+    """
+
+    def set(self, tags, **kwargs):
+        self.instance.setting_tags = True
+
+        try:
+            super().set(tags, **kwargs)
+        finally:
+            self.instance.setting_tags = False
@@ -0,0 +1,55 @@
+# Generated by Django 4.1.3 on 2026-10-18 10:51
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+from apps.common.operations import PostgresOnly
+
+POPULATE_SEARCH_VECTOR = """
+UPDATE articles_article AS article
+SET search_vector =
+    setweight(to_tsvector('english', article.title), 'A')
+    || setweight(to_tsvector('english', coalesce((
+        SELECT string_agg(tag.name, ' ')
+        FROM taggit_taggeditem AS item
+        JOIN taggit_tag AS tag ON tag.id = item.tag_id
+        JOIN django_content_type AS ct ON ct.id = item.content_type_id
+        WHERE item.object_id = article.pkid
+            AND ct.app_label = 'articles' AND ct.model = 'article'
+    ), '')), 'B')
+    || setweight(to_tsvector('english', concat_ws(
+        ' ', author.first_name, author.middle_name, author.last_name
+    )), 'B')
+    || setweight(to_tsvector('english', article.body), 'C')
+FROM users_user AS author
+WHERE author.pkid = article.author_id
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0001_initial"),
+        ("taggit", "0005_auto_20220424_2025"),
+        ("users", "0002_user_auth_provider"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="article",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        PostgresOnly(
+            migrations.AddIndex(
+                model_name="article",
+                index=django.contrib.postgres.indexes.GinIndex(
+                    fields=["search_vector"], name="article_search_vector_idx"
+                ),
+            )
+        ),
+        PostgresOnly(migrations.RunSQL(POPULATE_SEARCH_VECTOR, migrations.RunSQL.noop)),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 4.1.3 on 2026-10-18 11:06
+
+from django.db import migrations, models
+
+from apps.articles.helpers.text import get_body_summary
+
+
+SUMMARY_BATCH_SIZE = 500
+
+
+def populate_summary(apps, schema_editor):
+    Article = apps.get_model("articles", "Article")
+    fields = ["excerpt", "word_count", "reading_time"]
+    articles = []
+
+    # Flushed every batch so that only one batch of bodies is held at once
+    for article in Article.objects.only("pkid", "body").iterator(
+        chunk_size=SUMMARY_BATCH_SIZE
+    ):
+        for field, value in get_body_summary(article.body).items():
+            setattr(article, field, value)
+        articles.append(article)
+
+        if len(articles) == SUMMARY_BATCH_SIZE:
+            Article.objects.bulk_update(articles, fields)
+            articles = []
+
+    Article.objects.bulk_update(articles, fields)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0002_article_search_vector"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="article",
+            name="excerpt",
+            field=models.TextField(default="", editable=False),
+        ),
+        migrations.AddField(
+            model_name="article",
+            name="reading_time",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="article",
+            name="word_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(populate_summary, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.1.3 on 2026-10-18 11:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0003_article_summary"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="article",
+            name="view_count",
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.1.3 on 2026-10-18 11:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0004_article_view_count"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                fields=["author", "-pkid"], name="article_author_pkid_idx"
+            ),
+        ),
+    ]
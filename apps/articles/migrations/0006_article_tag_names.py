@@ -0,0 +1,43 @@
+# Generated by Django 4.1.3 on 2026-10-18 11:44
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+from apps.common.operations import PostgresOnly
+
+POPULATE_TAG_NAMES = """
+UPDATE articles_article AS article
+SET tag_names = coalesce((
+    SELECT jsonb_agg(tag.name ORDER BY tag.name)
+    FROM taggit_taggeditem AS item
+    JOIN taggit_tag AS tag ON tag.id = item.tag_id
+    JOIN django_content_type AS ct ON ct.id = item.content_type_id
+    WHERE item.object_id = article.pkid
+        AND ct.app_label = 'articles' AND ct.model = 'article'
+), '[]'::jsonb)
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0005_article_author_pkid_idx"),
+        ("taggit", "0005_auto_20220424_2025"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="article",
+            name="tag_names",
+            field=models.JSONField(default=list, editable=False),
+        ),
+        PostgresOnly(
+            migrations.AddIndex(
+                model_name="article",
+                index=django.contrib.postgres.indexes.GinIndex(
+                    fields=["tag_names"], name="article_tag_names_idx"
+                ),
+            )
+        ),
+        PostgresOnly(migrations.RunSQL(POPULATE_TAG_NAMES, migrations.RunSQL.noop)),
+    ]
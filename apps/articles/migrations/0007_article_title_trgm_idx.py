@@ -0,0 +1,58 @@
+# Generated by Django 4.1.3 on 2026-10-18 11:46
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations, models
+
+from apps.common.operations import PostgresOnly
+
+# taggit's Tag model can't declare the indexes, so they're created here
+CREATE_TAG_NAME_INDEXES = """
+CREATE INDEX IF NOT EXISTS taggit_tag_name_trgm_idx
+ON taggit_tag USING gin (UPPER(name) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS taggit_tag_name_prefix_idx
+ON taggit_tag (UPPER(name) text_pattern_ops)
+"""
+DROP_TAG_NAME_INDEXES = """
+DROP INDEX IF EXISTS taggit_tag_name_trgm_idx;
+DROP INDEX IF EXISTS taggit_tag_name_prefix_idx
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0006_article_tag_names"),
+        ("taggit", "0005_auto_20220424_2025"),
+        ("users", "0004_user_username_trgm_idx"),
+    ]
+
+    operations = [
+        PostgresOnly(
+            migrations.AddIndex(
+                model_name="article",
+                index=django.contrib.postgres.indexes.GinIndex(
+                    django.contrib.postgres.indexes.OpClass(
+                        django.db.models.functions.text.Upper("title"),
+                        name="gin_trgm_ops",
+                    ),
+                    name="article_title_trgm_idx",
+                ),
+            )
+        ),
+        PostgresOnly(
+            migrations.AddIndex(
+                model_name="article",
+                index=models.Index(
+                    django.contrib.postgres.indexes.OpClass(
+                        django.db.models.functions.text.Upper("title"),
+                        name="text_pattern_ops",
+                    ),
+                    name="article_title_prefix_idx",
+                ),
+            )
+        ),
+        PostgresOnly(
+            migrations.RunSQL(CREATE_TAG_NAME_INDEXES, DROP_TAG_NAME_INDEXES)
+        ),
+    ]
@@ -1,8 +1,19 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models.functions import Upper
 from taggit.managers import TaggableManager
 
 from ..common.models import BaseModel
 from ..users.models import User
+from .helpers.text import get_body_summary
+from .managers import ArticleTagManager
+
+SUMMARY_FIELDS = ["excerpt", "word_count", "reading_time"]
+# Only written by their flush jobs, see apps.articles.counters
+COUNTER_FIELDS = ["view_count"]
+# Only written when the tags change, see apps.articles.tags
+DENORMALIZED_FIELDS = ["tag_names"]
 
 
 class Article(BaseModel):
@@ -11,5 +22,64 @@ class Article(BaseModel):
     title = models.CharField(max_length=255)
     slug = models.SlugField(max_length=300, unique=True)
     body = models.TextField()
-    tags = TaggableManager()
+    tags = TaggableManager(manager=ArticleTagManager)
     author = models.ForeignKey(User, related_name="articles", on_delete=models.CASCADE)
+    excerpt = models.TextField(default="", editable=False)
+    word_count = models.PositiveIntegerField(default=0, editable=False)
+    reading_time = models.PositiveIntegerField(default=0, editable=False)
+    search_vector = SearchVectorField(null=True, editable=False)
+    view_count = models.PositiveBigIntegerField(default=0, editable=False)
+    tag_names = models.JSONField(default=list, editable=False)
+
+    # Set while tags.set() runs, see apps.articles.tags.tags_changed
+    setting_tags = False
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=["search_vector"], name="article_search_vector_idx"),
+            GinIndex(fields=["tag_names"], name="article_tag_names_idx"),
+            # Autocomplete, see apps.articles.autocomplete
+            GinIndex(
+                OpClass(Upper("title"), name="gin_trgm_ops"),
+                name="article_title_trgm_idx",
+            ),
+            # Autocomplete prefix matches, too short for the trigrams
+            models.Index(
+                OpClass(Upper("title"), name="text_pattern_ops"),
+                name="article_title_prefix_idx",
+            ),
+            # Newest articles of an author, for the feed backfills
+            models.Index(fields=["author", "-pkid"], name="article_author_pkid_idx"),
+        ]
+
+    def update_summary(self):
+        for field, value in get_body_summary(self.body).items():
+            setattr(self, field, value)
+
+    def get_dirty_fields(self):
+        """
+        The changed fields, leaving out the counters and the denormalized
+        tags, written by their own queries.
+        """
+
+        return [
+            field
+            for field in super().get_dirty_fields()
+            if field not in COUNTER_FIELDS and field not in DENORMALIZED_FIELDS
+        ]
+
+    def save(self, *args, **kwargs):
+        # Also doesn't overwrite increments flushed since the article was loaded
+        if kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = self.get_update_fields()
+
+        update_fields = kwargs["update_fields"]
+        body_changed = update_fields is None or "body" in update_fields
+
+        if body_changed and "body" not in self.get_deferred_fields():
+            self.update_summary()
+
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, *SUMMARY_FIELDS}
+
+        super().save(*args, **kwargs)
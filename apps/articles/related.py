@@ -0,0 +1,97 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Count
+from taggit.models import TaggedItem
+
+from ..common.store import get_store
+from .models import Article
+
+RELATED_ARTICLES_LIMIT = 5
+MAX_RELATED_ARTICLES_LIMIT = 20
+# Related articles kept per article, with room for the ones dropped later
+RELATED_INDEX_SIZE = 2 * MAX_RELATED_ARTICLES_LIMIT
+
+
+def get_related_key(pkid):
+    """Sorted set of the related article pkids, scored by their shared tags"""
+
+    return f"article:related:{pkid}"
+
+
+def get_shared_tag_counts(pkid):
+    items = TaggedItem.objects.filter(
+        content_type=ContentType.objects.get_for_model(Article)
+    )
+    shared = (
+        items.filter(tag__in=items.filter(object_id=pkid).values("tag_id"))
+        .exclude(object_id=pkid)
+        .values("object_id")
+        .annotate(count=Count("pk"))
+        .order_by()
+    )
+
+    return {row["object_id"]: row["count"] for row in shared}
+
+
+def get_containing_key(pkid):
+    """
+    Set of the articles whose related set may hold an article. It isn't
+    trimmed, so that the article can be removed from all of them.
+    """
+
+    return f"article:related:containing:{pkid}"
+
+
+def index_related_articles(pkids):
+    """
+    Recompute the shared tag counts of the articles from the database and
+    write them on both sides of each pair, so that reindexing any article
+    whose tags changed (or that was deleted) keeps the whole index right.
+
+    Each sorted set is trimmed to the RELATED_INDEX_SIZE articles sharing
+    the most tags, so popular tags don't grow it with every article using
+    them. As an article can be trimmed from its own set while still in the
+    other article's, the sets to remove it from are read from its
+    containing set.
+    """
+
+    store = get_store()
+
+    for pkid in pkids:
+        key = get_related_key(pkid)
+        containing_key = get_containing_key(pkid)
+        counts = get_shared_tag_counts(pkid)
+        stale = {int(member) for member in store.smembers(containing_key)}
+        stale -= counts.keys()
+        dropped = {int(member) for member in store.zrevrange(key, 0, -1)}
+        dropped -= counts.keys()
+
+        with store.pipeline() as pipeline:
+            pipeline.delete(key, containing_key)
+
+            if counts:
+                pipeline.zadd(key, counts)
+                pipeline.zremrangebyrank(key, 0, -(RELATED_INDEX_SIZE + 1))
+                pipeline.sadd(containing_key, *counts)
+
+            for other in stale:
+                pipeline.zrem(get_related_key(other), pkid)
+
+            for other in dropped:
+                pipeline.srem(get_containing_key(other), pkid)
+
+            for other, count in counts.items():
+                pipeline.zadd(get_related_key(other), {pkid: count})
+                pipeline.zremrangebyrank(
+                    get_related_key(other), 0, -(RELATED_INDEX_SIZE + 1)
+                )
+                pipeline.sadd(get_containing_key(other), pkid)
+
+            pipeline.execute()
+
+
+def get_related_pkids(pkid, limit=RELATED_ARTICLES_LIMIT):
+    """The pkids of the articles sharing the most tags with an article"""
+
+    related = get_store().zrevrange(get_related_key(pkid), 0, limit - 1)
+
+    return [int(member) for member in related]
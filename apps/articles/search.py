@@ -0,0 +1,123 @@
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import (
+    SearchHeadline,
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+)
+from django.db import connection
+from django.db.models import F, OuterRef, Subquery, TextField, Value
+from django.db.models.functions import Coalesce
+from rest_framework.filters import SearchFilter
+from taggit.models import TaggedItem
+
+from .models import Article
+
+SEARCH_CONFIG = "english"
+HEADLINE_OPTIONS = {
+    "start_sel": "<mark>",
+    "stop_sel": "</mark>",
+    "max_words": 35,
+    "min_words": 15,
+}
+
+
+def full_text_search_enabled():
+    return connection.vendor == "postgresql"
+
+
+def get_author_names(author):
+    names = [author.first_name, author.middle_name, author.last_name]
+    return " ".join(name for name in names if name)
+
+
+def get_article_search_vector(author_names):
+    """
+    Build the weighted document of an article: title first, then tags and
+    author names, then the body. The author names are passed in as a value
+    because an UPDATE can't join the users table.
+    """
+
+    tag_names = (
+        TaggedItem.objects.filter(
+            content_type=ContentType.objects.get_for_model(Article),
+            object_id=OuterRef("pkid"),
+        )
+        .values("object_id")
+        .annotate(names=StringAgg("tag__name", delimiter=" "))
+        .values("names")
+    )
+
+    return (
+        SearchVector("title", weight="A", config=SEARCH_CONFIG)
+        + SearchVector(
+            Coalesce(Subquery(tag_names), Value(""), output_field=TextField()),
+            weight="B",
+            config=SEARCH_CONFIG,
+        )
+        + SearchVector(Value(author_names), weight="B", config=SEARCH_CONFIG)
+        + SearchVector("body", weight="C", config=SEARCH_CONFIG)
+    )
+
+
+def get_search_vector_values(article):
+    """The search vector for an UPDATE of the article, if it is kept at all"""
+
+    if not full_text_search_enabled():
+        return {}
+
+    return {
+        "search_vector": get_article_search_vector(get_author_names(article.author))
+    }
+
+
+def update_search_vector(article):
+    values = get_search_vector_values(article)
+
+    if values:
+        Article.objects.filter(pkid=article.pkid).update(**values)
+
+
+def update_author_search_vectors(author, pkids=None):
+    if not full_text_search_enabled():
+        return
+
+    queryset = Article.objects.filter(author=author)
+
+    if pkids is not None:
+        queryset = queryset.filter(pkid__in=pkids)
+
+    queryset.update(search_vector=get_article_search_vector(get_author_names(author)))
+
+
+class ArticleSearchFilter(SearchFilter):
+    """
+    Full text search on the stored article search vector.
+
+    Results are ranked with ts_rank and annotated with a highlighted snippet
+    of the body. Databases without full text search fall back to the default
+    icontains search on the view's search_fields.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        if not full_text_search_enabled():
+            return super().filter_queryset(request, queryset, view)
+
+        terms = " ".join(self.get_search_terms(request))
+
+        if not terms:
+            return queryset
+
+        query = SearchQuery(terms, search_type="websearch", config=SEARCH_CONFIG)
+
+        return (
+            queryset.filter(search_vector=query)
+            .annotate(
+                search_rank=SearchRank(F("search_vector"), query),
+                search_headline=SearchHeadline(
+                    "body", query, config=SEARCH_CONFIG, **HEADLINE_OPTIONS
+                ),
+            )
+            .order_by("-search_rank", *queryset.query.order_by)
+        )
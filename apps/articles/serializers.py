@@ -1,10 +1,21 @@
 from rest_framework import serializers
 from taggit.serializers import TaggitSerializer, TagListSerializerField
 
-from ..common.serializers import BaseSerializer
+from ..common.jobs import enqueue_on_commit
+from ..common.serializers import (
+    BaseSerializer,
+    CompiledRepresentationMixin,
+    SparseFieldsetMixin,
+)
 from ..users.models import User
-from .helpers.utils import generate_slug
+from .autocomplete import AUTOCOMPLETE_LIMIT, MAX_AUTOCOMPLETE_LIMIT
+from .feed import fan_out_articles
+from .helpers.utils import create_with_unique_slug
 from .models import Article
+from .related import MAX_RELATED_ARTICLES_LIMIT, RELATED_ARTICLES_LIMIT
+from .trending import MAX_TRENDING_ARTICLES_LIMIT, TRENDING_ARTICLES_LIMIT
+
+BULK_CREATE_LIMIT = 100
 
 
 class AuthorSerializer(serializers.ModelSerializer):
@@ -37,12 +48,74 @@ class NewArticleSerializer(TaggitSerializer, serializers.ModelSerializer):
         ] + BaseSerializer.Meta.fields
 
     def create(self, validated_data):
-        validated_data["slug"] = generate_slug(validated_data["title"])
         validated_data["author"] = self.context["request"].user
-        return super().create(validated_data)
+        create = super().create
+
+        article = create_with_unique_slug(
+            validated_data["title"],
+            lambda slug: create({**validated_data, "slug": slug}),
+        )
+        enqueue_on_commit(fan_out_articles, article.author_id, [article.pkid])
+
+        return article
+
+
+class BulkArticlesSerializer(serializers.Serializer):
+    """Bulk new articles serializer"""
+
+    articles = serializers.ListField(
+        child=serializers.DictField(),
+        allow_empty=False,
+        max_length=BULK_CREATE_LIMIT,
+    )
+
+
+class FeedQuerySerializer(serializers.Serializer):
+    """Feed query parameters serializer"""
+
+    before = serializers.IntegerField(required=False, min_value=1)
+
 
+class RelatedArticlesQuerySerializer(serializers.Serializer):
+    """Related articles query parameters serializer"""
 
-class ArticleDisplaySerializer(TaggitSerializer, serializers.ModelSerializer):
+    limit = serializers.IntegerField(
+        required=False,
+        min_value=1,
+        max_value=MAX_RELATED_ARTICLES_LIMIT,
+        default=RELATED_ARTICLES_LIMIT,
+    )
+
+
+class TrendingArticlesQuerySerializer(serializers.Serializer):
+    """Trending articles query parameters serializer"""
+
+    limit = serializers.IntegerField(
+        required=False,
+        min_value=1,
+        max_value=MAX_TRENDING_ARTICLES_LIMIT,
+        default=TRENDING_ARTICLES_LIMIT,
+    )
+
+
+class AutocompleteQuerySerializer(serializers.Serializer):
+    """Autocomplete query parameters serializer"""
+
+    q = serializers.CharField(max_length=100)
+    limit = serializers.IntegerField(
+        required=False,
+        min_value=1,
+        max_value=MAX_AUTOCOMPLETE_LIMIT,
+        default=AUTOCOMPLETE_LIMIT,
+    )
+
+
+class ArticleDisplaySerializer(
+    CompiledRepresentationMixin,
+    SparseFieldsetMixin,
+    TaggitSerializer,
+    serializers.ModelSerializer,
+):
     tags = TagListSerializerField(read_only=True)
     author = AuthorSerializer(read_only=True)
 
@@ -55,3 +128,44 @@ class ArticleDisplaySerializer(TaggitSerializer, serializers.ModelSerializer):
             "tags",
             "author",
         ] + BaseSerializer.Meta.fields
+
+
+class ArticleListSerializer(
+    CompiledRepresentationMixin,
+    SparseFieldsetMixin,
+    TaggitSerializer,
+    serializers.ModelSerializer,
+):
+    """Article list serializer, without the body"""
+
+    tags = TagListSerializerField(read_only=True)
+    author = AuthorSerializer(read_only=True)
+
+    class Meta:
+        model = Article
+        fields = [
+            "title",
+            "slug",
+            "excerpt",
+            "word_count",
+            "reading_time",
+            "tags",
+            "author",
+        ] + BaseSerializer.Meta.fields
+
+
+class ArticleSearchResultSerializer(ArticleListSerializer):
+    """Article search result serializer"""
+
+    rank = serializers.SerializerMethodField()
+    headline = serializers.SerializerMethodField()
+
+    class Meta(ArticleListSerializer.Meta):
+        fields = ArticleListSerializer.Meta.fields + ["rank", "headline"]
+        field_sources = {"rank": [], "headline": []}
+
+    def get_rank(self, article):
+        return getattr(article, "search_rank", None)
+
+    def get_headline(self, article):
+        return getattr(article, "search_headline", None)
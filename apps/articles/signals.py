@@ -0,0 +1,92 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from taggit.models import TaggedItem
+
+from ..common.jobs import enqueue_on_commit
+from ..profiles.models import Profile
+from ..users.models import Follow, User
+from .cache import invalidate_articles, invalidate_author_articles
+from .feed import add_author_to_feed, remove_author_from_feed
+from .models import Article
+from .related import index_related_articles
+from .search import update_author_search_vectors, update_search_vector
+from .tags import tags_changed, update_tagged_article
+from .trending import remove_trending_article
+
+AUTHOR_FIELDS = {"first_name", "middle_name", "last_name"}
+
+
+def author_fields_changed(created, update_fields):
+    return not created and (not update_fields or AUTHOR_FIELDS & set(update_fields))
+
+
+@receiver(post_save, sender=Article)
+def update_article_search_vector(sender, instance, **kwargs):
+    update_search_vector(instance)
+
+
+@receiver(m2m_changed, sender=TaggedItem)
+def update_tagged_article_fields(sender, instance, action, pk_set, **kwargs):
+    if isinstance(instance, Article) and tags_changed(instance, action, pk_set):
+        update_tagged_article(instance)
+
+
+@receiver(post_save, sender=User)
+def update_author_articles_search_vector(sender, instance, created, **kwargs):
+    if author_fields_changed(created, kwargs.get("update_fields")):
+        update_author_search_vectors(instance)
+
+
+@receiver(post_save, sender=Article)
+@receiver(post_delete, sender=Article)
+def invalidate_article_cache(sender, instance, **kwargs):
+    invalidate_articles([instance.slug])
+
+
+@receiver(m2m_changed, sender=TaggedItem)
+def invalidate_tagged_article_cache(sender, instance, action, pk_set, **kwargs):
+    if isinstance(instance, Article) and tags_changed(instance, action, pk_set):
+        invalidate_articles([instance.slug])
+
+
+@receiver(post_save, sender=User)
+def invalidate_author_articles_cache(sender, instance, created, **kwargs):
+    if author_fields_changed(created, kwargs.get("update_fields")):
+        invalidate_author_articles(instance.pkid)
+
+
+@receiver(post_save, sender=Profile)
+def invalidate_profile_articles_cache(sender, instance, created, **kwargs):
+    if not created:
+        invalidate_author_articles(instance.user_id)
+
+
+@receiver(post_save, sender=Follow)
+def add_followed_author_to_feed(sender, instance, created, **kwargs):
+    if created:
+        enqueue_on_commit(
+            add_author_to_feed, instance.follower_id, instance.followed_id
+        )
+
+
+@receiver(post_delete, sender=Follow)
+def remove_unfollowed_author_from_feed(sender, instance, **kwargs):
+    enqueue_on_commit(
+        remove_author_from_feed, instance.follower_id, instance.followed_id
+    )
+
+
+@receiver(m2m_changed, sender=TaggedItem)
+def index_tagged_related_articles(sender, instance, action, pk_set, **kwargs):
+    if isinstance(instance, Article) and tags_changed(instance, action, pk_set):
+        enqueue_on_commit(index_related_articles, [instance.pkid])
+
+
+@receiver(post_delete, sender=Article)
+def unindex_related_articles(sender, instance, **kwargs):
+    enqueue_on_commit(index_related_articles, [instance.pkid])
+
+
+@receiver(post_delete, sender=Article)
+def remove_deleted_trending_article(sender, instance, **kwargs):
+    remove_trending_article(instance.pkid)
@@ -0,0 +1,106 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+from taggit.models import TaggedItem
+
+from .models import Article
+from .search import get_search_vector_values
+
+TAG_MATCHES = ["any", "all"]
+
+
+def tag_array_enabled():
+    """Whether Article.tag_names is a GIN indexed jsonb column"""
+
+    return connection.vendor == "postgresql"
+
+
+def get_tag_names(article):
+    names = TaggedItem.objects.filter(
+        content_type=ContentType.objects.get_for_model(Article),
+        object_id=article.pkid,
+    ).values_list("tag__name", flat=True)
+
+    return sorted(names)
+
+
+def tags_changed(article, action, pk_set):
+    """
+    Whether an m2m_changed signal of the article tags ends a change. The
+    removal or clear set() starts with is skipped, as it always ends with
+    an add.
+    """
+
+    if action == "post_add":
+        return bool(pk_set) or article.setting_tags
+
+    return action in ("post_remove", "post_clear") and not article.setting_tags
+
+
+def update_tagged_article(article):
+    """
+    Write the tag names, the search vector and updated_at of an article
+    whose tags changed, with a single UPDATE.
+    """
+
+    article.tag_names = get_tag_names(article)
+    article.updated_at = timezone.now()
+    Article.objects.filter(pkid=article.pkid).update(
+        tag_names=article.tag_names,
+        updated_at=article.updated_at,
+        **get_search_vector_values(article),
+    )
+    article.remember_saved_values(["tag_names", "updated_at"])
+
+
+def get_tagged_with(names):
+    return Exists(
+        TaggedItem.objects.filter(
+            content_type=ContentType.objects.get_for_model(Article),
+            object_id=OuterRef("pkid"),
+            tag__name__in=names,
+        )
+    )
+
+
+class ArticleTagFilter(BaseFilterBackend):
+    """
+    Filter articles by ?tags=a,b, matching any of the tags or all of them
+    with ?tags_match=all.
+
+    PostgreSQL reads the GIN indexed tag_names array instead of joining
+    through taggit's tables, other databases use EXISTS subqueries.
+    """
+
+    tags_param = "tags"
+    match_param = "tags_match"
+
+    def get_tag_names(self, request):
+        tags = request.query_params.get(self.tags_param, "")
+        return sorted({name.strip() for name in tags.split(",") if name.strip()})
+
+    def filter_queryset(self, request, queryset, view):
+        names = self.get_tag_names(request)
+        match = request.query_params.get(self.match_param, "any")
+
+        if match not in TAG_MATCHES:
+            raise ValidationError(
+                {self.match_param: [f"Must be one of {', '.join(TAG_MATCHES)}"]}
+            )
+
+        if not names:
+            return queryset
+
+        if tag_array_enabled():
+            if match == "all":
+                return queryset.filter(tag_names__contains=names)
+
+            return queryset.filter(tag_names__has_any_keys=names)
+
+        if match == "all":
+            return queryset.filter(*[get_tagged_with([name]) for name in names])
+
+        return queryset.filter(get_tagged_with(names))
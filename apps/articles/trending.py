@@ -0,0 +1,110 @@
+from datetime import timedelta
+
+from django.db.models import Max
+from django.utils import timezone
+
+from ..common.store import get_store
+from .models import Article
+
+# Sorted set of article pkids by forward decayed score: every event adds
+# its weight times 2 ** (age of the epoch / half life), so older events
+# weigh less without the existing scores being touched
+TRENDING_KEY = "article:trending"
+# Hash holding the epoch timestamp and the last pkid added to the ranking
+TRENDING_STATE_KEY = "article:trending:state"
+TRENDING_HALF_LIFE = timedelta(hours=12)
+# Scores are scaled back and the epoch moved before they grow too large
+TRENDING_RESCALE_AFTER = 64 * TRENDING_HALF_LIFE
+# Only articles published this recently enter the ranking when it's empty
+TRENDING_WINDOW = timedelta(days=7)
+TRENDING_LENGTH = 1000
+TRENDING_ARTICLES_LIMIT = 10
+MAX_TRENDING_ARTICLES_LIMIT = 50
+VIEW_WEIGHT = 1
+PUBLISH_WEIGHT = 20
+
+
+def get_decayed_weight(weight, moment, epoch):
+    age = (moment.timestamp() - epoch) / TRENDING_HALF_LIFE.total_seconds()
+
+    return weight * 2**age
+
+
+def rescale_trending_scores(store, epoch, new_epoch):
+    factor = get_decayed_weight(1, new_epoch, epoch)
+    scores = store.zrevrange(TRENDING_KEY, 0, -1, withscores=True)
+
+    if scores:
+        store.zadd(TRENDING_KEY, {pkid: score / factor for pkid, score in scores})
+
+
+def get_published_articles(state, now):
+    """
+    The pkids and publication times of the articles published since the
+    last update, found from the last pkid seen.
+    """
+
+    if "last_pkid" in state:
+        articles = Article.objects.filter(pkid__gt=int(state["last_pkid"]))
+    else:
+        articles = Article.objects.filter(created_at__gte=now - TRENDING_WINDOW)
+
+    return list(articles.order_by("pkid").values_list("pkid", "created_at"))
+
+
+def update_trending_articles(views):
+    """
+    Add the newly published articles and the flushed views to the trending
+    ranking. Only run from the periodic flush job, so there's one writer.
+    """
+
+    store = get_store()
+    now = timezone.now()
+    state = store.hgetall(TRENDING_STATE_KEY)
+    epoch = float(state.get("epoch", now.timestamp()))
+
+    if now.timestamp() - epoch > TRENDING_RESCALE_AFTER.total_seconds():
+        rescale_trending_scores(store, epoch, now)
+        epoch = now.timestamp()
+
+    published = get_published_articles(state, now)
+
+    if published:
+        last_pkid = published[-1][0]
+    elif "last_pkid" in state:
+        last_pkid = int(state["last_pkid"])
+    else:
+        last_pkid = Article.objects.aggregate(pkid=Max("pkid"))["pkid"] or 0
+
+    increments = {
+        pkid: get_decayed_weight(PUBLISH_WEIGHT, created_at, epoch)
+        for pkid, created_at in published
+    }
+
+    for pkid, count in views.items():
+        increments[pkid] = increments.get(pkid, 0) + get_decayed_weight(
+            count * VIEW_WEIGHT, now, epoch
+        )
+
+    with store.pipeline() as pipeline:
+        for pkid, increment in increments.items():
+            pipeline.zincrby(TRENDING_KEY, increment, pkid)
+
+        pipeline.zremrangebyrank(TRENDING_KEY, 0, -TRENDING_LENGTH - 1)
+        pipeline.hset(
+            TRENDING_STATE_KEY,
+            mapping={"epoch": epoch, "last_pkid": last_pkid},
+        )
+        pipeline.execute()
+
+
+def remove_trending_article(pkid):
+    get_store().zrem(TRENDING_KEY, pkid)
+
+
+def get_trending_pkids(limit=TRENDING_ARTICLES_LIMIT):
+    """The pkids of the articles with the highest trending scores"""
+
+    trending = get_store().zrevrange(TRENDING_KEY, 0, limit - 1)
+
+    return [int(member) for member in trending]
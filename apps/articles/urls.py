@@ -1,8 +1,27 @@
 from django.urls import path
 
-from .views import ArticlesView, ArticleView
+from .views import (
+    ArticlesView,
+    ArticleView,
+    ArticleViewCountView,
+    AutocompleteView,
+    BulkArticlesView,
+    FeedView,
+    RelatedArticlesView,
+    TrendingArticlesView,
+)
 
 urlpatterns = [
     path("", ArticlesView.as_view(), name="all-articles"),
+    path("bulk/", BulkArticlesView.as_view(), name="bulk-articles"),
+    path("autocomplete/", AutocompleteView.as_view(), name="autocomplete"),
+    path("feed/", FeedView.as_view(), name="articles-feed"),
+    path("trending/", TrendingArticlesView.as_view(), name="trending-articles"),
     path("<slug:slug>/", ArticleView.as_view(), name="single-article"),
+    path("<slug:slug>/views/", ArticleViewCountView.as_view(), name="article-views"),
+    path(
+        "<slug:slug>/related/",
+        RelatedArticlesView.as_view(),
+        name="related-articles",
+    ),
 ]
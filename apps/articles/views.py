@@ -1,9 +1,38 @@
-from rest_framework import generics, mixins
+from rest_framework import generics, mixins, status
+from rest_framework.filters import OrderingFilter
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 
-from .helpers.utils import filter_queryset
+from ..common.pagination import KeysetPagination
+from ..common.utils import conditional_get
+from .autocomplete import autocomplete
+from .cache import cache_article, get_cached_article, invalidate_articles
+from .counters import get_article_view_count, record_article_view
+from .feed import get_feed_page
+from .helpers.bulk import bulk_create_articles
+from .helpers.utils import (
+    filter_queryset,
+    get_article_versions,
+    get_display_queryset,
+    get_in_order,
+)
 from .models import Article
-from .serializers import ArticleDisplaySerializer, NewArticleSerializer
+from .related import RELATED_INDEX_SIZE, get_related_pkids
+from .search import ArticleSearchFilter
+from .serializers import (
+    ArticleDisplaySerializer,
+    ArticleListSerializer,
+    ArticleSearchResultSerializer,
+    AutocompleteQuerySerializer,
+    BulkArticlesSerializer,
+    FeedQuerySerializer,
+    NewArticleSerializer,
+    RelatedArticlesQuerySerializer,
+    TrendingArticlesQuerySerializer,
+)
+from .tags import ArticleTagFilter
+from .trending import get_trending_pkids
 
 
 class ArticlesView(
@@ -14,6 +43,8 @@ class ArticlesView(
     serializer_class = NewArticleSerializer
     permission_classes = [IsAuthenticated]
     ordering = ["-pkid"]
+    # Ordering runs first so that search results are ranked ahead of it
+    filter_backends = [OrderingFilter, ArticleTagFilter, ArticleSearchFilter]
     search_fields = [
         "title",
         "body",
@@ -24,16 +55,153 @@ class ArticlesView(
     ]
 
     def get_queryset(self):
-        return filter_queryset(Article.objects.all(), self.request.user)
+        queryset = get_display_queryset().defer("body")
+        queryset = ArticleListSerializer.narrow_queryset(queryset, self.request)
+        return filter_queryset(queryset, self.request.user)
 
     def post(self, request, *args, **kwargs):
         return self.create(request, *args, **kwargs)
 
     def get(self, request, *args, **kwargs):
-        self.serializer_class = ArticleDisplaySerializer
+        if request.query_params.get(ArticleSearchFilter.search_param):
+            self.serializer_class = ArticleSearchResultSerializer
+        else:
+            self.serializer_class = ArticleListSerializer
+
         return self.list(request, *args, **kwargs)
 
 
+class BulkArticlesView(generics.GenericAPIView):
+    """Bulk create articles view"""
+
+    serializer_class = BulkArticlesSerializer
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        serializer = self.serializer_class(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        results = []
+        valid_items = []
+
+        for index, item in enumerate(serializer.validated_data["articles"]):
+            article_serializer = NewArticleSerializer(
+                data=item, context=self.get_serializer_context()
+            )
+
+            if article_serializer.is_valid():
+                valid_items.append((index, article_serializer.validated_data))
+            else:
+                results.append(
+                    {
+                        "index": index,
+                        "status": status.HTTP_400_BAD_REQUEST,
+                        "errors": article_serializer.errors,
+                    }
+                )
+
+        articles = bulk_create_articles(request.user, [item for _, item in valid_items])
+
+        for (index, _), article in zip(valid_items, articles):
+            results.append(
+                {
+                    "index": index,
+                    "status": status.HTTP_201_CREATED,
+                    "id": article.id,
+                    "slug": article.slug,
+                }
+            )
+
+        if not articles:
+            response_status = status.HTTP_400_BAD_REQUEST
+        elif len(articles) < len(results):
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_201_CREATED
+
+        return Response(
+            {"results": sorted(results, key=lambda result: result["index"])},
+            status=response_status,
+        )
+
+
+class FeedView(generics.GenericAPIView):
+    """Articles of the followed authors view"""
+
+    serializer_class = ArticleListSerializer
+    permission_classes = [IsAuthenticated]
+    # Only used for its page size rules, pages are read from the timelines
+    pagination_class = KeysetPagination
+
+    def get_queryset(self):
+        queryset = get_display_queryset().defer("body")
+        queryset = ArticleListSerializer.narrow_queryset(queryset, self.request)
+        return filter_queryset(queryset, self.request.user)
+
+    def get(self, request):
+        query = FeedQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+
+        pkids, has_next = get_feed_page(
+            request.user,
+            self.paginator.get_page_size(request),
+            query.validated_data.get("before"),
+        )
+        articles = get_in_order(self.get_queryset(), pkids)
+        next_link = None
+
+        if has_next:
+            next_link = replace_query_param(
+                request.build_absolute_uri(), "before", pkids[-1]
+            )
+
+        return Response(
+            {
+                "next": next_link,
+                "results": self.get_serializer(articles, many=True).data,
+            }
+        )
+
+
+class TrendingArticlesView(generics.GenericAPIView):
+    """Articles with the highest trending scores view"""
+
+    serializer_class = ArticleListSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        queryset = get_display_queryset().defer("body")
+        queryset = ArticleListSerializer.narrow_queryset(queryset, self.request)
+        return filter_queryset(queryset, self.request.user)
+
+    def get(self, request):
+        query = TrendingArticlesQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+
+        pkids = get_trending_pkids(query.validated_data["limit"])
+        articles = get_in_order(self.get_queryset(), pkids)
+
+        return Response({"results": self.get_serializer(articles, many=True).data})
+
+
+class AutocompleteView(generics.GenericAPIView):
+    """Article title, tag and username suggestions view"""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        query = AutocompleteQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+
+        return Response(
+            autocomplete(
+                query.validated_data["q"],
+                query.validated_data["limit"],
+                request.user,
+            )
+        )
+
+
 class ArticleView(
     mixins.RetrieveModelMixin, mixins.UpdateModelMixin, generics.GenericAPIView
 ):
@@ -44,10 +212,90 @@ class ArticleView(
     lookup_field = "slug"
 
     def get_queryset(self):
-        return filter_queryset(Article.objects.all(), self.request.user)
+        queryset = ArticleDisplaySerializer.narrow_queryset(
+            get_display_queryset(), self.request
+        )
+        return filter_queryset(queryset, self.request.user)
+
+    def retrieve(self, request, *args, **kwargs):
+        host = request.get_host()
+        author, pkid, data = get_cached_article(kwargs[self.lookup_field], host)
+
+        if data is not None and (request.user.is_admin or author == request.user.pk):
+            record_article_view(pkid)
+            return Response(ArticleDisplaySerializer.filter_data(data, request))
+
+        instance = self.get_object()
+        record_article_view(instance.pkid)
+        data = self.get_serializer(instance).data
+
+        # Only full payloads are cached, sparse ones are cut from them
+        if ArticleDisplaySerializer.get_sparse_field_names(request) is None:
+            cache_article(instance, host, data)
 
+        return Response(data)
+
+    def perform_update(self, serializer):
+        old_slug = serializer.instance.slug
+        super().perform_update(serializer)
+
+        if serializer.instance.slug != old_slug:
+            invalidate_articles([old_slug])
+
+        cache_article(
+            serializer.instance,
+            self.request.get_host(),
+            serializer.data,
+            replace=True,
+        )
+
+    @conditional_get(get_article_versions)
     def get(self, request, *args, **kwargs):
         return self.retrieve(request, *args, **kwargs)
 
     def patch(self, request, *args, **kwargs):
         return self.partial_update(request, *args, **kwargs)
+
+
+class ArticleViewCountView(generics.GenericAPIView):
+    """Article view count view"""
+
+    permission_classes = [IsAuthenticated]
+    lookup_field = "slug"
+
+    def get_queryset(self):
+        return filter_queryset(
+            Article.objects.only("pkid", "view_count"), self.request.user
+        )
+
+    def get(self, request, *args, **kwargs):
+        return Response({"views": get_article_view_count(self.get_object())})
+
+
+class RelatedArticlesView(generics.GenericAPIView):
+    """Articles sharing the most tags with an article view"""
+
+    serializer_class = ArticleListSerializer
+    permission_classes = [IsAuthenticated]
+    lookup_field = "slug"
+
+    def get_queryset(self):
+        return filter_queryset(Article.objects.only("pkid"), self.request.user)
+
+    def get(self, request, *args, **kwargs):
+        query = RelatedArticlesQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+
+        # The whole index of the article is read, as the user may only see
+        # some of its related articles
+        pkids = get_related_pkids(self.get_object().pkid, RELATED_INDEX_SIZE)
+        visible = set(
+            self.get_queryset().filter(pkid__in=pkids).values_list("pkid", flat=True)
+        )
+        pkids = [pkid for pkid in pkids if pkid in visible]
+        queryset = ArticleListSerializer.narrow_queryset(
+            get_display_queryset().defer("body"), request
+        )
+        articles = get_in_order(queryset, pkids[: query.validated_data["limit"]])
+
+        return Response({"results": self.get_serializer(articles, many=True).data})
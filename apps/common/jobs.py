@@ -0,0 +1,58 @@
+from datetime import timedelta
+
+import django_rq
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+from rq.job import Job
+
+
+def enqueue_on_commit(func, *args):
+    """Enqueue an RQ job once the current transaction is committed"""
+
+    transaction.on_commit(lambda: django_rq.enqueue(func, *args))
+
+
+def schedule_periodic_job(path):
+    """Run the function at path on the RQ scheduler after its interval"""
+
+    interval = settings.RQ_PERIODIC_JOBS[path]
+    django_rq.get_queue().enqueue_in(
+        timedelta(seconds=interval), run_periodic_job, path
+    )
+
+
+def run_periodic_job(path):
+    """Run the function at path and schedule its next run"""
+
+    try:
+        import_string(path)()
+    finally:
+        schedule_periodic_job(path)
+
+
+def get_pending_periodic_jobs():
+    """The paths of the periodic jobs already scheduled or queued"""
+
+    queue = django_rq.get_queue()
+    job_ids = queue.scheduled_job_registry.get_job_ids() + queue.job_ids
+    jobs = Job.fetch_many(job_ids, connection=queue.connection)
+    func_name = f"{run_periodic_job.__module__}.{run_periodic_job.__name__}"
+
+    return {
+        job.args[0] for job in jobs if job is not None and job.func_name == func_name
+    }
+
+
+def schedule_periodic_jobs():
+    """Start the settings.RQ_PERIODIC_JOBS that aren't running yet"""
+
+    pending = get_pending_periodic_jobs()
+    scheduled = []
+
+    for path in settings.RQ_PERIODIC_JOBS:
+        if path not in pending:
+            schedule_periodic_job(path)
+            scheduled.append(path)
+
+    return scheduled
@@ -0,0 +1,238 @@
+import json
+import logging
+import smtplib
+import time
+import uuid
+
+import django_rq
+from django.core.mail import EmailMessage, get_connection
+
+from .store import get_store
+
+logger = logging.getLogger(__name__)
+
+# List of the JSON encoded emails waiting to be delivered
+MAIL_OUTBOX_KEY = "mail:outbox"
+# List of the emails taken by the delivery job and not done with yet
+MAIL_PROCESSING_KEY = "mail:processing"
+# Sorted set of the emails to deliver again, scored by when they are due
+MAIL_RETRY_KEY = "mail:retry"
+# List of the emails that can't be delivered, with the last error
+MAIL_DEAD_KEY = "mail:dead"
+# Hash of the delivery totals across batches
+MAIL_METRICS_KEY = "mail:metrics"
+# Set while a delivery job is queued or draining the outbox, so that only
+# one job delivers at a time. It outlives the RQ job timeout.
+MAIL_DRAINING_KEY = "mail:draining"
+MAIL_DRAINING_TIMEOUT = 600
+MAIL_BATCH_SIZE = 100
+# Batches a job delivers before handing the rest over to a new job
+MAIL_BATCHES_PER_JOB = 10
+MAIL_MAX_ATTEMPTS = 5
+MAIL_RETRY_DELAY = 60
+
+
+def send_email(subject, message, to):
+    """
+    Queue an HTML email and start a delivery job unless one is already
+    draining the outbox.
+    """
+
+    email = {
+        "id": uuid.uuid4().hex,
+        "subject": subject,
+        "body": message,
+        "to": list(to),
+        "attempts": 0,
+    }
+    store = get_store()
+    store.rpush(MAIL_OUTBOX_KEY, json.dumps(email))
+
+    if store.set(MAIL_DRAINING_KEY, 1, ex=MAIL_DRAINING_TIMEOUT, nx=True):
+        django_rq.enqueue(deliver_queued_emails)
+
+
+def build_message(email, connection):
+    message = EmailMessage(
+        email["subject"], email["body"], to=email["to"], connection=connection
+    )
+    message.content_subtype = "html"
+
+    return message
+
+
+def is_permanent_failure(error):
+    """Whether the server rejected the email for good, with a 5xx reply"""
+
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        codes = [code for code, _ in error.recipients.values()]
+
+        return bool(codes) and all(code >= 500 for code in codes)
+
+    if isinstance(error, smtplib.SMTPResponseException):
+        return error.smtp_code >= 500
+
+    return False
+
+
+def fail_email(email, error):
+    """
+    Schedule a failed email for a retry with exponential backoff, or move it
+    to the dead letters when it can't be delivered. Return the outcome.
+    """
+
+    store = get_store()
+    email = {**email, "attempts": email["attempts"] + 1}
+
+    if is_permanent_failure(error) or email["attempts"] >= MAIL_MAX_ATTEMPTS:
+        store.rpush(MAIL_DEAD_KEY, json.dumps({**email, "error": repr(error)}))
+        logger.warning(f"Email {email['id']} to {email['to']} failed: {error!r}")
+
+        return "dead"
+
+    delay = MAIL_RETRY_DELAY * 2 ** (email["attempts"] - 1)
+    store.zadd(MAIL_RETRY_KEY, {json.dumps(email): time.time() + delay})
+
+    return "retried"
+
+
+def requeue_due_emails():
+    """Move the retries that are due back to the outbox"""
+
+    store = get_store()
+
+    for email in store.zrangebyscore(MAIL_RETRY_KEY, "-inf", time.time()):
+        # Only the job removing the retry requeues it
+        if store.zrem(MAIL_RETRY_KEY, email):
+            store.rpush(MAIL_OUTBOX_KEY, email)
+
+
+def record_batch(metrics):
+    logger.info(
+        "Delivered a batch of emails in %(duration).3fs: %(sent)s sent, "
+        "%(retried)s retried, %(dead)s dead",
+        metrics,
+    )
+
+    with get_store().pipeline() as pipeline:
+        pipeline.hincrby(MAIL_METRICS_KEY, "batches", 1)
+
+        for name in ["sent", "retried", "dead"]:
+            pipeline.hincrby(MAIL_METRICS_KEY, name, metrics[name])
+
+        pipeline.hincrby(
+            MAIL_METRICS_KEY, "duration_ms", round(metrics["duration"] * 1000)
+        )
+        pipeline.execute()
+
+
+def take_batch():
+    """Move a batch of emails from the outbox to the processing list"""
+
+    with get_store().pipeline() as pipeline:
+        for _ in range(MAIL_BATCH_SIZE):
+            pipeline.lmove(MAIL_OUTBOX_KEY, MAIL_PROCESSING_KEY, "LEFT", "RIGHT")
+
+        return [email for email in pipeline.execute() if email is not None]
+
+
+def recover_processing_emails():
+    """
+    Put the emails a killed job was processing back at the front of the
+    outbox. They may have been sent already, delivery is at least once.
+    """
+
+    store = get_store()
+
+    while store.lmove(MAIL_PROCESSING_KEY, MAIL_OUTBOX_KEY, "RIGHT", "LEFT"):
+        pass
+
+
+def deliver_batch(connection, emails):
+    """
+    Send the emails one at a time over the open connection, removing each
+    one from the processing list once it is sent, retried or dead. The
+    connection is opened again after a failure as it can be left in the
+    middle of a transaction; when that fails too, the rest of the batch is
+    retried later.
+    """
+
+    store = get_store()
+    metrics = {"sent": 0, "retried": 0, "dead": 0}
+    started = time.monotonic()
+    pending = list(emails)
+
+    try:
+        while pending:
+            raw_email = pending.pop(0)
+            email = json.loads(raw_email)
+
+            try:
+                connection.send_messages([build_message(email, connection)])
+            except Exception as error:
+                metrics[fail_email(email, error)] += 1
+                store.lrem(MAIL_PROCESSING_KEY, 1, raw_email)
+                connection.close()
+                connection.open()
+            else:
+                metrics["sent"] += 1
+                store.lrem(MAIL_PROCESSING_KEY, 1, raw_email)
+    except Exception as error:
+        for raw_email in pending:
+            metrics[fail_email(json.loads(raw_email), error)] += 1
+            store.lrem(MAIL_PROCESSING_KEY, 1, raw_email)
+
+        raise
+    finally:
+        metrics["duration"] = time.monotonic() - started
+        record_batch(metrics)
+
+    return metrics
+
+
+def deliver_queued_emails():
+    """
+    Drain the outbox in batches over a single connection to the email
+    server, and return the metrics of each batch. Run by the job that set
+    MAIL_DRAINING_KEY; the emails left after MAIL_BATCHES_PER_JOB batches
+    go to a new job so that a backlog doesn't run into the job timeout.
+    """
+
+    store = get_store()
+    batches = []
+
+    try:
+        recover_processing_emails()
+        requeue_due_emails()
+
+        with get_connection() as connection:
+            while len(batches) < MAIL_BATCHES_PER_JOB:
+                emails = take_batch()
+
+                if not emails:
+                    break
+
+                batches.append(deliver_batch(connection, emails))
+    finally:
+        store.delete(MAIL_DRAINING_KEY)
+
+    # Also picks up the emails queued while the flag was being cleared,
+    # which would wait for the periodic run otherwise
+    if store.llen(MAIL_OUTBOX_KEY) and store.set(
+        MAIL_DRAINING_KEY, 1, ex=MAIL_DRAINING_TIMEOUT, nx=True
+    ):
+        django_rq.enqueue(deliver_queued_emails)
+
+    return batches
+
+
+def resume_email_delivery():
+    """
+    Periodic run delivering the due retries and what a killed job left,
+    unless a delivery job is already queued or running.
+    """
+
+    if get_store().set(MAIL_DRAINING_KEY, 1, ex=MAIL_DRAINING_TIMEOUT, nx=True):
+        return deliver_queued_emails()
+
+    return []
@@ -0,0 +1,55 @@
+import timeit
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.articles.helpers.utils import get_display_queryset
+from apps.articles.serializers import ArticleDisplaySerializer, ArticleListSerializer
+from apps.common.renderers import ORJSONRenderer
+
+from .benchmark_serializers import create_rows
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the per row cost of the orjson renderer with DRF's "
+        "JSONRenderer. The benchmark rows are rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=500)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def time(self, function, repeat):
+        return min(timeit.repeat(function, number=1, repeat=repeat))
+
+    def report(self, name, rows, reference, orjson):
+        self.stdout.write(
+            f"{name:<26}"
+            f" drf {reference / rows * 1e6:8.1f} us/row"
+            f" orjson {orjson / rows * 1e6:8.1f} us/row"
+            f" ({reference / orjson:.1f}x)"
+        )
+
+    def handle(self, *args, **options):
+        rows = options["rows"]
+        repeat = options["repeat"]
+        context = {"request": Request(APIRequestFactory().get("/"))}
+
+        with transaction.atomic():
+            _, article_pkids = create_rows(rows)
+            articles = list(get_display_queryset().filter(pkid__in=article_pkids))
+            transaction.set_rollback(True)
+
+        for serializer_class in [ArticleDisplaySerializer, ArticleListSerializer]:
+            data = serializer_class(articles, many=True, context=context).data
+
+            self.report(
+                f"render {serializer_class.__name__}",
+                rows,
+                self.time(lambda: JSONRenderer().render(data), repeat),
+                self.time(lambda: ORJSONRenderer().render(data), repeat),
+            )
@@ -0,0 +1,113 @@
+import timeit
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import override_settings
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.articles.helpers.bulk import bulk_create_articles
+from apps.articles.helpers.utils import get_display_queryset
+from apps.articles.serializers import (
+    BULK_CREATE_LIMIT,
+    ArticleDisplaySerializer,
+    ArticleListSerializer,
+)
+from apps.profiles.models import Profile
+from apps.users.models import User
+from apps.users.serializers.user import UserDisplaySerializer
+
+
+def create_rows(rows):
+    prefix = uuid.uuid4().hex[:8]
+    users = User.objects.bulk_create(
+        [
+            User(
+                username=f"{prefix}-{index}",
+                email=f"{prefix}-{index}@example.com",
+                first_name="Benchmark",
+                last_name="User",
+                middle_name="Middle",
+            )
+            for index in range(rows)
+        ]
+    )
+    Profile.objects.bulk_create(
+        [
+            Profile(
+                user=user,
+                phone_number="+250780000000",
+                about_me="About me",
+                avatar=f"profiles/{user.username}/avatar.png",
+                gender="Other",
+                country="RW",
+                city="Kigali",
+            )
+            for user in users
+        ]
+    )
+    items = [
+        {
+            "title": f"{prefix} article {index}",
+            "body": "Lorem ipsum dolor sit amet. " * 50,
+            "tags": ["python", "django", f"tag{index % 10}"],
+        }
+        for index in range(rows)
+    ]
+    articles = []
+
+    for start in range(0, rows, BULK_CREATE_LIMIT):
+        end = start + BULK_CREATE_LIMIT
+        articles += bulk_create_articles(users[0], items[start:end])
+
+    return [user.pkid for user in users], [article.pkid for article in articles]
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the per row cost of the compiled read serializers with DRF's "
+        "own to_representation. The benchmark rows are rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=500)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        rows = options["rows"]
+        request = Request(APIRequestFactory().get("/"))
+
+        with transaction.atomic():
+            user_pkids, article_pkids = create_rows(rows)
+            users = list(
+                User.objects.select_related("profile").filter(pkid__in=user_pkids)
+            )
+            articles = list(get_display_queryset().filter(pkid__in=article_pkids))
+            transaction.set_rollback(True)
+
+        for serializer_class, instances in [
+            (ArticleDisplaySerializer, articles),
+            (ArticleListSerializer, articles),
+            (UserDisplaySerializer, users),
+        ]:
+            timings = {}
+
+            for compiled in [False, True]:
+                with override_settings(COMPILED_SERIALIZERS=compiled):
+                    timings[compiled] = min(
+                        timeit.repeat(
+                            lambda: serializer_class(
+                                instances, many=True, context={"request": request}
+                            ).data,
+                            number=1,
+                            repeat=options["repeat"],
+                        )
+                    )
+
+            self.stdout.write(
+                f"{serializer_class.__name__:<26}"
+                f" drf {timings[False] / rows * 1e6:8.1f} us/row"
+                f" compiled {timings[True] / rows * 1e6:8.1f} us/row"
+                f" ({timings[False] / timings[True]:.1f}x)"
+            )
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from apps.common.jobs import schedule_periodic_jobs
+
+
+class Command(BaseCommand):
+    help = "Schedule the RQ_PERIODIC_JOBS that aren't scheduled yet"
+
+    def handle(self, *args, **options):
+        for path in schedule_periodic_jobs():
+            self.stdout.write(f"Scheduled {path}")
@@ -1,15 +1,111 @@
+import copy
 import uuid
 
 from django.db import models
+from django.db.models.fields.files import FieldFile
+
+
+def get_tracked_value(value):
+    """
+    A snapshot of a field value that later changes can be compared to. Only
+    the lists and dicts of the JSON fields can change in place and are
+    copied, the other values are kept as they are.
+    """
+
+    if isinstance(value, FieldFile):
+        return value.name
+
+    if isinstance(value, (list, dict)):
+        return copy.deepcopy(value)
+
+    return value
 
 
 class BaseModel(models.Model):
-    """Base Model class"""
+    """
+    Base Model class
+
+    It remembers the values it was loaded or saved with, so that saves only
+    write the fields changed since and are skipped when nothing changed.
+    Instances whose values weren't tracked, like the bulk created ones,
+    write all their loaded fields.
+    """
 
     pkid = models.BigAutoField(primary_key=True, editable=False)
     id = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    _saved_values = None
+
     class Meta:
         abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.remember_saved_values()
+
+        return instance
+
+    def get_loaded_values(self, fields=None):
+        """The values of the loaded fields, or of the given ones"""
+
+        if fields is not None:
+            fields = {self._meta.get_field(name).attname for name in fields}
+
+        return {
+            field.attname: get_tracked_value(self.__dict__[field.attname])
+            for field in self._meta.concrete_fields
+            if not field.primary_key
+            and field.attname in self.__dict__
+            and (fields is None or field.attname in fields)
+        }
+
+    def remember_saved_values(self, fields=None):
+        if fields is None:
+            self._saved_values = self.get_loaded_values()
+        else:
+            self._saved_values = {
+                **(self._saved_values or {}),
+                **self.get_loaded_values(fields),
+            }
+
+    def get_dirty_fields(self):
+        """
+        The loaded fields changed since the instance was loaded or saved, all
+        of them when its values weren't tracked.
+        """
+
+        saved = self._saved_values or {}
+
+        return [
+            attname
+            for attname, value in self.get_loaded_values().items()
+            if attname not in saved or saved[attname] != value
+        ]
+
+    def get_update_fields(self):
+        """
+        The fields a save writes: the changed ones along with updated_at, or
+        None when the instance is new.
+        """
+
+        if self._state.adding:
+            return None
+
+        dirty_fields = self.get_dirty_fields()
+
+        return {*dirty_fields, "updated_at"} if dirty_fields else set()
+
+    def save(self, *args, **kwargs):
+        # An empty update_fields makes Django skip the save and its signals
+        if kwargs.get("update_fields") is None and not kwargs.get("force_insert"):
+            kwargs["update_fields"] = self.get_update_fields()
+
+        super().save(*args, **kwargs)
+        self.remember_saved_values(kwargs.get("update_fields"))
+
+    def refresh_from_db(self, using=None, fields=None):
+        super().refresh_from_db(using=using, fields=fields)
+        self.remember_saved_values(fields)
@@ -0,0 +1,124 @@
+import json
+from collections import OrderedDict
+
+from django.db import connections
+from rest_framework.pagination import (
+    BasePagination,
+    CursorPagination,
+    LimitOffsetPagination,
+)
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+
+def estimate_count(queryset):
+    """
+    Return the planner's row estimate for a queryset on PostgreSQL and an
+    exact count elsewhere.
+    """
+
+    connection = connections[queryset.db]
+
+    if connection.vendor != "postgresql":
+        return queryset.count()
+
+    sql, params = queryset.order_by().query.sql_with_params()
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    return plan[0]["Plan"]["Plan Rows"]
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Cursor pagination keyed on the view ordering.
+
+    Pages are fetched with a WHERE on the ordering column instead of an
+    OFFSET and no COUNT(*) is run unless the client asks for an approximate
+    total with ?include_total=true.
+    """
+
+    ordering = "-pkid"
+    page_size = 20
+    page_size_query_param = "limit"
+    max_page_size = 100
+    total_query_param = "include_total"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.total = None
+
+        if request.query_params.get(self.total_query_param) in ("1", "true"):
+            self.total = estimate_count(queryset)
+
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        response_data = OrderedDict()
+
+        if self.total is not None:
+            response_data["count"] = self.total
+
+        response_data["next"] = self.get_next_link()
+        response_data["previous"] = self.get_previous_link()
+        response_data["results"] = data
+
+        return Response(response_data)
+
+
+class KeysetOrOffsetPagination(BasePagination):
+    """
+    Use keyset pagination when the request carries a cursor parameter (an
+    empty one asks for the first page) and limit/offset pagination otherwise.
+    Search results are always paginated by offset, as the cursor would order
+    them by its column instead of their search rank.
+    """
+
+    keyset_class = KeysetPagination
+    offset_class = LimitOffsetPagination
+
+    @property
+    def display_page_controls(self):
+        return getattr(self.paginator, "display_page_controls", False)
+
+    def get_paginator(self, request):
+        params = request.query_params
+
+        if self.keyset_class.cursor_query_param in params and not params.get(
+            api_settings.SEARCH_PARAM
+        ):
+            return self.keyset_class()
+
+        return self.offset_class()
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.paginator = self.get_paginator(request)
+        return self.paginator.paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        return self.paginator.get_paginated_response(data)
+
+    def to_html(self):
+        return self.paginator.to_html()
+
+    def get_schema_fields(self, view):
+        fields = OrderedDict()
+
+        for paginator_class in [self.offset_class, self.keyset_class]:
+            for field in paginator_class().get_schema_fields(view):
+                fields.setdefault(field.name, field)
+
+        return list(fields.values())
+
+    def get_schema_operation_parameters(self, view):
+        parameters = OrderedDict()
+
+        for paginator_class in [self.offset_class, self.keyset_class]:
+            for parameter in paginator_class().get_schema_operation_parameters(view):
+                parameters.setdefault(parameter["name"], parameter)
+
+        return list(parameters.values())
@@ -0,0 +1,56 @@
+import orjson
+from django_countries.fields import Country
+from phonenumber_field.phonenumber import PhoneNumber
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils import encoders
+
+
+class JSONEncoder(encoders.JSONEncoder):
+    """JSON encoder that also writes phone numbers and countries as strings"""
+
+    def default(self, obj):
+        if isinstance(obj, (PhoneNumber, Country)):
+            return str(obj)
+
+        return super().default(obj)
+
+
+encoder = JSONEncoder()
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer writing the same JSON as JSONRenderer with orjson, the
+    types only JSONEncoder knows going through its default method.
+
+    Data orjson refuses (integers over 64 bits and dicts with non string
+    keys) and indented or ASCII only JSON are left to JSONRenderer. Unlike
+    it, orjson writes the floats the json module puts in exponent notation
+    with their shortest form (0.00001 rather than 1e-05, 1e16 rather than
+    1e+16) and the floats that aren't finite as null.
+    """
+
+    encoder_class = JSONEncoder
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        indent = self.get_indent(accepted_media_type, renderer_context)
+
+        if indent is not None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=encoder.default, option=orjson.OPT_UTC_Z)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # U+2028 and U+2029 are escaped by JSONRenderer for JavaScript. Look
+        # for their last byte first, a one byte search is much cheaper.
+        if b"\xa8" in ret or b"\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028")
+            ret = ret.replace(b"\xe2\x80\xa9", b"\\u2029")
+
+        return ret
@@ -1,4 +1,17 @@
-from rest_framework import serializers
+import operator
+from datetime import datetime
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ObjectDoesNotExist
+from django.utils import timezone
+from django.utils.functional import cached_property
+from rest_framework import ISO_8601, serializers
+from rest_framework.fields import SkipField
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.relations import PKOnlyObject
+from rest_framework.settings import api_settings
+
+SKIPPED = object()
 
 
 class BaseSerializer(serializers.Serializer):
@@ -6,3 +19,330 @@ class BaseSerializer(serializers.Serializer):
 
     class Meta:
         fields = ["id", "created_at", "updated_at"]
+
+
+def get_source_paths(serializer, names):
+    """
+    Return the ORM paths the given fields of a serializer read, or None when
+    a field reads something that can't be derived from its source.
+
+    Fields that aren't a plain source (method fields, or sources reading the
+    whole object) are looked up in Meta.field_sources.
+    """
+
+    sources = getattr(getattr(serializer, "Meta", None), "field_sources", {})
+    paths = []
+
+    for name in names:
+        if name in sources:
+            paths += sources[name]
+            continue
+
+        field = serializer.fields[name]
+
+        if isinstance(field, serializers.ListSerializer):
+            field = field.child
+
+        if isinstance(field, serializers.SerializerMethodField) or not (
+            field.source_attrs
+        ):
+            return None
+
+        prefix = "__".join(field.source_attrs)
+
+        if isinstance(field, serializers.BaseSerializer):
+            nested_paths = get_source_paths(field, field.fields.keys())
+
+            if nested_paths is None:
+                return None
+
+            paths += [f"{prefix}__{path}" for path in nested_paths]
+        else:
+            paths.append(prefix)
+
+    return paths
+
+
+def narrow_queryset(queryset, paths):
+    """
+    Load only the columns behind the given paths, joining only the relations
+    they go through and prefetching only the many relations they read.
+    """
+
+    only = {queryset.model._meta.pk.name}
+    related = set()
+    prefetch = set()
+
+    for path in paths:
+        model = queryset.model
+        parts = path.split("__")
+
+        for index, part in enumerate(parts):
+            try:
+                field = model._meta.get_field(part)
+            except FieldDoesNotExist:
+                return queryset
+
+            current_path = "__".join(parts[: index + 1])
+
+            if field.many_to_many or field.one_to_many:
+                prefetch.add(current_path)
+                break
+
+            if not field.is_relation:
+                only.add(current_path)
+                break
+
+            related.add(current_path)
+            only.add(current_path)
+            model = field.related_model
+
+    return (
+        queryset.select_related(None)
+        .select_related(*related)
+        .prefetch_related(None)
+        .prefetch_related(*prefetch)
+        .only(*only)
+    )
+
+
+class SparseFieldsetMixin:
+    """
+    Serializer mixin that only returns the fields listed in ?fields= and
+    drops the ones listed in ?omit=.
+
+    Views pass their queryset through narrow_queryset so that the columns,
+    joins and prefetches of the dropped fields are skipped as well.
+    """
+
+    fields_query_param = "fields"
+    omit_query_param = "omit"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        names = self.get_sparse_field_names(self.context.get("request"))
+
+        if names is not None:
+            for name in set(self.fields.keys()) - names:
+                self.fields.pop(name)
+
+    @classmethod
+    def get_sparse_field_names(cls, request):
+        if request is None or request.method not in SAFE_METHODS:
+            return None
+
+        fields = request.query_params.get(cls.fields_query_param)
+        omit = request.query_params.get(cls.omit_query_param)
+
+        if not fields and not omit:
+            return None
+
+        names = set(cls.Meta.fields)
+
+        if fields:
+            names &= set(fields.split(","))
+
+        if omit:
+            names -= set(omit.split(","))
+
+        return names
+
+    @classmethod
+    def narrow_queryset(cls, queryset, request):
+        names = cls.get_sparse_field_names(request)
+
+        if names is None:
+            return queryset
+
+        paths = get_source_paths(cls(), names)
+
+        if paths is None:
+            return queryset
+
+        return narrow_queryset(queryset, paths)
+
+    @classmethod
+    def filter_data(cls, data, request):
+        """Apply the requested fieldset to an already serialized payload"""
+
+        names = cls.get_sparse_field_names(request)
+
+        if names is None:
+            return data
+
+        return {key: value for key, value in data.items() if key in names}
+
+
+def is_model_source(model, source_attrs):
+    """Whether source_attrs only goes through fields and relations of model"""
+
+    for attr in source_attrs:
+        if model is None:
+            return False
+
+        try:
+            model = model._meta.get_field(attr).related_model
+        except FieldDoesNotExist:
+            return False
+
+    return bool(source_attrs)
+
+
+def compile_getter(field, model):
+    if field.source == "*":
+        return lambda instance: instance
+
+    if is_model_source(model, field.source_attrs):
+        return operator.attrgetter(".".join(field.source_attrs))
+
+    def get_attribute(instance):
+        try:
+            attribute = field.get_attribute(instance)
+        except SkipField:
+            return SKIPPED
+
+        if isinstance(attribute, PKOnlyObject) and attribute.pk is None:
+            return None
+
+        return attribute
+
+    return get_attribute
+
+
+def compile_datetime(field):
+    output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+
+    if output_format is None or output_format.lower() != ISO_8601:
+        return field.to_representation
+
+    if hasattr(field, "timezone"):
+        field_timezone = field.timezone
+    else:
+        field_timezone = field.default_timezone()
+
+    def to_representation(value):
+        if (
+            field_timezone is None
+            or not isinstance(value, datetime)
+            or not timezone.is_aware(value)
+        ):
+            return field.to_representation(value)
+
+        value = value.astimezone(field_timezone).isoformat()
+
+        if value.endswith("+00:00"):
+            return value[:-6] + "Z"
+
+        return value
+
+    return to_representation
+
+
+def compile_file(field):
+    if not getattr(field, "use_url", api_settings.UPLOADED_FILES_USE_URL):
+        return field.to_representation
+
+    request = field.context.get("request")
+
+    def to_representation(value):
+        if not value:
+            return None
+
+        try:
+            url = value.url
+        except AttributeError:
+            return None
+
+        if request is None:
+            return url
+
+        return request.build_absolute_uri(url)
+
+    return to_representation
+
+
+def compile_converter(field):
+    """
+    Return a function turning an attribute into the field representation,
+    inlining the conversions DRF does for the common field types.
+    """
+
+    to_representation = type(field).to_representation
+
+    if isinstance(field, serializers.Serializer) and to_representation in (
+        serializers.Serializer.to_representation,
+        CompiledRepresentationMixin.to_representation,
+    ):
+        return compile_representation(field)
+
+    if isinstance(field, serializers.SerializerMethodField):
+        return getattr(field.parent, field.method_name)
+
+    if to_representation is serializers.CharField.to_representation:
+        return str
+
+    if to_representation is serializers.IntegerField.to_representation:
+        return int
+
+    if (
+        to_representation is serializers.UUIDField.to_representation
+        and field.uuid_format == "hex_verbose"
+    ):
+        return str
+
+    if to_representation is serializers.DateTimeField.to_representation:
+        return compile_datetime(field)
+
+    if to_representation is serializers.FileField.to_representation:
+        return compile_file(field)
+
+    return field.to_representation
+
+
+def compile_representation(serializer):
+    """
+    Build a function returning the same representation as
+    serializer.to_representation without DRF's per field dispatch: the
+    attribute getters and converters are resolved once per serializer.
+    """
+
+    model = getattr(getattr(serializer, "Meta", None), "model", None)
+    readers = [
+        (field.field_name, compile_getter(field, model), compile_converter(field))
+        for field in serializer._readable_fields
+    ]
+
+    def to_representation(instance):
+        ret = {}
+
+        for name, get_attribute, convert in readers:
+            try:
+                attribute = get_attribute(instance)
+            except ObjectDoesNotExist:
+                attribute = None
+
+            if attribute is SKIPPED:
+                continue
+
+            ret[name] = None if attribute is None else convert(attribute)
+
+        return ret
+
+    return to_representation
+
+
+class CompiledRepresentationMixin:
+    """
+    Serializer mixin that serializes through compile_representation instead
+    of DRF's field machinery, unless settings.COMPILED_SERIALIZERS is off.
+    """
+
+    def to_representation(self, instance):
+        if not settings.COMPILED_SERIALIZERS:
+            return super().to_representation(instance)
+
+        return self.compiled_representation(instance)
+
+    @cached_property
+    def compiled_representation(self):
+        return compile_representation(self)
@@ -0,0 +1,364 @@
+import threading
+import time
+from functools import lru_cache
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+from redis.exceptions import ResponseError
+
+
+@lru_cache(maxsize=None)
+def get_store():
+    """
+    Return the Redis client holding counters and rankings, built from
+    settings.STORE like the cache is from settings.CACHES.
+    """
+
+    backend = import_string(settings.STORE["BACKEND"])
+
+    return backend.from_url(settings.STORE.get("LOCATION"), decode_responses=True)
+
+
+def parse_score_bound(bound):
+    """Parse a Redis score bound, like "(10" for exclusive or "-inf" """
+
+    bound = str(bound)
+
+    if bound.startswith("("):
+        return float(bound[1:]), True
+
+    return float(bound), False
+
+
+def in_score_range(score, min, max):
+    min, min_exclusive = parse_score_bound(min)
+    max, max_exclusive = parse_score_bound(max)
+
+    if score < min or (min_exclusive and score == min):
+        return False
+
+    return not (score > max or (max_exclusive and score == max))
+
+
+class MemoryStore:
+    """
+    In-process stand-in for the subset of the redis.Redis API used by the
+    store, for tests and local development without Redis.
+
+    Like a Redis client with decode_responses, it returns strings for
+    members, fields and values.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.data = {}
+        self.expires = {}
+
+    @classmethod
+    def from_url(cls, url, **kwargs):
+        return cls()
+
+    def get_value(self, name, default_factory=None):
+        expires_at = self.expires.get(name)
+
+        if expires_at is not None and expires_at <= time.monotonic():
+            self.data.pop(name, None)
+            self.expires.pop(name, None)
+
+        if name not in self.data and default_factory is not None:
+            self.data[name] = default_factory()
+
+        return self.data.get(name)
+
+    def flushall(self):
+        with self.lock:
+            self.data.clear()
+            self.expires.clear()
+
+    def delete(self, *names):
+        with self.lock:
+            deleted = 0
+
+            for name in names:
+                if self.get_value(name) is not None:
+                    deleted += 1
+
+                self.data.pop(name, None)
+                self.expires.pop(name, None)
+
+            return deleted
+
+    def exists(self, *names):
+        with self.lock:
+            return sum(self.get_value(name) is not None for name in names)
+
+    def rename(self, src, dst):
+        with self.lock:
+            if self.get_value(src) is None:
+                raise ResponseError("no such key")
+
+            self.data[dst] = self.data.pop(src)
+            self.expires.pop(dst, None)
+
+            if src in self.expires:
+                self.expires[dst] = self.expires.pop(src)
+
+            return True
+
+    def set(self, name, value, ex=None, nx=False):
+        with self.lock:
+            if nx and self.get_value(name) is not None:
+                return None
+
+            self.data[name] = str(value)
+            self.expires.pop(name, None)
+
+            if ex is not None:
+                self.expires[name] = time.monotonic() + ex
+
+            return True
+
+    def expire(self, name, seconds):
+        with self.lock:
+            if self.get_value(name) is None:
+                return False
+
+            self.expires[name] = time.monotonic() + seconds
+
+            return True
+
+    def get(self, name):
+        with self.lock:
+            return self.get_value(name)
+
+    def hincrby(self, name, key, amount=1):
+        with self.lock:
+            values = self.get_value(name, dict)
+            values[str(key)] = str(int(values.get(str(key), 0)) + amount)
+
+            return int(values[str(key)])
+
+    def hset(self, name, key=None, value=None, mapping=None):
+        with self.lock:
+            values = self.get_value(name, dict)
+            items = dict(mapping or {})
+
+            if key is not None:
+                items[key] = value
+
+            added = {str(key) for key in items} - values.keys()
+            values.update({str(key): str(value) for key, value in items.items()})
+
+            return len(added)
+
+    def hget(self, name, key):
+        with self.lock:
+            return (self.get_value(name) or {}).get(str(key))
+
+    def hgetall(self, name):
+        with self.lock:
+            return dict(self.get_value(name) or {})
+
+    def sadd(self, name, *values):
+        with self.lock:
+            members = self.get_value(name, set)
+            added = {str(value) for value in values} - members
+            members.update(added)
+
+            return len(added)
+
+    def srem(self, name, *values):
+        with self.lock:
+            members = self.get_value(name) or set()
+            removed = {str(value) for value in values} & members
+            members.difference_update(removed)
+
+            return len(removed)
+
+    def smembers(self, name):
+        with self.lock:
+            return set(self.get_value(name) or set())
+
+    def rpush(self, name, *values):
+        with self.lock:
+            items = self.get_value(name, list)
+            items.extend(str(value) for value in values)
+
+            return len(items)
+
+    def lmove(self, first_list, second_list, src="LEFT", dest="RIGHT"):
+        with self.lock:
+            items = self.get_value(first_list) or []
+
+            if not items:
+                return None
+
+            value = items.pop(0 if src == "LEFT" else -1)
+            target = self.get_value(second_list, list)
+            target.insert(0 if dest == "LEFT" else len(target), value)
+
+            return value
+
+    def lrem(self, name, count, value):
+        with self.lock:
+            items = self.get_value(name) or []
+            indexes = [index for index, item in enumerate(items) if item == value]
+
+            if count > 0:
+                indexes = indexes[:count]
+            elif count < 0:
+                indexes = indexes[count:]
+
+            for index in reversed(indexes):
+                del items[index]
+
+            return len(indexes)
+
+    def llen(self, name):
+        with self.lock:
+            return len(self.get_value(name) or [])
+
+    def lrange(self, name, start, end):
+        with self.lock:
+            return self.get_rank_range(list(self.get_value(name) or []), start, end)
+
+    def zadd(self, name, mapping):
+        with self.lock:
+            scores = self.get_value(name, dict)
+            added = {str(member) for member in mapping} - scores.keys()
+            scores.update(
+                {str(member): float(score) for member, score in mapping.items()}
+            )
+
+            return len(added)
+
+    def zincrby(self, name, amount, value):
+        with self.lock:
+            scores = self.get_value(name, dict)
+            scores[str(value)] = scores.get(str(value), 0.0) + float(amount)
+
+            return scores[str(value)]
+
+    def zrem(self, name, *values):
+        with self.lock:
+            scores = self.get_value(name) or {}
+
+            return sum(scores.pop(str(value), None) is not None for value in values)
+
+    def get_sorted_members(self, name):
+        """Members from the lowest to the highest score, like Redis ranks"""
+
+        scores = self.get_value(name) or {}
+
+        return sorted(scores.items(), key=lambda item: (item[1], item[0]))
+
+    def get_rank_range(self, members, start, end):
+        start = len(members) + start if start < 0 else start
+        end = len(members) + end + 1 if end < 0 else end + 1
+        start, end = max(start, 0), max(end, 0)
+
+        return members[start:end]
+
+    def zremrangebyrank(self, name, start, end):
+        with self.lock:
+            members = self.get_sorted_members(name)
+            removed = self.get_rank_range(members, start, end)
+
+            return self.zrem(name, *[member for member, _ in removed])
+
+    def zrevrange(self, name, start, end, withscores=False):
+        with self.lock:
+            members = list(reversed(self.get_sorted_members(name)))
+            members = self.get_rank_range(members, start, end)
+
+        if withscores:
+            return members
+
+        return [member for member, _ in members]
+
+    def zrangebyscore(self, name, min, max, withscores=False):
+        with self.lock:
+            members = [
+                (member, score)
+                for member, score in self.get_sorted_members(name)
+                if in_score_range(score, min, max)
+            ]
+
+        if withscores:
+            return members
+
+        return [member for member, _ in members]
+
+    def zrevrangebyscore(self, name, max, min, start=None, num=None, withscores=False):
+        with self.lock:
+            members = [
+                (member, score)
+                for member, score in reversed(self.get_sorted_members(name))
+                if in_score_range(score, min, max)
+            ]
+
+        if start is not None:
+            end = start + num
+            members = members[start:end]
+
+        if withscores:
+            return members
+
+        return [member for member, _ in members]
+
+    def pipeline(self, transaction=True):
+        return MemoryPipeline(self)
+
+    def transaction(self, func, *watches, value_from_callable=False, **kwargs):
+        """
+        Like redis.Redis.transaction: func reads through the pipeline right
+        away until it calls multi() and queues its writes. Holding the lock
+        stands in for watching the keys.
+        """
+
+        with self.lock:
+            pipeline = MemoryPipeline(self, immediate=True)
+            value = func(pipeline)
+            results = pipeline.execute()
+
+        return value if value_from_callable else results
+
+
+class MemoryPipeline:
+    """Queue MemoryStore commands and run them together under its lock"""
+
+    def __init__(self, store, immediate=False):
+        self.store = store
+        self.commands = []
+        self.immediate = immediate
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.commands = []
+
+    def multi(self):
+        self.immediate = False
+
+    def __getattr__(self, name):
+        method = getattr(self.store, name)
+
+        if self.immediate:
+            return method
+
+        def queue(*args, **kwargs):
+            self.commands.append((method, args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self):
+        with self.store.lock:
+            results = [
+                method(*args, **kwargs) for method, args, kwargs in self.commands
+            ]
+
+        self.commands = []
+
+        return results
@@ -0,0 +1,67 @@
+import math
+import time
+
+from rest_framework.throttling import BaseThrottle
+
+from .store import get_store
+
+
+def take_token(key, capacity, rate):
+    """
+    Take a token from the bucket at key, holding up to capacity tokens and
+    refilled with rate tokens per second. Return how long to wait for the
+    next token, 0 when one was taken.
+
+    The bucket is read and written in a WATCH/MULTI transaction so that
+    concurrent requests can't take the same token.
+    """
+
+    def take(pipeline):
+        now = time.time()
+        bucket = pipeline.hgetall(key)
+        updated = float(bucket.get("updated", now))
+        tokens = float(bucket.get("tokens", capacity))
+        tokens = min(capacity, tokens + (now - updated) * rate)
+        wait = 0 if tokens >= 1 else (1 - tokens) / rate
+
+        if not wait:
+            tokens -= 1
+
+        pipeline.multi()
+        pipeline.hset(key, mapping={"tokens": tokens, "updated": now})
+        pipeline.expire(key, math.ceil(capacity / rate))
+
+        return wait
+
+    return get_store().transaction(take, key, value_from_callable=True)
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    Throttle requests with a token bucket per key kept in the store.
+    Subclasses return the key of a request, or None to skip the bucket.
+    """
+
+    scope = None
+    capacity = None
+    # Tokens added per second
+    rate = None
+
+    def get_key(self, request, view):
+        raise NotImplementedError(".get_key() must be overridden")
+
+    def allow_request(self, request, view):
+        key = self.get_key(request, view)
+        self.wait_time = None
+
+        if key is None:
+            return True
+
+        self.wait_time = take_token(
+            f"throttle:{self.scope}:{key}", self.capacity, self.rate
+        )
+
+        return not self.wait_time
+
+    def wait(self):
+        return self.wait_time
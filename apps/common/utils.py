@@ -1,6 +1,10 @@
+import hashlib
+from calendar import timegm
 from functools import wraps
 
-from django.core.mail import EmailMessage
+from django.db.models import Q
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
 from rest_framework import status
 from rest_framework.exceptions import APIException, PermissionDenied
 from rest_framework.request import Request
@@ -14,24 +18,35 @@ class ConflictException(APIException):
         super().__init__(detail=detail)
 
 
-def validate_unique_value(**kwargs):
-    field = kwargs["field"]
-    value = kwargs["value"]
-    errors = kwargs["errors"]
-    model = kwargs["model"]
-    instance = kwargs["instance"]
-    query = {field: value}
+def validate_unique_values(model, values, errors, instance=None):
+    """
+    Raise a ConflictException naming every field of values another row
+    already has, looked up together in a single query.
+    """
 
-    row = model.objects.filter(**query).first()
+    if not values:
+        return
 
-    if row and not instance:
-        raise ConflictException(errors[field]["unique"])
+    query = Q()
 
+    for field, value in values.items():
+        query |= Q(**{field: value})
 
-def send_email(subject, message, to):
-    email_message = EmailMessage(subject, message, to=to)
-    email_message.content_subtype = "html"
-    email_message.send()
+    rows = model.objects.filter(query)
+
+    if instance is not None:
+        rows = rows.exclude(pk=instance.pk)
+
+    taken = [dict(zip(values, row)) for row in rows.values_list(*values)]
+    conflicts = {
+        field: errors[field]["unique"]
+        for field, value in values.items()
+        if any(row[field] == value for row in taken)
+    }
+
+    if conflicts:
+        detail = next(iter(conflicts.values()))
+        raise ConflictException({"detail": detail, "conflicts": conflicts})
 
 
 def find_request(args):
@@ -58,5 +73,49 @@ def should_be_admin():
     return check
 
 
+def conditional_get(get_versions):
+    """
+    Decorator to answer conditional GETs with a 304 when the client already
+    has the current representation.
+
+    get_versions(request, **kwargs) returns the updated_at values the
+    representation is built from, or None when the resource can't be found.
+    """
+
+    def check(view):
+        @wraps(view)
+        def wrapped_view(*args, **kwargs):
+            request = find_request(args)
+            versions = get_versions(request, **kwargs)
+
+            if not versions:
+                return view(*args, **kwargs)
+
+            # The query string is hashed in as it can select a sparse fieldset
+            digest = hashlib.md5(request.get_host().encode())
+            digest.update(request.META.get("QUERY_STRING", "").encode())
+            for version in versions:
+                digest.update(version.isoformat().encode() if version else b"-")
+
+            etag = quote_etag(digest.hexdigest())
+            last_modified = timegm(max(filter(None, versions)).utctimetuple())
+            response = get_conditional_response(
+                request, etag=etag, last_modified=last_modified
+            )
+
+            if response is None:
+                response = view(*args, **kwargs)
+
+            if response.status_code in (200, 304):
+                response.headers["ETag"] = etag
+                response.headers["Last-Modified"] = http_date(last_modified)
+
+            return response
+
+        return wrapped_view
+
+    return check
+
+
 def get_country_name(country):
     return country.name if country else None
@@ -2,12 +2,13 @@ from django_countries.serializer_fields import CountryField
 from phonenumber_field.serializerfields import PhoneNumberField
 from rest_framework import serializers
 
+from ..common.serializers import SparseFieldsetMixin
 from ..common.utils import get_country_name
 from ..users.models import User
 from .models import Gender, Profile
 
 
-class ProfileDisplaySerializer(serializers.ModelSerializer):
+class ProfileDisplaySerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """User profile display serializer"""
 
     first_name = serializers.CharField(source="user.first_name")
@@ -33,6 +34,7 @@ class ProfileDisplaySerializer(serializers.ModelSerializer):
             "city",
             "created_at",
         ]
+        field_sources = {"country": ["country"]}
 
     def get_country(self, profile):
         return get_country_name(profile.country)
@@ -66,7 +68,7 @@ class EditProfileSerializer(serializers.Serializer):
         ]
 
 
-class UserProfileSerializer(serializers.ModelSerializer):
+class UserProfileSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Another user profile serializer"""
 
     about_me = serializers.CharField(source="profile.about_me")
@@ -87,6 +89,7 @@ class UserProfileSerializer(serializers.ModelSerializer):
             "country",
             "city",
         ]
+        field_sources = {"country": ["profile__country"]}
 
     def get_country(self, user):
         return get_country_name(user.profile.country)
@@ -18,5 +18,15 @@ def create_user_profile(sender, instance, created, **kwargs):
 
 @receiver(post_save, sender=User)
 def save_user_profile(sender, instance, created, **kwargs):
-    instance.profile.save()
-    logger.info(f"{instance}'s profile saved")
+    """Save the profile when it was loaded through the user and changed"""
+
+    field = User._meta.get_field("profile")
+
+    if not field.is_cached(instance):
+        return
+
+    profile = field.get_cached_value(instance)
+
+    if profile.get_dirty_fields():
+        profile.save()
+        logger.info(f"{instance}'s profile saved")
@@ -0,0 +1,54 @@
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+# Kept short as a safety net, saves invalidate the entry right away
+USER_CACHE_TIMEOUT = 60
+# Never copied to the cache, they are loaded from the database when read
+UNCACHED_USER_FIELDS = {"password"}
+
+
+def get_user_cache_key(user_id):
+    return f"auth-user:{user_id}"
+
+
+def invalidate_cached_user(user):
+    key = get_user_cache_key(getattr(user, api_settings.USER_ID_FIELD))
+    transaction.on_commit(lambda: cache.delete(key))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication serving the token user from the cache instead of
+    querying the User row on every request.
+
+    Only active users are cached, without their password hash, and the
+    entries are dropped whenever the user is saved or deleted.
+    """
+
+    def get_cached_values(self, user):
+        return {
+            field.attname: getattr(user, field.attname)
+            for field in self.user_model._meta.concrete_fields
+            if field.name not in UNCACHED_USER_FIELDS
+        }
+
+    def get_user(self, validated_token):
+        try:
+            key = get_user_cache_key(validated_token[api_settings.USER_ID_CLAIM])
+        except KeyError:
+            raise InvalidToken("Token contained no recognizable user identification")
+
+        values = cache.get(key)
+
+        if values is None:
+            user = super().get_user(validated_token)
+            cache.set(key, self.get_cached_values(user), USER_CACHE_TIMEOUT)
+
+            return user
+
+        return self.user_model.from_db(
+            DEFAULT_DB_ALIAS, list(values), list(values.values())
+        )
@@ -0,0 +1,31 @@
+from django.template.loader import get_template
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from ..common.mail import send_email
+from .models import User
+
+
+def send_token_email(user_id, host, url_name, subject, template):
+    """Mint a token for the user and email them a link carrying it"""
+
+    user = User.objects.filter(id=user_id).first()
+
+    if user is None:
+        return
+
+    token = RefreshToken.for_user(user).access_token
+    url = "http://" + host + reverse(url_name) + "?token=" + str(token)
+    message = get_template(template).render({"user": user, "url": url})
+
+    send_email(subject, message, [user.email])
+
+
+def send_verification_email(user_id, host):
+    send_token_email(user_id, host, "verify", "Email Verification", "verification.html")
+
+
+def send_password_reset_email(user_id, host):
+    send_token_email(
+        user_id, host, "reset-password", "Forgot Password", "forgot-password.html"
+    )
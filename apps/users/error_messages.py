@@ -48,4 +48,6 @@ errors = {
     "access_tokens": {
         "invalid": "The access_token_key and access_token_secret are invalid"
     },
+    "provider": {"unavailable": "{0} can't be reached, please try again later"},
+    "follow": {"self": "You can't follow yourself"},
 }
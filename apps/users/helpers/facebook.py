@@ -1,9 +1,9 @@
-import pdb
-
-import requests
 from facebook import GraphAPI, GraphAPIError
 
 from ..error_messages import errors
+from .providers import PROVIDER_TIMEOUT, CircuitBreaker, get_session
+
+breaker = CircuitBreaker("Facebook")
 
 
 class Facebook:
@@ -12,11 +12,15 @@ class Facebook:
     @staticmethod
     def validate(auth_token):
         try:
-            graph = GraphAPI(access_token=auth_token)
-            profile = graph.request(
-                "/me?fields=first_name,last_name,middle_name,name,email"
+            graph = GraphAPI(
+                access_token=auth_token, timeout=PROVIDER_TIMEOUT, session=get_session()
             )
 
+            with breaker:
+                profile = graph.request(
+                    "/me?fields=first_name,last_name,middle_name,name,email"
+                )
+
             return profile
 
         except GraphAPIError:
@@ -1,7 +1,10 @@
-from google.auth.transport import requests
 from google.oauth2 import id_token
 
 from ..error_messages import errors
+from .providers import CachingRequest, CircuitBreaker
+
+GOOGLE_CERTS_URL = "https://www.googleapis.com/oauth2/v1/certs"
+breaker = CircuitBreaker("Google")
 
 
 class Google:
@@ -10,7 +13,10 @@ class Google:
     @staticmethod
     def validate(auth_token):
         try:
-            id_info = id_token.verify_oauth2_token(auth_token, requests.Request())
+            with breaker:
+                id_info = id_token.verify_token(
+                    auth_token, CachingRequest(), certs_url=GOOGLE_CERTS_URL
+                )
 
             if "accounts.google.com" in id_info["iss"]:
                 return id_info
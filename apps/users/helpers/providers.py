@@ -0,0 +1,154 @@
+import logging
+import re
+import threading
+import time
+from functools import lru_cache
+
+import requests
+from django.core.cache import cache
+from google.auth import transport
+from google.auth.exceptions import TransportError
+from google.auth.transport.requests import Request
+from requests.adapters import HTTPAdapter
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from ..error_messages import errors
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for a provider to connect and to answer
+PROVIDER_TIMEOUT = 5
+PROVIDER_POOL_SIZE = 10
+# Errors telling that the provider couldn't be reached, unlike a rejected token
+PROVIDER_ERRORS = (requests.RequestException, TransportError)
+
+
+class ProviderUnavailable(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "Service unavailable"
+
+    def __init__(self, provider):
+        super().__init__(detail=errors["provider"]["unavailable"].format(provider))
+
+
+@lru_cache(maxsize=None)
+def get_session():
+    """The HTTP session shared by the provider calls, keeping connections open"""
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=PROVIDER_POOL_SIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
+
+
+class CircuitBreaker:
+    """
+    Fail calls to a provider right away for reset_timeout seconds once it
+    couldn't be reached failure_threshold times in a row, then let one call
+    through to find out whether it is back.
+    """
+
+    def __init__(self, provider, failure_threshold=5, reset_timeout=30):
+        self.provider = provider
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.failures = 0
+        self.opened_at = None
+
+    def __enter__(self):
+        with self.lock:
+            if self.opened_at is not None:
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    raise ProviderUnavailable(self.provider)
+
+                # The other calls keep failing while this one probes
+                self.opened_at = time.monotonic()
+
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is None or not issubclass(exc_type, PROVIDER_ERRORS):
+            with self.lock:
+                self.reset()
+
+            return False
+
+        with self.lock:
+            self.failures += 1
+
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+        logger.warning(f"{self.provider} couldn't be reached: {exc!r}")
+
+        raise ProviderUnavailable(self.provider) from exc
+
+
+def get_max_age(headers):
+    """How long a response can be cached according to its headers, in seconds"""
+
+    cache_control = headers.get("cache-control", "")
+    max_age = re.search(r"max-age=(\d+)", cache_control)
+
+    if max_age is None or "no-store" in cache_control or "no-cache" in cache_control:
+        return 0
+
+    return int(max_age.group(1)) - int(headers.get("age", 0))
+
+
+class CachedResponse(transport.Response):
+    def __init__(self, status, headers, data):
+        self._status = status
+        self._headers = headers
+        self._data = data
+
+    @property
+    def status(self):
+        return self._status
+
+    @property
+    def headers(self):
+        return self._headers
+
+    @property
+    def data(self):
+        return self._data
+
+
+class CachingRequest(Request):
+    """
+    google.auth transport over the shared session, serving GET responses
+    from the cache for as long as their Cache-Control allows.
+    """
+
+    def __init__(self):
+        super().__init__(session=get_session())
+
+    def __call__(self, url, method="GET", body=None, headers=None, **kwargs):
+        kwargs["timeout"] = PROVIDER_TIMEOUT
+
+        if method != "GET":
+            return super().__call__(url, method, body, headers, **kwargs)
+
+        key = f"provider-response:{url}"
+        cached = cache.get(key)
+
+        if cached is not None:
+            return CachedResponse(*cached)
+
+        response = super().__call__(url, method, body, headers, **kwargs)
+        max_age = get_max_age(response.headers)
+
+        if response.status == 200 and max_age > 0:
+            cache.set(
+                key, (response.status, dict(response.headers), response.data), max_age
+            )
+
+        return response
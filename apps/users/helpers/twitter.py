@@ -3,6 +3,30 @@ from twitter import Api
 from authors_heaven.settings.base import env
 
 from ..error_messages import errors
+from .providers import (
+    PROVIDER_TIMEOUT,
+    CircuitBreaker,
+    ProviderUnavailable,
+    get_session,
+)
+
+TWITTER_API_URL = "https://api.twitter.com/1.1"
+breaker = CircuitBreaker("Twitter")
+
+
+class SharedSessionApi(Api):
+    """
+    python-twitter Api sending its requests over the shared session. The
+    library takes no session, so the one its __init__ creates is ignored.
+    """
+
+    @property
+    def _session(self):
+        return get_session()
+
+    @_session.setter
+    def _session(self, session):
+        pass
 
 
 class Twitter:
@@ -14,15 +38,25 @@ class Twitter:
         consumer_secret = env("TWITTER_API_SECRET")
 
         try:
-            api = Api(
+            # The timeout warning is about the 30s keepalives of the
+            # streaming API, which isn't used here
+            api = SharedSessionApi(
                 consumer_key=consumer_key,
                 consumer_secret=consumer_secret,
                 access_token_key=access_token_key,
                 access_token_secret=access_token_secret,
+                cache=None,
+                base_url=TWITTER_API_URL,
+                timeout=PROVIDER_TIMEOUT,
             )
-            profile = api.VerifyCredentials(include_email=True)
+
+            with breaker:
+                profile = api.VerifyCredentials(include_email=True)
 
             return profile.__dict__
 
+        except ProviderUnavailable:
+            raise
+
         except Exception:
             raise ValueError(errors["access_tokens"]["invalid"])
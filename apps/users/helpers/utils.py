@@ -1,14 +1,70 @@
-import random
+import re
+from itertools import count
+
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
 
 from ..models import User
 
+USERNAME_ATTEMPTS = 3
+# For the blank names, which a username can't be made of
+DEFAULT_USERNAME = "user"
+
 
 def generate_username(name):
-    username = "".join(name.split(" ")).lower()
+    """
+    The name without spaces, suffixed with the lowest number that isn't
+    taken yet. Only the usernames made of the name and digits are read, in
+    a single query on the LIKE index of the unique username column.
+    """
+
+    username = "".join((name or "").split()).lower() or DEFAULT_USERNAME
+    taken = set(
+        User.objects.filter(
+            username__startswith=username,
+            username__regex=rf"^{re.escape(username)}[0-9]*$",
+        ).values_list("username", flat=True)
+    )
+    suffixes = count(1)
+    candidate = username
+
+    while candidate in taken:
+        candidate = f"{username}{next(suffixes)}"
+
+    return candidate
+
+
+def create_with_username(name, create):
+    """
+    Call create with a username generated from name in a savepoint, and
+    again with a fresh one when another signup took it in the meantime.
+    """
+
+    for attempt in range(USERNAME_ATTEMPTS):
+        username = generate_username(name)
+
+        try:
+            with transaction.atomic():
+                return create(username)
+        except IntegrityError:
+            if attempt == USERNAME_ATTEMPTS - 1:
+                raise
+
+
+def get_user_profile_versions(request, id):
+    try:
+        return (
+            User.objects.filter(id=id)
+            .values_list("updated_at", "profile__updated_at")
+            .first()
+        )
+    except ValidationError:
+        return None
 
-    if not User.objects.filter(username=username).exists():
-        return username
 
-    else:
-        random_username = username + str(random.randint(0, 1000))
-        return generate_username(random_username)
+def get_my_profile_versions(request):
+    return (
+        User.objects.filter(pkid=request.user.pkid)
+        .values_list("updated_at", "profile__updated_at")
+        .first()
+    )
@@ -0,0 +1,43 @@
+# Generated by Django 4.1.3 on 2026-10-18 11:46
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.operations
+import django.db.models.functions.text
+from django.db import migrations, models
+
+from apps.common.operations import PostgresOnly
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0003_follow"),
+    ]
+
+    operations = [
+        PostgresOnly(django.contrib.postgres.operations.TrigramExtension()),
+        PostgresOnly(
+            migrations.AddIndex(
+                model_name="user",
+                index=django.contrib.postgres.indexes.GinIndex(
+                    django.contrib.postgres.indexes.OpClass(
+                        django.db.models.functions.text.Upper("username"),
+                        name="gin_trgm_ops",
+                    ),
+                    name="user_username_trgm_idx",
+                ),
+            )
+        ),
+        PostgresOnly(
+            migrations.AddIndex(
+                model_name="user",
+                index=models.Index(
+                    django.contrib.postgres.indexes.OpClass(
+                        django.db.models.functions.text.Upper("username"),
+                        name="text_pattern_ops",
+                    ),
+                    name="user_username_prefix_idx",
+                ),
+            )
+        ),
+    ]
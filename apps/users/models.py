@@ -1,5 +1,7 @@
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 
 from ..common.models import BaseModel
 from .managers import UserManager
@@ -38,6 +40,17 @@ class User(AbstractBaseUser, PermissionsMixin, BaseModel):
     class Meta:
         verbose_name = "User"
         verbose_name_plural = "Users"
+        indexes = [
+            GinIndex(
+                OpClass(Upper("username"), name="gin_trgm_ops"),
+                name="user_username_trgm_idx",
+            ),
+            # Autocomplete prefix matches, too short for the trigrams
+            models.Index(
+                OpClass(Upper("username"), name="text_pattern_ops"),
+                name="user_username_prefix_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.username
@@ -45,3 +58,21 @@ class User(AbstractBaseUser, PermissionsMixin, BaseModel):
     @property
     def get_full_name(self):
         return f"{self.first_name}{f' {self.middle_name }'if self.middle_name else ''} {self.last_name}"
+
+
+class Follow(BaseModel):
+    """Follow relation between users"""
+
+    follower = models.ForeignKey(
+        User, related_name="following", on_delete=models.CASCADE
+    )
+    followed = models.ForeignKey(
+        User, related_name="followers", on_delete=models.CASCADE
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["follower", "followed"], name="unique_follow"
+            )
+        ]
@@ -1,4 +1,3 @@
-from django.db.models import Q
 from rest_framework import serializers
 from rest_framework.exceptions import AuthenticationFailed
 
@@ -8,7 +7,7 @@ from ..error_messages import errors
 from ..helpers.facebook import Facebook
 from ..helpers.google import Google
 from ..helpers.twitter import Twitter
-from ..helpers.utils import generate_username
+from ..helpers.utils import create_with_username
 from ..models import AUTH_PROVIDERS, User
 from .user import generate_tokens, password
 
@@ -33,15 +32,19 @@ def social_authenticate(**data):
         user_data = {
             "first_name": first_name,
             "last_name": last_name,
-            "username": generate_username(name),
             "email": email,
             "password": env("SOCIAL_SECRET"),
         }
 
-        new_user = User.objects.create_user(**user_data)
-        new_user.is_active = True
-        new_user.auth_provider = provider
-        new_user.save()
+        def create_user(username):
+            new_user = User.objects.create_user(username=username, **user_data)
+            new_user.is_active = True
+            new_user.auth_provider = provider
+            new_user.save()
+
+            return new_user
+
+        new_user = create_with_username(name, create_user)
 
         return generate_tokens(new_user)
 
@@ -63,22 +66,26 @@ class LoginSerializer(serializers.ModelSerializer):
         fields = ["email", "username", "password"]
 
     def authenticate_user(self, email, username, password):
+        # One unique index lookup, on the email when both are given
+        lookup = {"email": email} if email else {"username": username}
+
         try:
-            user = User.objects.get(Q(username=username) | Q(email=email))
+            user = User.objects.get(**lookup)
         except User.DoesNotExist:
             raise AuthenticationFailed(errors["account"]["no_account"])
 
+        # The cheap checks run first, the password hash is the expensive one
         if user.auth_provider != "email":
             raise AuthenticationFailed(
                 errors["account"]["provider"].format(user.auth_provider)
             )
 
-        if not user.check_password(password):
-            raise AuthenticationFailed(errors["account"]["no_account"])
-
         if not user.is_active:
             raise AuthenticationFailed(errors["account"]["disabled"])
 
+        if not user.check_password(password):
+            raise AuthenticationFailed(errors["account"]["no_account"])
+
         return user
 
     def validate(self, attrs):
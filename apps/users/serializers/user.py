@@ -1,11 +1,16 @@
 from django.core.validators import RegexValidator
+from django.db import IntegrityError, transaction
 from django_countries.serializer_fields import CountryField
 from phonenumber_field.serializerfields import PhoneNumberField
 from rest_framework import serializers
 from rest_framework_simplejwt.tokens import RefreshToken
 
-from ...common.serializers import BaseSerializer
-from ...common.utils import get_country_name, validate_unique_value
+from ...common.serializers import (
+    BaseSerializer,
+    CompiledRepresentationMixin,
+    SparseFieldsetMixin,
+)
+from ...common.utils import get_country_name, validate_unique_values
 from ..error_messages import errors
 from ..models import User
 
@@ -85,33 +90,32 @@ class UserSerializer(serializers.ModelSerializer):
         ] + BaseSerializer.Meta.fields
 
     def validate_email(self, email):
-        norm_email = email.lower()
-        validate_unique_value(
-            model=User,
-            field="email",
-            value=norm_email,
-            errors=errors,
-            instance=self.instance,
-        )
+        return email.lower()
 
-        return norm_email
+    def validate(self, attrs):
+        self.validate_unique(attrs)
 
-    def validate_username(self, username):
-        validate_unique_value(
-            model=User,
-            field="username",
-            value=username,
-            errors=errors,
-            instance=self.instance,
-        )
+        return attrs
 
-        return username
+    def validate_unique(self, attrs):
+        values = {
+            field: attrs[field] for field in ["email", "username"] if field in attrs
+        }
+        validate_unique_values(User, values, errors, instance=self.instance)
 
     def create(self, validated_data):
-        return User.objects.create_user(**validated_data)
-
-
-class UserDisplaySerializer(serializers.ModelSerializer):
+        try:
+            with transaction.atomic():
+                return User.objects.create_user(**validated_data)
+        except IntegrityError:
+            # Another signup took the email or username since validation
+            self.validate_unique(validated_data)
+            raise
+
+
+class UserDisplaySerializer(
+    CompiledRepresentationMixin, SparseFieldsetMixin, serializers.ModelSerializer
+):
     """User display serializer"""
 
     phone_number = PhoneNumberField(source="profile.phone_number")
@@ -138,6 +142,7 @@ class UserDisplaySerializer(serializers.ModelSerializer):
             "country",
             "city",
         ] + BaseSerializer.Meta.fields
+        field_sources = {"country": ["profile__country"]}
 
     def get_country(self, user):
         return get_country_name(user.profile.country)
@@ -0,0 +1,31 @@
+import hashlib
+
+from ..common.throttling import TokenBucketThrottle
+
+
+class LoginIPThrottle(TokenBucketThrottle):
+    """Login attempts per client IP"""
+
+    scope = "login-ip"
+    capacity = 20
+    rate = 20 / 60
+
+    def get_key(self, request, view):
+        return self.get_ident(request)
+
+
+class LoginIdentifierThrottle(TokenBucketThrottle):
+    """Login attempts per email or username, whatever the client IP"""
+
+    scope = "login-identifier"
+    capacity = 5
+    rate = 5 / 60
+
+    def get_key(self, request, view):
+        data = request.data if hasattr(request.data, "get") else {}
+        identifier = data.get("email") or data.get("username")
+
+        if not isinstance(identifier, str) or not identifier.strip():
+            return None
+
+        return hashlib.sha256(identifier.strip().lower().encode()).hexdigest()
@@ -2,6 +2,7 @@ from django.urls import path
 
 from .views import (
     FacebookAuthView,
+    FollowView,
     ForgotPasswordView,
     GoogleAuthView,
     MyProfileView,
@@ -28,4 +29,5 @@ urlpatterns = [
     path("profile/<slug:id>/", UserProfileView.as_view(), name="user-profile"),
     path("", UsersView.as_view(), name=("get-users")),
     path("<slug:id>/", UserView.as_view(), name=("get-user")),
+    path("<slug:id>/follow/", FollowView.as_view(), name="follow-user"),
 ]
@@ -1,15 +1,13 @@
-import django_rq
 import jwt
-from django.template.loader import get_template
-from django.urls import reverse
+from django.db import transaction
 from rest_framework import generics, mixins, status
 from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
-from rest_framework_simplejwt.tokens import RefreshToken
 
 from authors_heaven.settings.base import env
 
-from ...common.utils import send_email
+from ...common.jobs import enqueue_on_commit
+from ..emails import send_password_reset_email, send_verification_email
 from ..error_messages import errors
 from ..models import User
 from ..serializers import (
@@ -21,6 +19,7 @@ from ..serializers import (
     TwitterAuthSerializer,
     UserSerializer,
 )
+from ..throttling import LoginIdentifierThrottle, LoginIPThrottle
 
 
 class UserSignupView(mixins.CreateModelMixin, generics.GenericAPIView):
@@ -30,16 +29,13 @@ class UserSignupView(mixins.CreateModelMixin, generics.GenericAPIView):
     serializer_class = UserSerializer
 
     def post(self, request, *args, **kwargs):
-        response = self.create(request, *args, **kwargs)
+        with transaction.atomic():
+            response = self.create(request, *args, **kwargs)
 
-        # Send verification email
-        user = User.objects.get(id=response.data["id"])
-        token = RefreshToken.for_user(user).access_token
-        current_path = reverse("verify")
-        url = "http://" + request.get_host() + current_path + "?token=" + str(token)
-        subject = "Email Verification"
-        message = get_template("verification.html").render({"user": user, "url": url})
-        django_rq.enqueue(send_email, subject, message, [user.email])
+            # Send verification email once the user is committed
+            enqueue_on_commit(
+                send_verification_email, str(response.data["id"]), request.get_host()
+            )
 
         return response
 
@@ -74,6 +70,7 @@ class UserLoginView(generics.GenericAPIView):
     """User login view"""
 
     serializer_class = LoginSerializer
+    throttle_classes = [LoginIPThrottle, LoginIdentifierThrottle]
 
     def post(self, request):
         serializer = self.serializer_class(data=request.data)
@@ -92,19 +89,12 @@ class ForgotPasswordView(generics.GenericAPIView):
         serializer.is_valid(raise_exception=True)
 
         email = serializer.validated_data["email"]
-        user = User.objects.filter(email=email).first()
+        user_id = User.objects.filter(email=email).values_list("id", flat=True).first()
 
-        if not user:
+        if not user_id:
             raise NotFound(f"User with email '{email}' not found")
 
-        token = RefreshToken.for_user(user).access_token
-        current_path = reverse("reset-password")
-        url = "http://" + request.get_host() + current_path + "?token=" + str(token)
-        subject = "Forgot Password"
-        message = get_template("forgot-password.html").render(
-            {"user": user, "url": url}
-        )
-        django_rq.enqueue(send_email, subject, message, [user.email])
+        enqueue_on_commit(send_password_reset_email, str(user_id), request.get_host())
 
         return Response(
             {
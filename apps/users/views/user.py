@@ -2,14 +2,16 @@ from rest_framework import generics, mixins, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from ...common.utils import should_be_admin
+from ...common.utils import conditional_get, should_be_admin
 from ...profiles.models import Profile
 from ...profiles.serializers import (
     EditProfileSerializer,
     ProfileDisplaySerializer,
     UserProfileSerializer,
 )
-from ..models import User
+from ..error_messages import errors
+from ..helpers.utils import get_my_profile_versions, get_user_profile_versions
+from ..models import Follow, User
 from ..serializers import UserDisplaySerializer
 
 
@@ -18,8 +20,12 @@ class MyProfileView(generics.GenericAPIView):
 
     permission_classes = [IsAuthenticated]
 
+    @conditional_get(get_my_profile_versions)
     def get(self, request):
-        profile = Profile.objects.get(user=request.user)
+        queryset = ProfileDisplaySerializer.narrow_queryset(
+            Profile.objects.select_related("user"), request
+        )
+        profile = queryset.get(user=request.user)
         data = ProfileDisplaySerializer(profile, context={"request": request}).data
 
         return Response(data, status=status.HTTP_200_OK)
@@ -53,7 +59,7 @@ class MyProfileView(generics.GenericAPIView):
 class UsersView(mixins.ListModelMixin, generics.GenericAPIView):
     """Get all users view"""
 
-    queryset = User.objects.all()
+    queryset = User.objects.select_related("profile")
     serializer_class = UserDisplaySerializer
     permission_classes = [IsAuthenticated]
     ordering = ["-pkid"]
@@ -68,6 +74,11 @@ class UsersView(mixins.ListModelMixin, generics.GenericAPIView):
         "profile__city",
     ]
 
+    def get_queryset(self):
+        return UserDisplaySerializer.narrow_queryset(
+            super().get_queryset(), self.request
+        )
+
     @should_be_admin()
     def get(self, request, *args, **kwargs):
         return self.list(request, *args, **kwargs)
@@ -76,11 +87,16 @@ class UsersView(mixins.ListModelMixin, generics.GenericAPIView):
 class UserView(mixins.RetrieveModelMixin, generics.GenericAPIView):
     """Get single user view"""
 
-    queryset = User.objects.all()
+    queryset = User.objects.select_related("profile")
     serializer_class = UserDisplaySerializer
     permission_classes = [IsAuthenticated]
     lookup_field = "id"
 
+    def get_queryset(self):
+        return UserDisplaySerializer.narrow_queryset(
+            super().get_queryset(), self.request
+        )
+
     @should_be_admin()
     def get(self, request, *args, **kwargs):
         return self.retrieve(request, *args, **kwargs)
@@ -89,10 +105,43 @@ class UserView(mixins.RetrieveModelMixin, generics.GenericAPIView):
 class UserProfileView(mixins.RetrieveModelMixin, generics.GenericAPIView):
     """Get another user profile view"""
 
-    queryset = User.objects.all()
+    queryset = User.objects.select_related("profile")
     serializer_class = UserProfileSerializer
     permission_classes = [IsAuthenticated]
     lookup_field = "id"
 
+    def get_queryset(self):
+        return UserProfileSerializer.narrow_queryset(
+            super().get_queryset(), self.request
+        )
+
+    @conditional_get(get_user_profile_versions)
     def get(self, request, *args, **kwargs):
         return self.retrieve(request, *args, **kwargs)
+
+
+class FollowView(generics.GenericAPIView):
+    """Follow and unfollow another user view"""
+
+    queryset = User.objects.only("pkid")
+    permission_classes = [IsAuthenticated]
+    lookup_field = "id"
+
+    def post(self, request, *args, **kwargs):
+        user = self.get_object()
+
+        if user.pk == request.user.pk:
+            return Response(
+                {"detail": errors["follow"]["self"]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        Follow.objects.get_or_create(follower=request.user, followed=user)
+
+        return Response({"following": True}, status=status.HTTP_200_OK)
+
+    def delete(self, request, *args, **kwargs):
+        user = self.get_object()
+        Follow.objects.filter(follower=request.user, followed=user).delete()
+
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -36,6 +36,7 @@ DJANGO_APPS = [
     "django.contrib.messages",
     "django.contrib.staticfiles",
     "django.contrib.sites",
+    "django.contrib.postgres",
 ]
 
 THIRD_PARTY_APPS = [
@@ -190,6 +191,27 @@ RQ_QUEUES = {
     },
 }
 
+# Jobs rescheduling themselves on the RQ scheduler, path: interval in seconds.
+# Started by the schedule_periodic_jobs command.
+RQ_PERIODIC_JOBS = {
+    "apps.articles.counters.flush_article_views": 60,
+    "apps.common.mail.resume_email_delivery": 30,
+}
+
+# Cache
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": f"redis://{env('REDIS_HOST')}:{env('REDIS_PORT')}/1",
+    },
+}
+
+# Redis holding counters and rankings, see apps.common.store
+STORE = {
+    "BACKEND": "redis.Redis",
+    "LOCATION": f"redis://{env('REDIS_HOST')}:{env('REDIS_PORT')}/2",
+}
+
 # Mail
 EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
 EMAIL_HOST = env("EMAIL_HOST")
@@ -197,18 +219,35 @@ EMAIL_HOST_USER = env("EMAIL_HOST_USER")
 EMAIL_HOST_PASSWORD = env("EMAIL_HOST_PASSWORD")
 EMAIL_PORT = env("EMAIL_PORT")
 EMAIL_USE_TLS = True
+EMAIL_TIMEOUT = 10
 DEFAULT_FROM_EMAIL = env("DEFAULT_FROM_EMAIL")
 
 # REST_FRAMEWORK
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "apps.users.authentication.CachedJWTAuthentication",
     ],
     "DEFAULT_FILTER_BACKENDS": [
         "rest_framework.filters.SearchFilter",
         "rest_framework.filters.OrderingFilter",
     ],
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.LimitOffsetPagination",
+    "DEFAULT_PAGINATION_CLASS": "apps.common.pagination.KeysetOrOffsetPagination",
+    "DEFAULT_RENDERER_CLASSES": [
+        "apps.common.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "rest_framework.parsers.JSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
+    # Proxies in front of the API appending to X-Forwarded-For. With none,
+    # throttles key clients on REMOTE_ADDR and ignore the spoofable header.
+    "NUM_PROXIES": env.int("NUM_PROXIES", default=0),
 }
 
+# Build read serializer output with precompiled field readers, see
+# apps.common.serializers.CompiledRepresentationMixin
+COMPILED_SERIALIZERS = True
+
 SIMPLE_JWT = {"ACCESS_TOKEN_LIFETIME": datetime.timedelta(days=1)}
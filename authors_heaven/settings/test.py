@@ -0,0 +1,11 @@
+from .development import *
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+}
+
+STORE = {
+    "BACKEND": "apps.common.store.MemoryStore",
+}
@@ -1,6 +1,8 @@
 import json
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from apps.articles.models import Article
@@ -219,3 +221,318 @@ class TestUpdateArticleEndpoint:
 
         assert response.status_code == 404
         assert response.json()["detail"] == "Not found."
+
+
+@pytest.mark.django_db
+class TestSearchArticlesEndpoint:
+    """Test search articles endpoint"""
+
+    url = reverse("all-articles")
+
+    def test_search_articles_by_title_succeeds(self, admin_api_client, base_article):
+        response = admin_api_client.get(self.url, {"search": base_article.title})
+
+        assert response.status_code == 200
+        assert len(response.json()) == 1
+        assert response.json()[0]["slug"] == base_article.slug
+        assert "rank" in response.json()[0]
+        assert "headline" in response.json()[0]
+
+    def test_search_articles_by_tag_succeeds(self, admin_api_client, base_article):
+        response = admin_api_client.get(self.url, {"search": "tag1"})
+
+        assert response.status_code == 200
+        assert len(response.json()) == 1
+
+    def test_search_articles_by_author_succeeds(self, admin_api_client, base_article):
+        response = admin_api_client.get(
+            self.url, {"search": base_article.author.last_name}
+        )
+
+        assert response.status_code == 200
+        assert len(response.json()) == 1
+
+    def test_search_articles_with_cursor_is_paginated_by_offset(
+        self, admin_api_client, article_factory, base_user
+    ):
+        article_factory.create_batch(3, author=base_user)
+        response = admin_api_client.get(
+            self.url, {"search": "new-title", "cursor": "", "limit": 2}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["count"] == 3
+        assert len(response.json()["results"]) == 2
+        assert "offset=2" in response.json()["next"]
+
+    def test_search_articles_without_match_returns_nothing(
+        self, admin_api_client, base_article
+    ):
+        response = admin_api_client.get(self.url, {"search": "unmatchedterm"})
+
+        assert response.status_code == 200
+        assert len(response.json()) == 0
+
+
+@pytest.mark.django_db
+class TestPaginateArticlesEndpoint:
+    """Test paginate articles endpoint"""
+
+    url = reverse("all-articles")
+
+    def test_get_articles_with_offset_pagination_succeeds(
+        self, admin_api_client, article_factory, base_user
+    ):
+        article_factory.create_batch(3, author=base_user)
+        response = admin_api_client.get(self.url, {"limit": 2, "offset": 2})
+
+        assert response.status_code == 200
+        assert response.json()["count"] == 3
+        assert len(response.json()["results"]) == 1
+
+    def test_get_articles_with_cursor_pagination_succeeds(
+        self, admin_api_client, article_factory, base_user
+    ):
+        articles = article_factory.create_batch(3, author=base_user)
+        response = admin_api_client.get(self.url, {"cursor": "", "limit": 2})
+
+        assert response.status_code == 200
+        assert "count" not in response.json()
+        assert response.json()["previous"] is None
+        assert [article["slug"] for article in response.json()["results"]] == [
+            articles[2].slug,
+            articles[1].slug,
+        ]
+
+        response = admin_api_client.get(response.json()["next"])
+
+        assert response.status_code == 200
+        assert response.json()["next"] is None
+        assert response.json()["previous"] is not None
+        assert [article["slug"] for article in response.json()["results"]] == [
+            articles[0].slug
+        ]
+
+    def test_get_articles_with_cursor_pagination_and_total_succeeds(
+        self, admin_api_client, article_factory, base_user
+    ):
+        article_factory.create_batch(3, author=base_user)
+        response = admin_api_client.get(
+            self.url, {"cursor": "", "limit": 2, "include_total": "true"}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["count"] == 3
+        assert len(response.json()["results"]) == 2
+
+    def test_get_articles_with_invalid_cursor_fails(self, admin_api_client):
+        response = admin_api_client.get(self.url, {"cursor": "invalid"})
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Invalid cursor"
+
+
+@pytest.mark.django_db
+class TestConditionalGetArticleEndpoint:
+    """Test conditional get single article endpoint"""
+
+    def test_get_article_returns_validators(self, admin_api_client, base_article):
+        url = get_article_dynamic_url()
+        response = admin_api_client.get(url)
+
+        assert response.status_code == 200
+        assert response.headers["ETag"]
+        assert response.headers["Last-Modified"]
+
+    def test_get_article_with_matching_etag_is_not_modified(
+        self, admin_api_client, base_article
+    ):
+        url = get_article_dynamic_url()
+        etag = admin_api_client.get(url).headers["ETag"]
+        response = admin_api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+
+    def test_get_article_with_last_modified_is_not_modified(
+        self, admin_api_client, base_article
+    ):
+        url = get_article_dynamic_url()
+        last_modified = admin_api_client.get(url).headers["Last-Modified"]
+        response = admin_api_client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        assert response.status_code == 304
+
+    def test_get_article_after_tag_change_is_modified(
+        self, admin_api_client, base_article
+    ):
+        url = get_article_dynamic_url()
+        etag = admin_api_client.get(url).headers["ETag"]
+        base_article.tags.add("tag3")
+        response = admin_api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    def test_get_article_after_author_change_is_modified(
+        self, admin_api_client, base_article
+    ):
+        url = get_article_dynamic_url()
+        etag = admin_api_client.get(url).headers["ETag"]
+        profile = base_article.author.profile
+        profile.city = "Kigali"
+        profile.save()
+        response = admin_api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+
+    def test_get_other_user_article_with_etag_fails(
+        self, auth_api_client, base_article
+    ):
+        url = get_article_dynamic_url()
+        response = auth_api_client.get(url, HTTP_IF_NONE_MATCH="*")
+
+        assert response.status_code == 404
+
+
+@pytest.mark.django_db
+class TestBulkCreateArticlesEndpoint:
+    """Test bulk create articles endpoint"""
+
+    url = reverse("bulk-articles")
+    article = {"title": "article 1", "body": "article 1 body", "tags": ["tag1", "tag2"]}
+
+    def test_bulk_create_articles_with_unauthorized_user_fails(self, auth_api_client):
+        auth_api_client.credentials()
+        data = json.dumps({"articles": [self.article]})
+        response = auth_api_client.post(
+            self.url, data=data, content_type=JSON_CONTENT_TYPE
+        )
+
+        assert response.status_code == 401
+
+    def test_bulk_create_articles_succeeds(self, auth_api_client):
+        data = json.dumps({"articles": [self.article, self.article]})
+        response = auth_api_client.post(
+            self.url, data=data, content_type=JSON_CONTENT_TYPE
+        )
+        results = response.json()["results"]
+
+        assert response.status_code == 201
+        assert [result["slug"] for result in results] == ["article-1", "article-1-1"]
+        assert Article.objects.count() == 2
+        assert sorted(Article.objects.first().tags.names()) == ["tag1", "tag2"]
+
+    def test_bulk_create_articles_with_partial_failure(self, auth_api_client):
+        data = json.dumps({"articles": [{"title": "article 1"}, self.article]})
+        response = auth_api_client.post(
+            self.url, data=data, content_type=JSON_CONTENT_TYPE
+        )
+        results = response.json()["results"]
+
+        assert response.status_code == 207
+        assert results[0]["status"] == 400
+        assert results[0]["errors"]["body"] == ["This field is required."]
+        assert results[1]["status"] == 201
+        assert Article.objects.count() == 1
+
+    def test_bulk_create_articles_with_only_invalid_items_fails(self, auth_api_client):
+        data = json.dumps({"articles": [{"title": "article 1"}]})
+        response = auth_api_client.post(
+            self.url, data=data, content_type=JSON_CONTENT_TYPE
+        )
+
+        assert response.status_code == 400
+        assert Article.objects.count() == 0
+
+    def test_bulk_create_articles_without_articles_fails(self, auth_api_client):
+        data = json.dumps({"articles": []})
+        response = auth_api_client.post(
+            self.url, data=data, content_type=JSON_CONTENT_TYPE
+        )
+
+        assert response.status_code == 400
+        assert response.json()["articles"] == ["This list may not be empty."]
+
+    def test_bulk_create_articles_uses_constant_queries(
+        self, auth_api_client, django_assert_max_num_queries
+    ):
+        data = json.dumps({"articles": [self.article] * 20})
+
+        with django_assert_max_num_queries(12):
+            response = auth_api_client.post(
+                self.url, data=data, content_type=JSON_CONTENT_TYPE
+            )
+
+        assert response.status_code == 201
+
+
+@pytest.mark.django_db
+class TestArticleSummary:
+    """Test article body summary"""
+
+    url = reverse("all-articles")
+
+    def test_get_all_articles_returns_summary_without_body(
+        self, admin_api_client, article_factory, base_user
+    ):
+        article_factory.create(body="word " * 450, author=base_user)
+        response = admin_api_client.get(self.url)
+        article = response.json()[0]
+
+        assert response.status_code == 200
+        assert "body" not in article
+        assert article["word_count"] == 450
+        assert article["reading_time"] == 3
+        assert article["excerpt"].endswith("…")
+        assert len(article["excerpt"].split()) == 50
+
+    def test_update_article_body_updates_summary(self, admin_api_client, base_article):
+        url = get_article_dynamic_url()
+        data = json.dumps({"body": "short body"})
+        admin_api_client.patch(url, data=data, content_type=JSON_CONTENT_TYPE)
+        base_article.refresh_from_db()
+
+        assert base_article.excerpt == "short body"
+        assert base_article.word_count == 2
+        assert base_article.reading_time == 1
+
+
+@pytest.mark.django_db
+class TestSparseFieldsetsArticlesEndpoints:
+    """Test sparse fieldsets on articles endpoints"""
+
+    url = reverse("all-articles")
+
+    def test_get_all_articles_with_fields_succeeds(
+        self, admin_api_client, base_article
+    ):
+        with CaptureQueriesContext(connection) as context:
+            response = admin_api_client.get(self.url, {"fields": "slug,title"})
+
+        assert response.status_code == 200
+        assert response.json() == [
+            {"slug": base_article.slug, "title": base_article.title}
+        ]
+        articles_query = context.captured_queries[-1]["sql"]
+        assert "profiles_profile" not in articles_query
+        assert "excerpt" not in articles_query
+        assert "taggit" not in articles_query
+
+    def test_get_all_articles_with_omit_succeeds(self, admin_api_client, base_article):
+        response = admin_api_client.get(self.url, {"omit": "author,tags"})
+
+        assert response.status_code == 200
+        assert "author" not in response.json()[0]
+        assert "tags" not in response.json()[0]
+        assert response.json()[0]["slug"] == base_article.slug
+
+    def test_get_article_with_fields_succeeds(self, admin_api_client, base_article):
+        url = get_article_dynamic_url()
+        admin_api_client.get(url)
+        cached_response = admin_api_client.get(url, {"fields": "body"})
+        base_article.save()
+        response = admin_api_client.get(url, {"fields": "body"})
+
+        assert cached_response.json() == {"body": base_article.body}
+        assert response.json() == {"body": base_article.body}
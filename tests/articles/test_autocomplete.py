@@ -0,0 +1,88 @@
+import pytest
+from django.urls import reverse
+
+from apps.users.models import User
+
+from ..utils import count_queries
+
+
+@pytest.mark.django_db
+class TestAutocompleteEndpoint:
+    """Test the autocomplete endpoint"""
+
+    url = reverse("autocomplete")
+
+    @pytest.fixture(autouse=True)
+    def suggestions(self, auth_api_client, article_factory, user_factory):
+        user = User.objects.get(email="active@example.com")
+        user.username = "pythonista"
+        user.save()
+        other = user_factory.create(username="pyhton", email="other@example.com")
+        article_factory.create(author=user, title="Python tips", tags=["python"])
+        article_factory.create(author=user, title="Py", tags=["pytest", "rust"])
+        article_factory.create(author=user, title="Learning Python", tags=["go"])
+        article_factory.create(author=other, title="Python secrets", tags=["go"])
+
+    def test_autocomplete_with_unauthorized_user_fails(self, api_client):
+        response = api_client.get(self.url, {"q": "py"})
+
+        assert response.status_code == 401
+
+    def test_autocomplete_suggests_prefix_matches(self, auth_api_client):
+        response = auth_api_client.get(self.url, {"q": "PY"})
+        data = response.json()
+
+        assert response.status_code == 200
+        assert [title["title"] for title in data["titles"]] == ["Py", "Python tips"]
+        assert data["titles"][0]["slug"] == "py"
+        assert data["tags"] == ["pytest", "python"]
+        assert [user["username"] for user in data["usernames"]] == ["pythonista"]
+
+    def test_autocomplete_limits_the_suggestions(self, auth_api_client):
+        response = auth_api_client.get(self.url, {"q": "py", "limit": 1})
+
+        assert response.json()["titles"] == [{"title": "Py", "slug": "py"}]
+        assert response.json()["tags"] == ["pytest"]
+
+    def test_autocomplete_suggests_all_titles_to_admins(self, auth_api_client):
+        User.objects.filter(email="active@example.com").update(is_admin=True)
+        response = auth_api_client.get(self.url, {"q": "python"})
+
+        assert [title["title"] for title in response.json()["titles"]] == [
+            "Python tips",
+            "Python secrets",
+        ]
+
+    def test_autocomplete_suggests_other_usernames_to_admins_only(
+        self, auth_api_client, user_factory, django_capture_on_commit_callbacks
+    ):
+        other = user_factory.create(username="pyrate", email="pyrate@example.com")
+        User.objects.filter(pkid=other.pkid).update(is_active=True)
+        response = auth_api_client.get(self.url, {"q": "py"})
+
+        assert [user["username"] for user in response.json()["usernames"]] == [
+            "pythonista"
+        ]
+
+        user = User.objects.get(email="active@example.com")
+        user.is_admin = True
+
+        with django_capture_on_commit_callbacks(execute=True):
+            user.save()
+
+        response = auth_api_client.get(self.url, {"q": "pyr"})
+
+        assert [user["username"] for user in response.json()["usernames"]] == ["pyrate"]
+
+    def test_autocomplete_results_are_cached(self, auth_api_client):
+        auth_api_client.get(self.url, {"q": "py"})
+        response, queries = count_queries(auth_api_client.get, self.url, {"q": "Py"})
+
+        assert response.json()["tags"] == ["pytest", "python"]
+        assert queries == 0
+
+    def test_autocomplete_without_query_fails(self, auth_api_client):
+        response = auth_api_client.get(self.url, {"q": " "})
+
+        assert response.status_code == 400
+        assert "q" in response.json()
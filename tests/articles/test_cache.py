@@ -0,0 +1,90 @@
+import json
+
+import pytest
+
+from apps.articles.cache import get_cached_article
+from apps.users.models import User
+from tests.constants import JSON_CONTENT_TYPE
+
+from ..utils import count_queries, get_article_dynamic_url
+
+HOST = "testserver"
+# Conditional get versions, the user is served by the authentication cache
+CACHED_ARTICLE_QUERY_BUDGET = 1
+
+
+@pytest.mark.django_db
+class TestArticleCache:
+    """Test article response cache"""
+
+    def test_get_article_is_served_from_cache(self, admin_api_client, base_article):
+        url = get_article_dynamic_url()
+        first_response = admin_api_client.get(url)
+        response, queries = count_queries(admin_api_client.get, url)
+
+        assert response.status_code == 200
+        assert response.json() == first_response.json()
+        assert queries == CACHED_ARTICLE_QUERY_BUDGET
+
+    def test_cached_article_is_not_served_to_other_users(
+        self, admin_api_client, base_article, django_capture_on_commit_callbacks
+    ):
+        url = get_article_dynamic_url()
+        admin_api_client.get(url)
+        admin = User.objects.get(is_admin=True)
+        admin.is_admin = False
+
+        with django_capture_on_commit_callbacks(execute=True):
+            admin.save()
+
+        response = admin_api_client.get(url)
+
+        assert response.status_code == 404
+
+    def test_update_article_writes_through_cache(self, admin_api_client, base_article):
+        url = get_article_dynamic_url()
+        admin_api_client.get(url)
+        data = json.dumps({"title": "updated-title"})
+        admin_api_client.patch(url, data=data, content_type=JSON_CONTENT_TYPE)
+        response, queries = count_queries(admin_api_client.get, url)
+
+        assert response.json()["title"] == "updated-title"
+        assert queries == CACHED_ARTICLE_QUERY_BUDGET
+
+    def test_tag_change_invalidates_cache(
+        self, admin_api_client, base_article, django_capture_on_commit_callbacks
+    ):
+        url = get_article_dynamic_url()
+        admin_api_client.get(url)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            base_article.tags.add("tag3")
+
+        assert get_cached_article(base_article.slug, HOST) == (None, None, None)
+        assert "tag3" in admin_api_client.get(url).json()["tags"]
+
+    def test_author_change_invalidates_cache(
+        self, admin_api_client, base_article, django_capture_on_commit_callbacks
+    ):
+        url = get_article_dynamic_url()
+        admin_api_client.get(url)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            base_article.author.first_name = "Renamed"
+            base_article.author.save()
+
+        assert admin_api_client.get(url).json()["author"]["first_name"] == "Renamed"
+
+    def test_profile_change_invalidates_cache(
+        self, admin_api_client, base_article, django_capture_on_commit_callbacks
+    ):
+        url = get_article_dynamic_url()
+        admin_api_client.get(url)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            base_article.author.profile.avatar = "avatar.png"
+            base_article.author.profile.save()
+
+        assert (
+            admin_api_client.get(url).json()["author"]["avatar"].endswith("avatar.png")
+        )
@@ -0,0 +1,145 @@
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.articles.counters import (
+    ARTICLE_VIEWS_KEY,
+    ARTICLE_VIEWS_PROCESSING_KEY,
+    flush_article_views,
+    get_article_view_count,
+    record_article_view,
+)
+from apps.articles.helpers.bulk import bulk_create_articles
+from apps.articles.models import Article
+from apps.common.store import get_store
+
+from ..utils import get_article_dynamic_url
+
+
+@pytest.mark.django_db
+class TestArticleViewCounters:
+    """Test buffered article view counters"""
+
+    def test_recorded_views_are_buffered(self, base_article):
+        record_article_view(base_article.pkid)
+        record_article_view(base_article.pkid)
+        base_article.refresh_from_db()
+
+        assert base_article.view_count == 0
+        assert get_article_view_count(base_article) == 2
+
+    def test_flush_adds_views_with_one_update(self, article_factory, base_user):
+        articles = article_factory.create_batch(3, author=base_user)
+
+        for article in articles:
+            record_article_view(article.pkid)
+
+        record_article_view(articles[0].pkid)
+
+        with CaptureQueriesContext(connection) as context:
+            assert flush_article_views() == 3
+
+        updates = [
+            query for query in context.captured_queries if "UPDATE" in query["sql"]
+        ]
+        views = dict(Article.objects.values_list("pkid", "view_count"))
+
+        assert len(updates) == 1
+        assert views == {articles[0].pkid: 2, articles[1].pkid: 1, articles[2].pkid: 1}
+        assert get_store().hgetall(ARTICLE_VIEWS_KEY) == {}
+
+    def test_flush_adds_to_flushed_views(self, base_article):
+        record_article_view(base_article.pkid)
+        flush_article_views()
+        record_article_view(base_article.pkid)
+        flush_article_views()
+        base_article.refresh_from_db()
+
+        assert base_article.view_count == 2
+        assert get_article_view_count(base_article) == 2
+
+    def test_flush_without_views(self):
+        assert flush_article_views() == 0
+
+    def test_failed_flush_keeps_views_buffered(self, base_article):
+        record_article_view(base_article.pkid)
+
+        with patch(
+            "apps.articles.counters.add_article_views", side_effect=RuntimeError
+        ):
+            with pytest.raises(RuntimeError):
+                flush_article_views()
+
+        assert get_article_view_count(base_article) == 1
+
+    def test_views_of_a_killed_flush_are_flushed_next(self, base_article):
+        record_article_view(base_article.pkid)
+
+        with patch("apps.articles.counters.add_article_views", side_effect=SystemExit):
+            with pytest.raises(SystemExit):
+                flush_article_views()
+
+        record_article_view(base_article.pkid)
+
+        assert flush_article_views() == 1
+        base_article.refresh_from_db()
+        assert base_article.view_count == 1
+        assert get_article_view_count(base_article) == 2
+
+        flush_article_views()
+        base_article.refresh_from_db()
+
+        assert base_article.view_count == 2
+        assert get_store().hgetall(ARTICLE_VIEWS_PROCESSING_KEY) == {}
+
+    def test_save_keeps_flushed_views(self, base_article):
+        record_article_view(base_article.pkid)
+        flush_article_views()
+        base_article.title = "Updated title"
+        base_article.save()
+        base_article.refresh_from_db()
+
+        assert base_article.title == "Updated title"
+        assert base_article.view_count == 1
+
+    def test_save_of_a_bulk_created_article_keeps_flushed_views(self, base_user):
+        [article] = bulk_create_articles(base_user, [{"title": "one", "body": "body"}])
+        Article.objects.filter(pkid=article.pkid).update(view_count=10)
+        article.title = "Updated title"
+        article.save()
+        article.refresh_from_db()
+
+        assert article.title == "Updated title"
+        assert article.view_count == 10
+
+
+@pytest.mark.django_db
+class TestArticleViewCountEndpoint:
+    """Test article view count endpoint"""
+
+    def test_article_views_are_counted(self, admin_api_client, base_article):
+        url = get_article_dynamic_url()
+        admin_api_client.get(url)
+        # Served from the cache
+        admin_api_client.get(url)
+        response = admin_api_client.get(
+            reverse("article-views", args=[base_article.slug])
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"views": 2}
+
+    def test_get_views_of_other_user_article_fails(self, auth_api_client, base_article):
+        response = auth_api_client.get(
+            reverse("article-views", args=[base_article.slug])
+        )
+
+        assert response.status_code == 404
+
+    def test_get_views_with_unauthorized_user_fails(self, api_client, base_article):
+        response = api_client.get(reverse("article-views", args=[base_article.slug]))
+
+        assert response.status_code == 401
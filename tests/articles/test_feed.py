@@ -0,0 +1,211 @@
+import pytest
+from django.urls import reverse
+
+from apps.articles import feed
+from apps.articles.feed import (
+    POPULAR_AUTHORS_KEY,
+    fan_out_articles,
+    get_feed_key,
+    get_feed_page,
+)
+from apps.common.store import get_store
+from apps.users.models import Follow, User
+
+
+@pytest.fixture
+def authors(db, user_factory):
+    return [
+        user_factory.create(username=f"author{index}", email=f"a{index}@example.com")
+        for index in range(2)
+    ]
+
+
+@pytest.fixture
+def follower(db, user_factory):
+    return user_factory.create(username="follower", email="follower@example.com")
+
+
+@pytest.fixture
+def follow(django_capture_on_commit_callbacks):
+    def follow(follower, *authors):
+        with django_capture_on_commit_callbacks(execute=True):
+            for author in authors:
+                Follow.objects.create(follower=follower, followed=author)
+
+    return follow
+
+
+@pytest.mark.django_db
+class TestFeedTimelines:
+    """Test the per user feed timelines"""
+
+    def test_new_articles_are_fanned_out_to_followers(
+        self, authors, follower, article_factory, follow
+    ):
+        follow(follower, *authors)
+        first = article_factory.create(author=authors[0])
+        second = article_factory.create(author=authors[1])
+        other = article_factory.create()
+
+        assert fan_out_articles(authors[0].pkid, [first.pkid]) == 1
+        assert fan_out_articles(authors[1].pkid, [second.pkid]) == 1
+        assert fan_out_articles(other.author_id, [other.pkid]) == 0
+        assert get_feed_page(follower, 10) == ([second.pkid, first.pkid], False)
+
+    def test_feed_pages_are_read_before_a_pkid(
+        self, authors, follower, article_factory, follow
+    ):
+        articles = article_factory.create_batch(3, author=authors[0])
+        follow(follower, authors[0])
+
+        pkids, has_next = get_feed_page(follower, 2)
+
+        assert pkids == [articles[2].pkid, articles[1].pkid]
+        assert has_next
+        assert get_feed_page(follower, 2, before=pkids[-1]) == (
+            [articles[0].pkid],
+            False,
+        )
+
+    def test_timelines_are_trimmed(self, monkeypatch, authors, follower, follow):
+        monkeypatch.setattr(feed, "FEED_LENGTH", 2)
+        follow(follower, authors[0])
+        fan_out_articles(authors[0].pkid, [1, 2, 3])
+
+        assert get_store().zrevrangebyscore(
+            get_feed_key(follower.pkid), "+inf", "-inf"
+        ) == ["3", "2"]
+
+    def test_unfollowing_removes_the_author_articles(
+        self,
+        authors,
+        follower,
+        article_factory,
+        follow,
+        django_capture_on_commit_callbacks,
+    ):
+        kept = article_factory.create(author=authors[0])
+        removed = article_factory.create(author=authors[1])
+        follow(follower, *authors)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Follow.objects.filter(followed=authors[1]).delete()
+
+        assert removed.pkid not in get_feed_page(follower, 10)[0]
+        assert get_feed_page(follower, 10) == ([kept.pkid], False)
+
+    def test_popular_authors_are_read_from_the_database(
+        self,
+        monkeypatch,
+        authors,
+        follower,
+        article_factory,
+        follow,
+    ):
+        monkeypatch.setattr(feed, "FAN_OUT_LIMIT", 0)
+        follow(follower, *authors)
+        popular = article_factory.create(author=authors[0])
+
+        assert fan_out_articles(authors[0].pkid, [popular.pkid]) == 0
+        assert get_store().smembers(POPULAR_AUTHORS_KEY) == {str(authors[0].pkid)}
+        assert (
+            get_store().zrevrangebyscore(get_feed_key(follower.pkid), "+inf", "-inf")
+            == []
+        )
+
+        fanned_out = article_factory.create(author=authors[1])
+        get_store().srem(POPULAR_AUTHORS_KEY, authors[1].pkid)
+        monkeypatch.setattr(feed, "FAN_OUT_LIMIT", 10)
+        fan_out_articles(authors[1].pkid, [fanned_out.pkid])
+
+        assert get_feed_page(follower, 10) == ([fanned_out.pkid, popular.pkid], False)
+        assert get_feed_page(follower, 1, before=fanned_out.pkid) == (
+            [popular.pkid],
+            False,
+        )
+
+
+@pytest.mark.django_db
+class TestFeedEndpoint:
+    """Test the feed endpoint"""
+
+    url = reverse("articles-feed")
+
+    def test_feed_with_unauthorized_user_fails(self, api_client):
+        response = api_client.get(self.url)
+
+        assert response.status_code == 401
+
+    def test_feed_lists_published_articles_of_followed_authors(
+        self, auth_api_client, follower, follow, django_capture_on_commit_callbacks
+    ):
+        user = User.objects.get(email="active@example.com")
+        follow(follower, user)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            for title in ["first", "second", "third"]:
+                auth_api_client.post(
+                    reverse("all-articles"), {"title": title, "body": "body"}
+                )
+
+        follower.is_admin = True
+        follower.save()
+        auth_api_client.force_authenticate(follower)
+        response = auth_api_client.get(self.url, {"limit": 2})
+        data = response.json()
+
+        assert response.status_code == 200
+        assert [article["title"] for article in data["results"]] == ["third", "second"]
+        assert "body" not in data["results"][0]
+        assert data["results"][0]["author"]["id"] == str(user.id)
+
+        response = auth_api_client.get(data["next"])
+        data = response.json()
+
+        assert [article["title"] for article in data["results"]] == ["first"]
+        assert data["next"] is None
+
+    def test_feed_includes_bulk_created_articles(
+        self, auth_api_client, follower, follow, django_capture_on_commit_callbacks
+    ):
+        user = User.objects.get(email="active@example.com")
+        follow(follower, user)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            auth_api_client.post(
+                reverse("bulk-articles"),
+                {"articles": [{"title": "one", "body": "body"}]},
+                format="json",
+            )
+
+        follower.is_admin = True
+        follower.save()
+        auth_api_client.force_authenticate(follower)
+        response = auth_api_client.get(self.url)
+
+        assert [article["title"] for article in response.json()["results"]] == ["one"]
+
+    def test_feed_leaves_out_the_articles_the_user_cannot_see(
+        self, auth_api_client, follower, follow, django_capture_on_commit_callbacks
+    ):
+        user = User.objects.get(email="active@example.com")
+        follow(follower, user)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            auth_api_client.post(reverse("all-articles"), {"title": "one", "body": "b"})
+
+        slug = user.articles.get().slug
+        auth_api_client.force_authenticate(follower)
+        response = auth_api_client.get(self.url)
+
+        assert response.json()["results"] == []
+        assert (
+            auth_api_client.get(reverse("single-article", args=[slug])).status_code
+            == 404
+        )
+
+    def test_feed_with_invalid_before_fails(self, auth_api_client):
+        response = auth_api_client.get(self.url, {"before": "latest"})
+
+        assert response.status_code == 400
+        assert "before" in response.json()
@@ -0,0 +1,47 @@
+import pytest
+from django.urls import reverse
+
+from ..utils import count_queries, get_article_dynamic_url
+
+# Authentication + articles (joined with author and profile) + tags
+ARTICLES_QUERY_BUDGET = 3
+# Same as above plus the COUNT(*) of limit/offset pagination
+PAGINATED_ARTICLES_QUERY_BUDGET = 4
+# Authentication + versions + article (joined with author and profile) + tags
+ARTICLE_QUERY_BUDGET = 4
+
+
+@pytest.mark.django_db
+class TestArticlesQueryBudget:
+    """Test articles endpoints query budget"""
+
+    url = reverse("all-articles")
+
+    @pytest.mark.parametrize("size", [1, 10])
+    def test_get_all_articles_query_budget(
+        self, admin_api_client, article_factory, base_user, size
+    ):
+        article_factory.create_batch(size, author=base_user)
+        response, queries = count_queries(admin_api_client.get, self.url)
+
+        assert response.status_code == 200
+        assert len(response.json()) == size
+        assert queries == ARTICLES_QUERY_BUDGET
+
+    @pytest.mark.parametrize("size", [1, 10])
+    def test_get_paginated_articles_query_budget(
+        self, admin_api_client, article_factory, base_user, size
+    ):
+        article_factory.create_batch(size, author=base_user)
+        response, queries = count_queries(admin_api_client.get, self.url, {"limit": 20})
+
+        assert response.status_code == 200
+        assert len(response.json()["results"]) == size
+        assert queries == PAGINATED_ARTICLES_QUERY_BUDGET
+
+    def test_get_article_query_budget(self, admin_api_client, base_article):
+        url = get_article_dynamic_url()
+        response, queries = count_queries(admin_api_client.get, url)
+
+        assert response.status_code == 200
+        assert queries == ARTICLE_QUERY_BUDGET
@@ -0,0 +1,198 @@
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+
+from apps.articles import related
+from apps.articles.models import Article
+from apps.articles.related import get_containing_key, get_related_key, get_related_pkids
+from apps.common.store import get_store
+from apps.users.models import User
+
+
+@pytest.fixture
+def create_article(article_factory, django_capture_on_commit_callbacks):
+    def create_article(tags, **kwargs):
+        with django_capture_on_commit_callbacks(execute=True):
+            return article_factory.create(tags=tags, **kwargs)
+
+    return create_article
+
+
+@pytest.mark.django_db
+class TestRelatedArticlesIndex:
+    """Test the related articles index"""
+
+    def test_articles_are_ranked_by_shared_tags(self, base_user, create_article):
+        article = create_article(["a", "b", "c"], author=base_user)
+        one = create_article(["a", "x"], author=base_user)
+        two = create_article(["a", "b", "x"], author=base_user)
+        create_article(["y"], author=base_user)
+
+        assert get_related_pkids(article.pkid) == [two.pkid, one.pkid]
+        assert get_related_pkids(one.pkid) == [two.pkid, article.pkid]
+        assert get_related_pkids(article.pkid, limit=1) == [two.pkid]
+
+    def test_index_follows_tag_changes(
+        self, base_user, create_article, django_capture_on_commit_callbacks
+    ):
+        article = create_article(["a", "b"], author=base_user)
+        other = create_article(["b"], author=base_user)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            article.tags.remove("b")
+
+        assert get_related_pkids(article.pkid) == []
+        assert get_related_pkids(other.pkid) == []
+
+        with django_capture_on_commit_callbacks(execute=True):
+            other.tags.add("a")
+
+        assert get_related_pkids(article.pkid) == [other.pkid]
+        assert get_related_pkids(other.pkid) == [article.pkid]
+
+    def test_deleted_articles_are_removed_from_the_index(
+        self, base_user, create_article, django_capture_on_commit_callbacks
+    ):
+        article = create_article(["a"], author=base_user)
+        other = create_article(["a"], author=base_user)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            other.delete()
+
+        assert get_related_pkids(article.pkid) == []
+        assert get_store().zrevrange(get_related_key(other.pkid), 0, -1) == []
+
+    def test_bulk_created_articles_are_indexed(
+        self, auth_api_client, django_capture_on_commit_callbacks
+    ):
+        with django_capture_on_commit_callbacks(execute=True):
+            auth_api_client.post(
+                reverse("bulk-articles"),
+                {
+                    "articles": [
+                        {"title": "one", "body": "body", "tags": ["a"]},
+                        {"title": "two", "body": "body", "tags": ["a", "b"]},
+                    ]
+                },
+                format="json",
+            )
+
+        one, two = Article.objects.order_by("pkid")
+
+        assert get_related_pkids(one.pkid) == [two.pkid]
+
+    def test_index_keeps_the_articles_sharing_the_most_tags(
+        self, monkeypatch, base_user, create_article
+    ):
+        monkeypatch.setattr(related, "RELATED_INDEX_SIZE", 2)
+        article = create_article(["a", "b", "c"], author=base_user)
+        best = create_article(["a", "b", "c"], author=base_user)
+        good = create_article(["a", "b"], author=base_user)
+        others = [create_article(["a"], author=base_user) for _ in range(3)]
+        store = get_store()
+
+        assert get_related_pkids(article.pkid) == [best.pkid, good.pkid]
+        assert all(
+            len(store.zrevrange(get_related_key(pkid), 0, -1)) <= 2
+            for pkid in [article.pkid, best.pkid, good.pkid]
+            + [other.pkid for other in others]
+        )
+
+    def test_trimmed_articles_are_removed_when_their_tags_change(
+        self, monkeypatch, base_user, create_article, django_capture_on_commit_callbacks
+    ):
+        monkeypatch.setattr(related, "RELATED_INDEX_SIZE", 1)
+        other = create_article(["z"], author=base_user)
+        article = create_article(["z", "y", "w"], author=base_user)
+        best = create_article(["y", "w"], author=base_user)
+
+        assert get_related_pkids(article.pkid) == [best.pkid]
+        assert get_related_pkids(other.pkid) == [article.pkid]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            article.tags.set(["y", "w"])
+
+        assert get_related_pkids(other.pkid) == []
+        assert get_related_pkids(article.pkid) == [best.pkid]
+
+    def test_trimmed_deleted_articles_are_removed_from_the_index(
+        self, monkeypatch, base_user, create_article, django_capture_on_commit_callbacks
+    ):
+        monkeypatch.setattr(related, "RELATED_INDEX_SIZE", 1)
+        other = create_article(["z"], author=base_user)
+        article = create_article(["z", "y"], author=base_user)
+        create_article(["z", "y"], author=base_user)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            article.delete()
+
+        assert article.pkid not in get_related_pkids(other.pkid)
+        assert get_store().smembers(get_containing_key(article.pkid)) == set()
+
+    def test_index_is_rebuilt_by_the_command(self, base_user, create_article):
+        article = create_article(["a"], author=base_user)
+        other = create_article(["a"], author=base_user)
+        get_store().flushall()
+
+        call_command("index_related_articles")
+
+        assert get_related_pkids(article.pkid) == [other.pkid]
+
+
+@pytest.mark.django_db
+class TestRelatedArticlesEndpoint:
+    """Test the related articles endpoint"""
+
+    def test_get_related_articles_succeeds(self, auth_api_client, create_article):
+        user = User.objects.get(email="active@example.com")
+        article = create_article(["a", "b"], author=user)
+        create_article(["a"], author=user, title="one")
+        create_article(["a", "b"], author=user, title="two")
+        url = reverse("related-articles", args=[article.slug])
+
+        response = auth_api_client.get(url)
+        results = response.json()["results"]
+
+        assert response.status_code == 200
+        assert [result["title"] for result in results] == ["two", "one"]
+        assert "body" not in results[0]
+
+        response = auth_api_client.get(url, {"limit": 1})
+
+        assert [result["title"] for result in response.json()["results"]] == ["two"]
+
+    def test_get_related_articles_skips_the_ones_of_others(
+        self, auth_api_client, user_factory, create_article
+    ):
+        user = User.objects.get(email="active@example.com")
+        author = user_factory.create(username="author", email="author@example.com")
+        article = create_article(["a", "b", "c"], author=user)
+
+        for _ in range(3):
+            create_article(["a", "b", "c"], author=author)
+
+        create_article(["a"], author=user, title="mine")
+        url = reverse("related-articles", args=[article.slug])
+        response = auth_api_client.get(url, {"limit": 1})
+
+        assert [result["title"] for result in response.json()["results"]] == ["mine"]
+
+    def test_get_related_articles_of_others_fails(
+        self, auth_api_client, user_factory, create_article
+    ):
+        author = user_factory.create(username="author", email="author@example.com")
+        article = create_article(["a"], author=author)
+        response = auth_api_client.get(reverse("related-articles", args=[article.slug]))
+
+        assert response.status_code == 404
+
+    def test_get_related_articles_with_invalid_limit_fails(
+        self, auth_api_client, create_article
+    ):
+        user = User.objects.get(email="active@example.com")
+        article = create_article(["a"], author=user)
+        url = reverse("related-articles", args=[article.slug])
+        response = auth_api_client.get(url, {"limit": 100})
+
+        assert response.status_code == 400
+        assert "limit" in response.json()
@@ -0,0 +1,57 @@
+import pytest
+
+from apps.articles.helpers.utils import get_display_queryset
+from apps.articles.serializers import (
+    ArticleDisplaySerializer,
+    ArticleListSerializer,
+    ArticleSearchResultSerializer,
+)
+
+from ..utils import render_serializers
+
+
+@pytest.mark.django_db
+class TestCompiledArticleSerializers:
+    """Test the compiled article serializers match DRF's output"""
+
+    @pytest.fixture
+    def articles(self, article_factory, base_user):
+        base_user.middle_name = "Middle"
+        base_user.save()
+        base_user.profile.avatar = "profiles/avatar.png"
+        base_user.profile.save()
+        article_factory.create(author=base_user)
+        article_factory.create(author=base_user, tags=["python", "django"])
+
+        return list(get_display_queryset().order_by("pkid"))
+
+    @pytest.mark.parametrize(
+        "serializer_class",
+        [
+            ArticleDisplaySerializer,
+            ArticleListSerializer,
+            ArticleSearchResultSerializer,
+        ],
+    )
+    def test_compiled_output_matches(self, articles, serializer_class):
+        compiled, reference = render_serializers(serializer_class, articles, many=True)
+
+        assert compiled == reference
+
+    def test_compiled_output_matches_without_avatar(self, base_article):
+        compiled, reference = render_serializers(
+            ArticleDisplaySerializer, get_display_queryset().get()
+        )
+
+        assert base_article.author.profile.avatar.name is None
+        assert compiled == reference
+
+    @pytest.mark.parametrize(
+        "query", [{"fields": "title,author,created_at"}, {"omit": "tags,body"}]
+    )
+    def test_compiled_output_matches_with_sparse_fieldsets(self, articles, query):
+        compiled, reference = render_serializers(
+            ArticleDisplaySerializer, articles, many=True, query=query
+        )
+
+        assert compiled == reference
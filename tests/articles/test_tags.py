@@ -0,0 +1,145 @@
+from unittest.mock import ANY
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.articles.helpers.bulk import bulk_create_articles
+from apps.articles.models import Article
+from apps.users.models import User
+
+
+@pytest.mark.django_db
+class TestArticleTagNames:
+    """Test the denormalized article tag names"""
+
+    def test_tag_names_follow_the_tags(self, base_article):
+        base_article.refresh_from_db()
+
+        assert base_article.tag_names == ["tag1", "tag2"]
+
+        base_article.tags.add("tag0")
+        base_article.tags.remove("tag2")
+        base_article.refresh_from_db()
+
+        assert base_article.tag_names == ["tag0", "tag1"]
+
+        base_article.tags.set(["tag3"])
+
+        assert Article.objects.get(pkid=base_article.pkid).tag_names == ["tag3"]
+
+        base_article.tags.clear()
+
+        assert Article.objects.get(pkid=base_article.pkid).tag_names == []
+
+    @pytest.mark.parametrize(
+        "change, updates",
+        [
+            (lambda tags: tags.set(["tag2", "tag3"]), 1),
+            (lambda tags: tags.set(["tag1"]), 1),
+            (lambda tags: tags.set(["tag3"], clear=True), 1),
+            (lambda tags: tags.add("tag1"), 0),
+            (lambda tags: tags.remove("tag1"), 1),
+            (lambda tags: tags.clear(), 1),
+        ],
+    )
+    def test_tag_change_updates_the_article_once(self, base_article, change, updates):
+        table = Article._meta.db_table
+
+        with CaptureQueriesContext(connection) as context:
+            change(base_article.tags)
+
+        assert [
+            query["sql"]
+            for query in context.captured_queries
+            if query["sql"].startswith(f'UPDATE "{table}"')
+        ] == [ANY] * updates
+
+    def test_save_does_not_overwrite_tag_names(self, base_article):
+        stale = Article.objects.get(pkid=base_article.pkid)
+        base_article.tags.add("tag3")
+        stale.title = "New title"
+        stale.save()
+
+        assert Article.objects.get(pkid=base_article.pkid).tag_names == [
+            "tag1",
+            "tag2",
+            "tag3",
+        ]
+
+    def test_save_of_a_bulk_created_article_does_not_overwrite_tag_names(
+        self, base_user
+    ):
+        [article] = bulk_create_articles(
+            base_user, [{"title": "one", "body": "body", "tags": ["a"]}]
+        )
+        Article.objects.get(pkid=article.pkid).tags.add("b")
+        article.title = "New title"
+        article.save()
+
+        assert Article.objects.get(pkid=article.pkid).tag_names == ["a", "b"]
+
+    def test_only_the_tag_names_are_copied_when_loaded(self, base_article):
+        article = Article.objects.get(pkid=base_article.pkid)
+        saved = article._saved_values
+
+        assert saved["body"] is article.body
+        assert saved["tag_names"] == article.tag_names
+        assert saved["tag_names"] is not article.tag_names
+
+    def test_bulk_created_articles_have_tag_names(self, auth_api_client):
+        auth_api_client.post(
+            reverse("bulk-articles"),
+            {"articles": [{"title": "one", "body": "body", "tags": ["b", "a", "b"]}]},
+            format="json",
+        )
+
+        assert Article.objects.get().tag_names == ["a", "b"]
+
+
+@pytest.mark.django_db
+class TestArticleTagFilter:
+    """Test filtering articles by tags"""
+
+    url = reverse("all-articles")
+
+    @pytest.fixture(autouse=True)
+    def articles(self, auth_api_client, article_factory):
+        user = User.objects.get(email="active@example.com")
+        article_factory.create(author=user, title="python", tags=["python"])
+        article_factory.create(author=user, title="django", tags=["python", "django"])
+        article_factory.create(author=user, title="rust", tags=["rust"])
+
+    def get_titles(self, response):
+        return [article["title"] for article in response.json()]
+
+    def test_filter_by_any_tag_succeeds(self, auth_api_client):
+        response = auth_api_client.get(self.url, {"tags": "django,rust"})
+
+        assert response.status_code == 200
+        assert self.get_titles(response) == ["rust", "django"]
+
+    def test_filter_by_all_tags_succeeds(self, auth_api_client):
+        response = auth_api_client.get(
+            self.url, {"tags": "python,django", "tags_match": "all"}
+        )
+
+        assert response.status_code == 200
+        assert self.get_titles(response) == ["django"]
+
+    def test_filter_by_one_tag_succeeds(self, auth_api_client):
+        response = auth_api_client.get(self.url, {"tags": "python"})
+
+        assert self.get_titles(response) == ["django", "python"]
+
+    def test_empty_tags_filter_is_ignored(self, auth_api_client):
+        response = auth_api_client.get(self.url, {"tags": ","})
+
+        assert len(response.json()) == 3
+
+    def test_filter_with_invalid_match_fails(self, auth_api_client):
+        response = auth_api_client.get(self.url, {"tags": "python", "tags_match": "x"})
+
+        assert response.status_code == 400
+        assert response.json() == {"tags_match": ["Must be one of any, all"]}
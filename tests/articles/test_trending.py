@@ -0,0 +1,134 @@
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.articles import trending
+from apps.articles.counters import flush_article_views, record_article_view
+from apps.articles.models import Article
+from apps.articles.trending import (
+    PUBLISH_WEIGHT,
+    TRENDING_HALF_LIFE,
+    TRENDING_KEY,
+    TRENDING_STATE_KEY,
+    get_trending_pkids,
+)
+from apps.common.store import get_store
+from apps.users.models import User
+
+
+def get_scores():
+    scores = get_store().zrevrange(TRENDING_KEY, 0, -1, withscores=True)
+
+    return {int(pkid): score for pkid, score in scores}
+
+
+@pytest.mark.django_db
+class TestTrendingArticles:
+    """Test the trending articles ranking"""
+
+    def test_published_articles_enter_the_ranking(self, article_factory, base_user):
+        old = article_factory.create(author=base_user)
+        Article.objects.filter(pkid=old.pkid).update(
+            created_at=timezone.now() - timedelta(days=30)
+        )
+        article = article_factory.create(author=base_user)
+        flush_article_views()
+
+        assert get_trending_pkids() == [article.pkid]
+        assert get_scores()[article.pkid] == pytest.approx(PUBLISH_WEIGHT, rel=0.01)
+
+    def test_articles_are_only_added_once(self, article_factory, base_user):
+        article = article_factory.create(author=base_user)
+        flush_article_views()
+        flush_article_views()
+        newer = article_factory.create(author=base_user)
+        flush_article_views()
+
+        assert get_scores() == {
+            article.pkid: pytest.approx(PUBLISH_WEIGHT, rel=0.01),
+            newer.pkid: pytest.approx(PUBLISH_WEIGHT, rel=0.01),
+        }
+
+    def test_views_raise_the_score(self, article_factory, base_user):
+        first, second = article_factory.create_batch(2, author=base_user)
+        record_article_view(first.pkid)
+        flush_article_views()
+
+        assert get_trending_pkids() == [first.pkid, second.pkid]
+        assert get_scores()[first.pkid] == pytest.approx(PUBLISH_WEIGHT + 1, rel=0.01)
+
+    def test_older_events_weigh_less(self, article_factory, base_user):
+        first, second = article_factory.create_batch(2, author=base_user)
+        Article.objects.filter(pkid=first.pkid).update(
+            created_at=timezone.now() - TRENDING_HALF_LIFE
+        )
+        flush_article_views()
+
+        assert get_trending_pkids() == [second.pkid, first.pkid]
+        assert get_scores()[first.pkid] == pytest.approx(PUBLISH_WEIGHT / 2, rel=0.01)
+
+    def test_scores_are_rescaled_with_the_epoch(self, article_factory, base_user):
+        article = article_factory.create(author=base_user)
+        flush_article_views()
+        epoch = timezone.now() - 2 * trending.TRENDING_RESCALE_AFTER
+        get_store().hset(TRENDING_STATE_KEY, "epoch", epoch.timestamp())
+        get_store().zadd(TRENDING_KEY, {article.pkid: 8})
+        record_article_view(article.pkid)
+        flush_article_views()
+        state = get_store().hgetall(TRENDING_STATE_KEY)
+
+        assert float(state["epoch"]) > epoch.timestamp()
+        assert get_scores()[article.pkid] < 2
+
+    def test_ranking_is_trimmed(self, monkeypatch, article_factory, base_user):
+        monkeypatch.setattr(trending, "TRENDING_LENGTH", 1)
+        article_factory.create_batch(2, author=base_user)
+        flush_article_views()
+
+        assert len(get_scores()) == 1
+
+    def test_deleted_articles_leave_the_ranking(self, base_article):
+        flush_article_views()
+        base_article.delete()
+
+        assert get_trending_pkids() == []
+
+
+@pytest.mark.django_db
+class TestTrendingArticlesEndpoint:
+    """Test the trending articles endpoint"""
+
+    url = reverse("trending-articles")
+
+    def test_get_trending_articles_succeeds(self, auth_api_client, article_factory):
+        user = User.objects.get(email="active@example.com")
+        first = article_factory.create(author=user, title="first")
+        article_factory.create(author=user, title="second")
+        record_article_view(first.pkid)
+        flush_article_views()
+
+        response = auth_api_client.get(self.url)
+        results = response.json()["results"]
+
+        assert response.status_code == 200
+        assert [result["title"] for result in results] == ["first", "second"]
+        assert "body" not in results[0]
+
+        response = auth_api_client.get(self.url, {"limit": 1})
+
+        assert len(response.json()["results"]) == 1
+
+    def test_get_trending_articles_with_invalid_limit_fails(self, auth_api_client):
+        response = auth_api_client.get(self.url, {"limit": 0})
+
+        assert response.status_code == 400
+        assert "limit" in response.json()
+
+    def test_trending_is_not_an_article_slug(self, auth_api_client):
+        response = auth_api_client.post(
+            reverse("all-articles"), {"title": "trending", "body": "body"}
+        )
+
+        assert response.json()["slug"] == "trending-1"
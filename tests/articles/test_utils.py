@@ -0,0 +1,80 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.db import IntegrityError
+
+from apps.articles.helpers.utils import (
+    create_with_unique_slug,
+    generate_slug,
+    generate_slugs,
+)
+
+
+@pytest.mark.django_db
+class TestArticleUtils:
+    """Test article helpers"""
+
+    def test_generate_slug_for_new_title(self):
+        assert generate_slug("My First Article") == "my-first-article"
+
+    def test_generate_slug_skips_reserved_slugs(self):
+        assert generate_slug("Bulk") == "bulk-1"
+
+    def test_generate_slug_for_taken_title(self, article_factory, base_user):
+        article_factory.create(title="new title", author=base_user)
+        article_factory.create(title="new title", author=base_user)
+
+        assert generate_slug("new title") == "new-title-2"
+
+    def test_generate_slug_ignores_other_prefixed_slugs(
+        self, article_factory, base_user
+    ):
+        article_factory.create(title="new title", author=base_user)
+        article_factory.create(title="new title 99 problems", author=base_user)
+
+        assert generate_slug("new title") == "new-title-1"
+
+    def test_generate_slug_uses_one_query(
+        self, article_factory, base_user, django_assert_num_queries
+    ):
+        article_factory.create_batch(3, title="new title", author=base_user)
+
+        with django_assert_num_queries(1):
+            assert generate_slug("new title") == "new-title-3"
+
+    def test_generate_slugs_for_batch(
+        self, article_factory, base_user, django_assert_num_queries
+    ):
+        article_factory.create(title="new title", author=base_user)
+
+        with django_assert_num_queries(1):
+            slugs = generate_slugs(["new title", "new title", "other title"])
+
+        assert slugs == ["new-title-1", "new-title-2", "other-title"]
+
+    def test_create_with_unique_slug_retries_on_taken_slug(
+        self, article_factory, base_user
+    ):
+        article_factory.create(title="new title", author=base_user)
+        stale_lookup = [set(), {"new-title"}]
+
+        def create(slug):
+            return article_factory.create(
+                title="new title", slug=slug, author=base_user
+            )
+
+        with patch(
+            "apps.articles.helpers.utils.get_taken_slugs",
+            side_effect=lambda bases: stale_lookup.pop(0),
+        ):
+            article = create_with_unique_slug("new title", create)
+
+        assert article.slug == "new-title-1"
+
+    def test_create_with_unique_slug_raises_other_errors(self):
+        create = MagicMock(side_effect=IntegrityError())
+
+        with pytest.raises(IntegrityError):
+            create_with_unique_slug("new title", create)
+
+        assert create.call_count == 1
@@ -0,0 +1,47 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from apps.common.jobs import run_periodic_job, schedule_periodic_jobs
+
+PERIODIC_JOBS = {
+    "apps.articles.counters.flush_article_views": 60,
+    "apps.common.utils.send_email": 30,
+}
+
+
+class TestPeriodicJobs:
+    """Test periodic jobs"""
+
+    @pytest.fixture(autouse=True)
+    def periodic_jobs(self, settings):
+        settings.RQ_PERIODIC_JOBS = PERIODIC_JOBS
+
+    @patch("django_rq.get_queue")
+    def test_run_periodic_job_schedules_next_run(self, get_queue):
+        with patch("apps.articles.counters.flush_article_views") as flush:
+            run_periodic_job("apps.articles.counters.flush_article_views")
+
+        delay, function, path = get_queue.return_value.enqueue_in.call_args.args
+
+        assert flush.called is True
+        assert delay.total_seconds() == 60
+        assert function is run_periodic_job
+        assert path == "apps.articles.counters.flush_article_views"
+
+    @patch("django_rq.get_queue")
+    def test_failed_periodic_job_schedules_next_run(self, get_queue):
+        with patch(
+            "apps.articles.counters.flush_article_views", side_effect=RuntimeError
+        ):
+            with pytest.raises(RuntimeError):
+                run_periodic_job("apps.articles.counters.flush_article_views")
+
+        assert get_queue.return_value.enqueue_in.called is True
+
+    @patch("apps.common.jobs.get_pending_periodic_jobs")
+    @patch("django_rq.get_queue", MagicMock())
+    def test_schedule_periodic_jobs_skips_pending_jobs(self, get_pending):
+        get_pending.return_value = {"apps.articles.counters.flush_article_views"}
+
+        assert schedule_periodic_jobs() == ["apps.common.utils.send_email"]
@@ -0,0 +1,247 @@
+import json
+import socket
+
+import pytest
+from django.core import mail
+
+from apps.common import mail as mail_queue
+from apps.common.mail import (
+    MAIL_DEAD_KEY,
+    MAIL_DRAINING_KEY,
+    MAIL_MAX_ATTEMPTS,
+    MAIL_METRICS_KEY,
+    MAIL_OUTBOX_KEY,
+    MAIL_PROCESSING_KEY,
+    MAIL_RETRY_DELAY,
+    MAIL_RETRY_KEY,
+    deliver_queued_emails,
+    resume_email_delivery,
+    send_email,
+)
+from apps.common.store import get_store
+
+from ..smtp import SMTPServer
+
+
+@pytest.fixture
+def smtp_server(settings):
+    with SMTPServer() as server:
+        settings.EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+        settings.EMAIL_HOST = "127.0.0.1"
+        settings.EMAIL_PORT = server.port
+        settings.EMAIL_USE_TLS = False
+        settings.EMAIL_HOST_USER = ""
+        settings.EMAIL_TIMEOUT = 5
+
+        yield server
+
+
+@pytest.fixture
+def hold_delivery():
+    """Queue emails without starting a delivery job"""
+
+    get_store().set(MAIL_DRAINING_KEY, 1)
+
+
+@pytest.fixture
+def now(monkeypatch):
+    clock = {"time": 1000.0}
+    monkeypatch.setattr(mail_queue.time, "time", lambda: clock["time"])
+
+    return clock
+
+
+def get_retries():
+    return [
+        (json.loads(email), due)
+        for email, due in get_store().zrangebyscore(
+            MAIL_RETRY_KEY, "-inf", "+inf", withscores=True
+        )
+    ]
+
+
+class TestSendEmail:
+    """Test queueing emails"""
+
+    def test_queued_emails_are_delivered(self):
+        send_email("Test Email", "I am <b>testing</b> email", ["test@app.com"])
+
+        assert len(mail.outbox) == 1
+        assert mail.outbox[0].subject == "Test Email"
+        assert mail.outbox[0].to == ["test@app.com"]
+        assert mail.outbox[0].content_subtype == "html"
+        assert get_store().llen(MAIL_OUTBOX_KEY) == 0
+        assert get_store().get(MAIL_DRAINING_KEY) is None
+
+    def test_emails_wait_for_the_job_draining_the_outbox(self, hold_delivery):
+        send_email("Test Email", "I am testing email", ["test@app.com"])
+
+        assert mail.outbox == []
+        assert get_store().llen(MAIL_OUTBOX_KEY) == 1
+
+
+class TestDeliverQueuedEmails:
+    """Test draining the outbox against a local SMTP server"""
+
+    def test_batches_share_one_connection(self, smtp_server, hold_delivery):
+        for index in range(3):
+            send_email("Hello", "Body", [f"user{index}@example.com"])
+
+        batches = deliver_queued_emails()
+
+        assert smtp_server.connections == 1
+        assert smtp_server.messages == [
+            [f"user{index}@example.com"] for index in range(3)
+        ]
+        assert [
+            (batch["sent"], batch["retried"], batch["dead"]) for batch in batches
+        ] == [(3, 0, 0)]
+
+        metrics = get_store().hgetall(MAIL_METRICS_KEY)
+
+        assert int(metrics.pop("duration_ms")) >= 0
+        assert metrics == {"batches": "1", "sent": "3", "retried": "0", "dead": "0"}
+
+    def test_outbox_is_drained_in_batches(
+        self, monkeypatch, smtp_server, hold_delivery
+    ):
+        monkeypatch.setattr(mail_queue, "MAIL_BATCH_SIZE", 2)
+
+        for index in range(5):
+            send_email("Hello", "Body", [f"user{index}@example.com"])
+
+        batches = deliver_queued_emails()
+
+        assert [batch["sent"] for batch in batches] == [2, 2, 1]
+        assert smtp_server.connections == 1
+        assert get_store().llen(MAIL_PROCESSING_KEY) == 0
+
+    def test_backlog_is_handed_over_to_new_jobs(
+        self, monkeypatch, smtp_server, hold_delivery
+    ):
+        monkeypatch.setattr(mail_queue, "MAIL_BATCH_SIZE", 2)
+        monkeypatch.setattr(mail_queue, "MAIL_BATCHES_PER_JOB", 2)
+
+        for index in range(5):
+            send_email("Hello", "Body", [f"user{index}@example.com"])
+
+        # The job enqueued for the last email runs right away in the tests
+        batches = deliver_queued_emails()
+
+        assert [batch["sent"] for batch in batches] == [2, 2]
+        assert len(smtp_server.messages) == 5
+        assert get_store().llen(MAIL_OUTBOX_KEY) == 0
+
+    def test_emails_of_a_killed_job_are_delivered_again(
+        self, monkeypatch, smtp_server, hold_delivery
+    ):
+        for index in range(3):
+            send_email("Hello", "Body", [f"user{index}@example.com"])
+
+        build_message = mail_queue.build_message
+
+        def die_on_the_second_email(email, connection):
+            if email["to"] == ["user1@example.com"]:
+                raise SystemExit()
+
+            return build_message(email, connection)
+
+        monkeypatch.setattr(mail_queue, "build_message", die_on_the_second_email)
+
+        with pytest.raises(SystemExit):
+            deliver_queued_emails()
+
+        assert get_store().llen(MAIL_OUTBOX_KEY) == 0
+        assert get_store().llen(MAIL_PROCESSING_KEY) == 2
+
+        monkeypatch.setattr(mail_queue, "build_message", build_message)
+        resume_email_delivery()
+
+        assert smtp_server.messages == [
+            [f"user{index}@example.com"] for index in range(3)
+        ]
+        assert get_store().llen(MAIL_PROCESSING_KEY) == 0
+
+    def test_periodic_run_leaves_a_running_job_alone(self, smtp_server, hold_delivery):
+        send_email("Hello", "Body", ["user@example.com"])
+
+        assert resume_email_delivery() == []
+        assert get_store().llen(MAIL_OUTBOX_KEY) == 1
+
+    def test_permanent_failures_go_to_the_dead_letters(
+        self, smtp_server, hold_delivery
+    ):
+        smtp_server.replies["gone@example.com"] = 550
+        send_email("Hello", "Body", ["gone@example.com"])
+        send_email("Hello", "Body", ["user@example.com"])
+
+        [batch] = deliver_queued_emails()
+        [dead] = get_store().lrange(MAIL_DEAD_KEY, 0, -1)
+
+        assert (batch["sent"], batch["retried"], batch["dead"]) == (1, 0, 1)
+        assert json.loads(dead)["to"] == ["gone@example.com"]
+        assert "SMTPRecipientsRefused" in json.loads(dead)["error"]
+        assert smtp_server.messages == [["user@example.com"]]
+        assert get_retries() == []
+
+    def test_transient_failures_are_retried_with_backoff(
+        self, now, smtp_server, hold_delivery
+    ):
+        smtp_server.replies["busy@example.com"] = 451
+        send_email("Hello", "Body", ["busy@example.com"])
+
+        deliver_queued_emails()
+        [(email, due)] = get_retries()
+
+        assert email["attempts"] == 1
+        assert due == now["time"] + MAIL_RETRY_DELAY
+
+        deliver_queued_emails()
+
+        assert get_retries() == [(email, due)]
+
+        now["time"] = due
+        deliver_queued_emails()
+        [(email, due)] = get_retries()
+
+        assert email["attempts"] == 2
+        assert due == now["time"] + 2 * MAIL_RETRY_DELAY
+
+        smtp_server.replies.clear()
+        now["time"] = due
+        deliver_queued_emails()
+
+        assert get_retries() == []
+        assert smtp_server.messages == [["busy@example.com"]]
+
+    def test_emails_are_dead_after_the_last_attempt(
+        self, now, smtp_server, hold_delivery
+    ):
+        smtp_server.replies["busy@example.com"] = 451
+        send_email("Hello", "Body", ["busy@example.com"])
+
+        for _ in range(MAIL_MAX_ATTEMPTS):
+            now["time"] += 3600
+            deliver_queued_emails()
+
+        [dead] = get_store().lrange(MAIL_DEAD_KEY, 0, -1)
+
+        assert json.loads(dead)["attempts"] == MAIL_MAX_ATTEMPTS
+        assert get_retries() == []
+
+    def test_emails_stay_queued_when_the_server_is_down(self, settings, hold_delivery):
+        with socket.socket() as closed:
+            closed.bind(("127.0.0.1", 0))
+            port = closed.getsockname()[1]
+
+        settings.EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+        settings.EMAIL_HOST = "127.0.0.1"
+        settings.EMAIL_PORT = port
+        settings.EMAIL_USE_TLS = False
+        send_email("Hello", "Body", ["user@example.com"])
+
+        with pytest.raises(OSError):
+            deliver_queued_emails()
+
+        assert get_store().llen(MAIL_OUTBOX_KEY) == 1
+        assert get_store().get(MAIL_DRAINING_KEY) is None
@@ -0,0 +1,95 @@
+import datetime
+import decimal
+import json
+import uuid
+from collections import OrderedDict
+from zoneinfo import ZoneInfo
+
+import pytest
+from django.utils.translation import gettext_lazy
+from django_countries.fields import Country
+from phonenumber_field.phonenumber import PhoneNumber
+from rest_framework.renderers import JSONRenderer
+from taggit.serializers import TagList
+
+from apps.common.renderers import JSONEncoder, ORJSONRenderer
+
+
+class ReferenceRenderer(JSONRenderer):
+    encoder_class = JSONEncoder
+
+
+class TestORJSONRenderer:
+    """Test the orjson renderer matches JSONRenderer"""
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {
+                "id": uuid.uuid4(),
+                "created_at": datetime.datetime(
+                    2022, 12, 1, 10, 30, 15, 123456, tzinfo=datetime.timezone.utc
+                ),
+                "updated_at": datetime.datetime(
+                    2022, 12, 1, tzinfo=ZoneInfo("Africa/Kigali")
+                ),
+                "naive": datetime.datetime(2022, 12, 1, 10, 30),
+                "date": datetime.date(2022, 12, 1),
+                "time": datetime.time(10, 30, 15, 500),
+                "duration": datetime.timedelta(minutes=5),
+            },
+            OrderedDict(
+                [
+                    ("title", 'Héllo   wörld   😀 \x00 "quoted" </script>'),
+                    ("tags", TagList(["python", "django"])),
+                    ("message", gettext_lazy("Not found.")),
+                    ("author", {"middle_name": None, "is_active": True}),
+                ]
+            ),
+            {"rank": 0.0607927, "price": decimal.Decimal("10.50"), "count": 3},
+            {"big": 2**70, "keys": {1: "int key"}},
+            [
+                PhoneNumber.from_string("+250780000000"),
+                Country("RW"),
+                Country(""),
+            ],
+            [],
+            "text",
+        ],
+    )
+    def test_render_matches_json_renderer(self, data):
+        assert ORJSONRenderer().render(data) == ReferenceRenderer().render(data)
+
+    def test_render_floats_in_exponent_notation(self):
+        data = {"rank": 1e-20, "large": 1e16, "price": decimal.Decimal("0.00001")}
+        rendered = ORJSONRenderer().render(data)
+
+        assert rendered == b'{"rank":1e-20,"large":1e16,"price":0.00001}'
+        assert json.loads(rendered) == json.loads(ReferenceRenderer().render(data))
+
+    @pytest.mark.parametrize("value", [float("nan"), float("inf")])
+    def test_render_non_finite_float_as_null(self, value):
+        assert ORJSONRenderer().render({"rank": value}) == b'{"rank":null}'
+
+    def test_render_none(self):
+        assert ORJSONRenderer().render(None) == b""
+
+    def test_render_with_indent(self):
+        data = {"id": uuid.uuid4(), "tags": ["python"]}
+        rendered = ORJSONRenderer().render(data, "application/json; indent=4")
+
+        assert rendered == ReferenceRenderer().render(
+            data, "application/json; indent=4"
+        )
+        assert b"\n    " in rendered
+
+    def test_render_phone_number_and_country(self):
+        data = {
+            "phone_number": PhoneNumber.from_string("+250780000000"),
+            "country": Country("RW"),
+        }
+
+        assert (
+            ORJSONRenderer().render(data)
+            == b'{"phone_number":"+250780000000","country":"RW"}'
+        )
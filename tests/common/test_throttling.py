@@ -0,0 +1,34 @@
+from apps.common import throttling
+from apps.common.throttling import take_token
+
+
+class TestTokenBucket:
+    """Test the store backed token bucket"""
+
+    def test_tokens_run_out_and_refill(self, monkeypatch):
+        now = 1000.0
+        monkeypatch.setattr(throttling.time, "time", lambda: now)
+
+        assert [take_token("bucket", 2, 0.5) for _ in range(3)] == [0, 0, 2.0]
+
+        now += 1
+
+        assert take_token("bucket", 2, 0.5) == 1.0
+
+        now += 1
+
+        assert take_token("bucket", 2, 0.5) == 0
+        assert take_token("bucket", 2, 0.5) == 2.0
+
+    def test_buckets_never_hold_more_than_their_capacity(self, monkeypatch):
+        now = 1000.0
+        monkeypatch.setattr(throttling.time, "time", lambda: now)
+        take_token("bucket", 2, 1)
+        now += 60
+
+        assert [take_token("bucket", 2, 1) for _ in range(3)] == [0, 0, 1.0]
+
+    def test_buckets_are_separate(self):
+        assert take_token("first", 1, 1) == 0
+        assert take_token("second", 1, 1) == 0
+        assert take_token("first", 1, 1) > 0
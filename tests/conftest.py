@@ -1,16 +1,58 @@
+import django_rq
+import facebook
 import pytest
+from django.core.cache import cache
 from pytest_factoryboy import register
 from rest_framework.test import APIClient
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from apps.common.store import get_store
+from apps.users.helpers import facebook as facebook_helper
+from apps.users.helpers import google, twitter
+
 from .factories.profile import ProfileFactory
 from .factories.user import ActiveUserFactory, UserFactory
+from .providers import FakeProvider
 
 register(UserFactory)
 register(ProfileFactory)
 register(ActiveUserFactory)
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_store():
+    get_store().flushall()
+
+
+@pytest.fixture(autouse=True)
+def run_jobs(monkeypatch):
+    """Run the enqueued RQ jobs right away instead of on a worker"""
+
+    monkeypatch.setattr(django_rq, "enqueue", lambda func, *args: func(*args))
+
+
+@pytest.fixture
+def fake_provider(monkeypatch):
+    """Send the social auth calls to a local fake provider"""
+
+    with FakeProvider() as provider:
+        monkeypatch.setattr(
+            google, "GOOGLE_CERTS_URL", f"{provider.url}/oauth2/v1/certs"
+        )
+        monkeypatch.setattr(facebook, "FACEBOOK_GRAPH_URL", f"{provider.url}/")
+        monkeypatch.setattr(twitter, "TWITTER_API_URL", provider.url)
+
+        for helper in [google, facebook_helper, twitter]:
+            helper.breaker.reset()
+
+        yield provider
+
+
 @pytest.fixture
 def base_user(db, user_factory):
     new_user = user_factory.create()
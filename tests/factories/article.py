@@ -13,8 +13,12 @@ class ArticleFactory(factory.django.DjangoModelFactory):
     title = factory.LazyAttribute(lambda x: "new-title")
     body = factory.LazyAttribute(lambda x: faker.paragraph(nb_sentences=5))
     slug = factory.LazyAttribute(lambda x: generate_slug(x.title))
-    tags = factory.LazyAttribute(lambda x: ["tag1", "tag2"])
     author = factory.SubFactory("tests.factories.user.UserFactory")
 
     class Meta:
         model = Article
+
+    @factory.post_generation
+    def tags(self, create, extracted, **kwargs):
+        if create:
+            self.tags.add(*(extracted or ["tag1", "tag2"]))
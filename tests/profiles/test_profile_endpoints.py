@@ -30,6 +30,14 @@ class TestGetMyProfileEndpoint:
         assert response.status_code == 200
         assert response.json()["email"] == "active@example.com"
 
+    def test_get_my_profile_with_omit_succeeds(self, auth_api_client):
+        response = auth_api_client.get(self.url, {"omit": "about_me,avatar"})
+
+        assert response.status_code == 200
+        assert response.json()["email"] == "active@example.com"
+        assert "about_me" not in response.json()
+        assert "avatar" not in response.json()
+
 
 @pytest.mark.django_db
 class TestEditMyProfileEndpoint:
@@ -247,3 +255,38 @@ class TestGetUserProfileEndpoint:
 
         assert response.status_code == 404
         assert response.json()["detail"] == "Not found."
+
+
+@pytest.mark.django_db
+class TestConditionalGetProfileEndpoints:
+    """Test conditional get profile endpoints"""
+
+    def test_get_my_profile_with_matching_etag_is_not_modified(self, auth_api_client):
+        url = reverse("my-profile")
+        etag = auth_api_client.get(url).headers["ETag"]
+        response = auth_api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+
+    def test_get_my_profile_after_edit_is_modified(self, auth_api_client):
+        url = reverse("my-profile")
+        etag = auth_api_client.get(url).headers["ETag"]
+        profile = User.objects.first().profile
+        profile.city = "Kigali"
+        profile.save()
+        response = auth_api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+
+    def test_get_user_profile_with_matching_etag_is_not_modified(self, auth_api_client):
+        url = get_dynamic_url(User, "user-profile")
+        etag = auth_api_client.get(url).headers["ETag"]
+        response = auth_api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+
+    def test_get_user_profile_with_unexisted_id_fails(self, auth_api_client):
+        url = reverse("user-profile", args=["sdfdd"])
+        response = auth_api_client.get(url, HTTP_IF_NONE_MATCH="*")
+
+        assert response.status_code == 404
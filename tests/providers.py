@@ -0,0 +1,89 @@
+import json
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+PROFILE = {
+    "id": 1,
+    "email": "test.user@app.com",
+    "name": "test user",
+    "first_name": "test",
+    "last_name": "user",
+}
+
+
+class ProviderHandler(BaseHTTPRequestHandler):
+    """Answer like the Google, Facebook and Twitter endpoints used at login"""
+
+    def log_message(self, *args):
+        pass
+
+    def send_json(self, status, data, headers=None):
+        body = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        path, _, query = self.path.partition("?")
+        query = parse_qs(query)
+        server.hits[path] += 1
+
+        if path == "/oauth2/v1/certs":
+            headers = {"Cache-Control": server.certs_cache_control}
+            self.send_json(server.certs_status, {}, headers)
+        elif path == "/me":
+            if query.get("access_token", [None])[0] in server.tokens:
+                self.send_json(200, PROFILE)
+            else:
+                error = {"message": "Invalid OAuth access token.", "code": 190}
+                self.send_json(400, {"error": error})
+        elif path == "/account/verify_credentials.json":
+            authorization = self.headers.get("Authorization", "")
+
+            if any(
+                f'oauth_token="{token}"' in authorization for token in server.tokens
+            ):
+                self.send_json(200, PROFILE)
+            else:
+                errors = [{"code": 89, "message": "Invalid or expired token."}]
+                self.send_json(401, {"errors": errors})
+        else:
+            self.send_json(404, {})
+
+
+class FakeProvider(ThreadingHTTPServer):
+    """
+    Local stand-in for the social auth providers, counting the requests
+    made to each path. tokens are the access tokens it accepts.
+    """
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), ProviderHandler)
+        self.hits = Counter()
+        self.tokens = set()
+        self.certs_status = 200
+        self.certs_cache_control = "public, max-age=3600"
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def __enter__(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+        self.server_close()
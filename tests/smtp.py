@@ -0,0 +1,78 @@
+import socketserver
+import threading
+
+
+class SMTPHandler(socketserver.StreamRequestHandler):
+    """Speak enough SMTP for smtplib to deliver plain text messages"""
+
+    def reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        server = self.server
+        server.connections += 1
+        recipients = []
+        self.reply("220 localhost SMTP stand-in")
+
+        for line in self.rfile:
+            command = line.decode().strip()
+            verb = command.split(" ", 1)[0].upper()
+
+            if verb in ("EHLO", "HELO"):
+                self.reply("250 localhost")
+            elif verb in ("MAIL", "RSET"):
+                recipients = []
+                self.reply("250 OK")
+            elif verb == "RCPT":
+                address = command.split(":", 1)[1].strip().strip("<>")
+                code = server.replies.get(address, 250)
+
+                if code == 250:
+                    recipients.append(address)
+
+                self.reply(f"{code} {address}")
+            elif verb == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+
+                for data in self.rfile:
+                    if data == b".\r\n":
+                        break
+
+                server.messages.append(recipients)
+                self.reply("250 OK")
+            elif verb == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 Command not implemented")
+
+
+class SMTPServer(socketserver.ThreadingTCPServer):
+    """
+    Local SMTP server for the tests, counting the connections it gets and
+    recording the recipients of each message.
+
+    replies maps recipient addresses to the code RCPT answers them with.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), SMTPHandler)
+        self.connections = 0
+        self.messages = []
+        self.replies = {}
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    def __enter__(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+        self.server_close()
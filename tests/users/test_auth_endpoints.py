@@ -5,6 +5,8 @@ from unittest.mock import MagicMock, patch
 
 import django_rq
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework_simplejwt.tokens import RefreshToken
 
@@ -128,6 +130,22 @@ class TestUserSignupEndpoint:
         assert response.status_code == 409
         assert response.json()["detail"] == errors["email"]["unique"]
 
+    def test_user_signup_with_taken_email_and_username_fails(
+        self, api_client, base_user
+    ):
+        data = self.data.copy()
+        data["email"] = base_user.email.upper()
+        data["username"] = base_user.username
+        data = json.dumps(data)
+        response = api_client.post(self.url, data=data, content_type=JSON_CONTENT_TYPE)
+
+        assert response.status_code == 409
+        assert response.json()["detail"] == errors["email"]["unique"]
+        assert response.json()["conflicts"] == {
+            "email": errors["email"]["unique"],
+            "username": errors["username"]["unique"],
+        }
+
     def test_user_signup_without_password_fails(self, api_client):
         data = self.data.copy()
         data.pop("password")
@@ -250,8 +268,8 @@ class TestUserLoginEndpoint:
         assert response.status_code == 401
         assert response.json()["detail"] == errors["account"]["no_account"]
 
-    def test_user_login_with_wrong_password_fails(self, api_client, base_user):
-        data = {"email": base_user.email, "password": "base_user.password"}
+    def test_user_login_with_wrong_password_fails(self, api_client, active_user):
+        data = {"email": active_user.email, "password": "base_user.password"}
         data = json.dumps(data)
         response = api_client.post(self.url, data=data, content_type=JSON_CONTENT_TYPE)
 
@@ -279,6 +297,88 @@ class TestUserLoginEndpoint:
         )
 
 
+@pytest.mark.django_db
+class TestUserLoginHotPath:
+    """Test the checks done before hashing the login password"""
+
+    url = reverse("login")
+
+    def test_inactive_account_is_rejected_before_hashing(self, api_client, base_user):
+        data = json.dumps({"email": base_user.email, "password": "wrong"})
+
+        with patch("apps.users.models.User.check_password") as check_password:
+            response = api_client.post(
+                self.url, data=data, content_type=JSON_CONTENT_TYPE
+            )
+
+        assert response.status_code == 401
+        assert response.json()["detail"] == errors["account"]["disabled"]
+        assert check_password.called is False
+
+    def test_user_is_found_with_one_column_lookup(self, api_client, active_user):
+        data = {"email": active_user.email, "password": "password"}
+
+        with CaptureQueriesContext(connection) as context:
+            api_client.post(
+                self.url, data=json.dumps(data), content_type=JSON_CONTENT_TYPE
+            )
+
+        lookup = context.captured_queries[0]["sql"]
+
+        assert '"users_user"."email" =' in lookup
+        assert " OR " not in lookup
+
+    def test_login_attempts_are_throttled_per_ip_whatever_x_forwarded_for(
+        self, api_client
+    ):
+        statuses = [
+            api_client.post(
+                self.url,
+                data=json.dumps(
+                    {"email": f"user{index}@example.com", "password": "wrong"}
+                ),
+                content_type=JSON_CONTENT_TYPE,
+                REMOTE_ADDR="10.0.0.1",
+                HTTP_X_FORWARDED_FOR=f"192.168.0.{index}",
+            ).status_code
+            for index in range(21)
+        ]
+
+        assert statuses == [401] * 20 + [429]
+
+    def test_login_attempts_are_throttled_per_identifier(self, api_client, base_user):
+        data = json.dumps({"email": base_user.email.upper(), "password": "wrong"})
+        statuses = [
+            api_client.post(
+                self.url,
+                data=data,
+                content_type=JSON_CONTENT_TYPE,
+                REMOTE_ADDR=f"10.0.0.{index}",
+            ).status_code
+            for index in range(6)
+        ]
+        response = api_client.post(
+            self.url,
+            data=json.dumps({"email": "other@example.com", "password": "wrong"}),
+            content_type=JSON_CONTENT_TYPE,
+        )
+
+        assert statuses == [401] * 5 + [429]
+        assert response.status_code == 401
+
+    def test_login_attempts_are_throttled_per_ip(self, api_client):
+        statuses = [
+            api_client.post(
+                self.url,
+                data=json.dumps({"email": f"{index}@example.com", "password": "x"}),
+                content_type=JSON_CONTENT_TYPE,
+            ).status_code
+            for index in range(21)
+        ]
+
+        assert statuses == [401] * 20 + [429]
+
+
 @pytest.mark.django_db
 class TestForgotPasswordEndpoint:
     """Test forgot password endpoint"""
@@ -446,6 +546,7 @@ class TestResetPasswordEndpoint:
 
 
 @pytest.mark.django_db
+@pytest.mark.usefixtures("fake_provider")
 class TestGoogleAuthEndpoint:
     """Test google auth endpoint"""
 
@@ -542,6 +643,7 @@ class TestGoogleAuthEndpoint:
 
 
 @pytest.mark.django_db
+@pytest.mark.usefixtures("fake_provider")
 class TestFacebbokAuthEndpoint:
     """Test facebook auth endpoint"""
 
@@ -573,12 +675,14 @@ class TestFacebbokAuthEndpoint:
 
 
 @pytest.mark.django_db
+@pytest.mark.usefixtures("fake_provider")
 class TestTwitterAuthEndpoint:
     """Test twitter auth endpoint"""
 
     url = reverse("twitter-auth")
 
-    def test_twitter_auth_succeeds(self, api_client):
+    def test_twitter_auth_succeeds(self, api_client, fake_provider):
+        fake_provider.tokens.add(env("TWITTER_ACCESS_TOKEN_KEY"))
         data = {
             "access_token_key": env("TWITTER_ACCESS_TOKEN_KEY"),
             "access_token_secret": env("TWITTER_ACCESS_TOKEN_SECRET"),
@@ -0,0 +1,87 @@
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.users.authentication import CachedJWTAuthentication, get_user_cache_key
+from apps.users.models import User
+
+from ..utils import count_queries
+
+
+@pytest.mark.django_db
+class TestCachedJWTAuthentication:
+    """Test the cached JWT authentication"""
+
+    url = reverse("get-users")
+
+    @pytest.fixture
+    def user(self, auth_api_client):
+        return User.objects.get(email="active@example.com")
+
+    def save(self, user, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            user.save()
+
+    def test_user_is_served_from_the_cache(self, auth_api_client):
+        _, first_queries = count_queries(auth_api_client.get, reverse("all-articles"))
+        response, queries = count_queries(auth_api_client.get, reverse("all-articles"))
+
+        assert response.status_code == 200
+        assert queries == first_queries - 1
+
+    def test_password_hash_is_not_cached(self, auth_api_client, user):
+        auth_api_client.get(self.url)
+        values = cache.get(get_user_cache_key(str(user.id)))
+
+        assert values["email"] == user.email
+        assert "password" not in values
+        assert user.password not in values.values()
+
+    def test_cached_user_loads_the_password_when_read(
+        self, user, django_assert_num_queries
+    ):
+        token = AccessToken.for_user(user)
+        authentication = CachedJWTAuthentication()
+        authentication.get_user(token)
+
+        with django_assert_num_queries(0):
+            cached = authentication.get_user(token)
+
+        assert cached.pk == user.pk
+        assert cached.is_admin == user.is_admin
+        assert cached.get_deferred_fields() == {"password"}
+
+        with django_assert_num_queries(1):
+            assert cached.password == user.password
+
+    def test_saved_user_is_reloaded(
+        self, auth_api_client, user, django_capture_on_commit_callbacks
+    ):
+        assert auth_api_client.get(self.url).status_code == 403
+
+        user.is_admin = True
+        self.save(user, django_capture_on_commit_callbacks)
+
+        assert auth_api_client.get(self.url).status_code == 200
+
+    def test_deactivated_user_is_rejected(
+        self, auth_api_client, user, django_capture_on_commit_callbacks
+    ):
+        auth_api_client.get(self.url)
+        user.is_active = False
+        self.save(user, django_capture_on_commit_callbacks)
+        response = auth_api_client.get(self.url)
+
+        assert response.status_code == 401
+        assert response.json()["detail"] == "User is inactive"
+
+    def test_deleted_user_is_rejected(
+        self, auth_api_client, user, django_capture_on_commit_callbacks
+    ):
+        auth_api_client.get(self.url)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            user.delete()
+
+        assert auth_api_client.get(self.url).status_code == 401
@@ -0,0 +1,86 @@
+import json
+import re
+
+import jwt
+import pytest
+from django.core import mail
+from django.urls import reverse
+
+from apps.users.emails import send_password_reset_email, send_verification_email
+from apps.users.models import User
+from authors_heaven.settings.base import env
+from tests.constants import JSON_CONTENT_TYPE
+
+
+def get_link_token(message, url_name):
+    match = re.search(
+        rf"http://testserver{reverse(url_name)}\?token=([\w.-]+)", message.body
+    )
+
+    return jwt.decode(match.group(1), env("SECRET_KEY"), algorithms=["HS256"])
+
+
+@pytest.mark.django_db
+class TestUserEmails:
+    """Test the emails built by the RQ jobs"""
+
+    def test_verification_email_is_built_in_the_job(self, base_user):
+        send_verification_email(str(base_user.id), "testserver")
+        message = mail.outbox[0]
+
+        assert message.subject == "Email Verification"
+        assert message.to == [base_user.email]
+        assert get_link_token(message, "verify")["user_id"] == str(base_user.id)
+
+    def test_password_reset_email_is_built_in_the_job(self, base_user):
+        send_password_reset_email(str(base_user.id), "testserver")
+        message = mail.outbox[0]
+
+        assert message.subject == "Forgot Password"
+        assert get_link_token(message, "reset-password")["user_id"] == str(base_user.id)
+
+    def test_email_is_skipped_for_deleted_users(self, base_user):
+        user_id = str(base_user.id)
+        base_user.delete()
+        send_verification_email(user_id, "testserver")
+
+        assert mail.outbox == []
+
+    def test_signup_enqueues_the_email_on_commit(
+        self, api_client, django_capture_on_commit_callbacks
+    ):
+        data = {
+            "first_name": "Test",
+            "last_name": "User",
+            "email": "signup@example.com",
+            "username": "signup",
+            "password": "Password@1234",
+        }
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            api_client.post(
+                reverse("signup"), json.dumps(data), content_type=JSON_CONTENT_TYPE
+            )
+
+        assert mail.outbox == []
+
+        for callback in callbacks:
+            callback()
+
+        assert [message.to for message in mail.outbox] == [["signup@example.com"]]
+
+    def test_forgot_password_enqueues_the_email_on_commit(
+        self, api_client, active_user, django_capture_on_commit_callbacks
+    ):
+        with django_capture_on_commit_callbacks(execute=True):
+            api_client.post(
+                reverse("forgot-password"),
+                json.dumps({"email": active_user.email}),
+                content_type=JSON_CONTENT_TYPE,
+            )
+
+        user = User.objects.get(email=active_user.email)
+
+        assert get_link_token(mail.outbox[0], "reset-password")["user_id"] == str(
+            user.id
+        )
@@ -0,0 +1,88 @@
+import pytest
+from django.db import IntegrityError, connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.users.helpers import utils
+from apps.users.helpers.utils import (
+    USERNAME_ATTEMPTS,
+    create_with_username,
+    generate_username,
+)
+
+
+@pytest.mark.django_db
+class TestGenerateUsername:
+    """Test generating usernames for social signups"""
+
+    def test_free_name_is_used_as_is(self, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            assert generate_username("John Doe") == "johndoe"
+
+    def test_lowest_free_suffix_is_used(self, user_factory, django_assert_num_queries):
+        for username in ["johndoe", "johndoe1", "johndoe3", "johndoesmith"]:
+            user_factory.create(username=username, email=f"{username}@example.com")
+
+        with django_assert_num_queries(1):
+            assert generate_username("John Doe") == "johndoe2"
+
+    def test_only_the_name_with_digits_is_read(self, user_factory):
+        for username in ["johndoe", "johndoesmith", "johndoe2x"]:
+            user_factory.create(username=username, email=f"{username}@example.com")
+
+        with CaptureQueriesContext(connection) as context:
+            assert generate_username("John Doe") == "johndoe1"
+
+        assert "REGEXP" in context.captured_queries[0]["sql"]
+
+    def test_name_with_regex_characters_is_escaped(self, user_factory):
+        user_factory.create(username="j.doe", email="jdoe@example.com")
+        user_factory.create(username="jxdoe1", email="jxdoe@example.com")
+
+        assert generate_username("J.Doe") == "j.doe1"
+
+    @pytest.mark.parametrize("name", ["", "   ", None])
+    def test_blank_name_gets_the_default_username(self, user_factory, name):
+        user_factory.create(username="user", email="user@example.com")
+
+        assert generate_username(name) == "user1"
+
+    def test_retry_after_a_concurrent_signup_took_the_username(
+        self, monkeypatch, user_factory
+    ):
+        generated = []
+
+        def racing_generate_username(name):
+            username = generate_username(name)
+
+            # Another signup takes the username right after it was picked
+            if not generated:
+                user_factory.create(username=username, email="first@example.com")
+
+            generated.append(username)
+
+            return username
+
+        monkeypatch.setattr(utils, "generate_username", racing_generate_username)
+        user = create_with_username(
+            "John Doe",
+            lambda username: user_factory.create(
+                username=username, email="second@example.com"
+            ),
+        )
+
+        assert generated == ["johndoe", "johndoe1"]
+        assert user.username == "johndoe1"
+
+    def test_retries_are_limited(self, user_factory):
+        user_factory.create(username="johndoe", email="taken@example.com")
+        attempts = []
+
+        def create(username):
+            attempts.append(username)
+
+            return user_factory.create(username="johndoe", email="new@example.com")
+
+        with pytest.raises(IntegrityError):
+            create_with_username("John Doe", create)
+
+        assert len(attempts) == USERNAME_ATTEMPTS
@@ -1,6 +1,10 @@
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
+from apps.profiles.models import Profile
 from apps.users.error_messages import errors
+from apps.users.models import User
 
 
 class TestUserModel:
@@ -60,3 +64,66 @@ class TestUserModel:
             user_factory.create(password=None)
 
         assert str(error.value) == errors["password"]["required"]
+
+
+@pytest.mark.django_db
+class TestUserDirtyFields:
+    """Test saving only the changed fields of users and profiles"""
+
+    def get_user(self, base_user):
+        return User.objects.get(pkid=base_user.pkid)
+
+    def test_unchanged_user_is_not_saved(self, base_user, django_assert_num_queries):
+        user = self.get_user(base_user)
+
+        with django_assert_num_queries(0):
+            user.save()
+
+    def test_only_changed_fields_are_written(self, base_user):
+        user = self.get_user(base_user)
+        user.is_active = True
+
+        with CaptureQueriesContext(connection) as context:
+            user.save()
+
+        [query] = context.captured_queries
+
+        assert '"is_active"' in query["sql"]
+        assert '"updated_at"' in query["sql"]
+        assert '"email"' not in query["sql"]
+        assert user.get_dirty_fields() == []
+        assert self.get_user(base_user).is_active is True
+
+    def test_user_save_leaves_the_profile_alone(
+        self, base_user, django_assert_num_queries
+    ):
+        user = self.get_user(base_user)
+        user.auth_provider = "google"
+
+        with django_assert_num_queries(1):
+            user.save()
+
+    def test_profile_changed_through_the_user_is_saved(self, base_user):
+        user = self.get_user(base_user)
+        user.first_name = "Changed"
+        user.profile.city = "Kigali"
+        user.save()
+
+        assert Profile.objects.get(user=base_user).city == "Kigali"
+
+    def test_untracked_profile_is_saved_with_the_user(self, base_user):
+        user = self.get_user(base_user)
+        Profile.objects.filter(user=base_user).delete()
+        [user.profile] = Profile.objects.bulk_create([Profile(user=user)])
+        user.profile.city = "Kigali"
+        user.auth_provider = "google"
+        user.save()
+
+        assert Profile.objects.get(user=base_user).city == "Kigali"
+
+    def test_changes_made_after_loading_a_deferred_field_are_saved(self, base_user):
+        user = User.objects.only("pkid").get(pkid=base_user.pkid)
+        user.username = "changed"
+        user.save()
+
+        assert self.get_user(base_user).username == "changed"
@@ -0,0 +1,119 @@
+import json
+
+import pytest
+from django.urls import reverse
+
+from apps.users.error_messages import errors
+from apps.users.helpers import providers
+from apps.users.helpers.google import Google, breaker
+from apps.users.helpers.providers import ProviderUnavailable, get_max_age, get_session
+from apps.users.helpers.twitter import SharedSessionApi, Twitter
+from tests.constants import JSON_CONTENT_TYPE
+from tests.providers import PROFILE
+
+
+def validate_google_token():
+    with pytest.raises(ValueError):
+        Google.validate("auth_token")
+
+
+class TestGoogleCerts:
+    """Test caching Google's signing certificates"""
+
+    def test_certs_are_cached_for_their_max_age(self, fake_provider):
+        validate_google_token()
+        validate_google_token()
+
+        assert fake_provider.hits["/oauth2/v1/certs"] == 1
+
+    @pytest.mark.parametrize("cache_control", ["no-store", "max-age=0", "private"])
+    def test_certs_are_fetched_again_without_max_age(
+        self, fake_provider, cache_control
+    ):
+        fake_provider.certs_cache_control = cache_control
+        validate_google_token()
+        validate_google_token()
+
+        assert fake_provider.hits["/oauth2/v1/certs"] == 2
+
+    def test_max_age_discounts_the_age_of_the_response(self):
+        assert (
+            get_max_age({"cache-control": "public, max-age=300", "age": "100"}) == 200
+        )
+
+
+class TestCircuitBreaker:
+    """Test failing fast when a provider can't be reached"""
+
+    def test_breaker_opens_after_repeated_failures(self, monkeypatch, fake_provider):
+        now = 1000.0
+        monkeypatch.setattr(providers.time, "monotonic", lambda: now)
+        fake_provider.certs_status = 500
+
+        for _ in range(breaker.failure_threshold + 2):
+            with pytest.raises(ProviderUnavailable):
+                Google.validate("auth_token")
+
+        assert fake_provider.hits["/oauth2/v1/certs"] == breaker.failure_threshold
+
+        fake_provider.certs_status = 200
+        now += breaker.reset_timeout
+        validate_google_token()
+        validate_google_token()
+
+        assert fake_provider.hits["/oauth2/v1/certs"] == breaker.failure_threshold + 1
+
+    def test_failed_probe_keeps_the_breaker_open(self, monkeypatch, fake_provider):
+        now = 1000.0
+        monkeypatch.setattr(providers.time, "monotonic", lambda: now)
+        fake_provider.certs_status = 500
+
+        for _ in range(breaker.failure_threshold):
+            with pytest.raises(ProviderUnavailable):
+                Google.validate("auth_token")
+
+        now += breaker.reset_timeout
+
+        with pytest.raises(ProviderUnavailable):
+            Google.validate("auth_token")
+
+        with pytest.raises(ProviderUnavailable):
+            Google.validate("auth_token")
+
+        assert fake_provider.hits["/oauth2/v1/certs"] == breaker.failure_threshold + 1
+
+    @pytest.mark.django_db
+    def test_unreachable_provider_returns_service_unavailable(
+        self, fake_provider, api_client
+    ):
+        fake_provider.certs_status = 500
+        data = json.dumps({"auth_token": "auth_token"})
+        response = api_client.post(
+            reverse("google-auth"), data=data, content_type=JSON_CONTENT_TYPE
+        )
+
+        assert response.status_code == 503
+        assert response.json()["detail"] == errors["provider"]["unavailable"].format(
+            "Google"
+        )
+
+
+class TestTwitterClient:
+    """Test the python-twitter client settings"""
+
+    def test_requests_use_the_shared_session(self, fake_provider):
+        fake_provider.tokens.add("key")
+
+        assert Twitter.validate("key", "secret")["email"] == PROFILE["email"]
+        assert SharedSessionApi(cache=None)._session is get_session()
+
+    def test_other_client_errors_reject_the_tokens(self, monkeypatch, fake_provider):
+        def fail(*args, **kwargs):
+            raise KeyError("id")
+
+        monkeypatch.setattr(SharedSessionApi, "VerifyCredentials", fail)
+
+        with pytest.raises(ValueError) as error:
+            Twitter.validate("key", "secret")
+
+        assert str(error.value) == errors["access_tokens"]["invalid"]
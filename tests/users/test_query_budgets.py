@@ -0,0 +1,53 @@
+import pytest
+from django.urls import reverse
+
+from apps.users.models import User
+
+from ..utils import count_queries, get_dynamic_url
+
+# Authentication + users joined with their profiles
+USERS_QUERY_BUDGET = 2
+# Authentication + user joined with its profile
+USER_QUERY_BUDGET = 2
+# Authentication + versions + user joined with its profile
+USER_PROFILE_QUERY_BUDGET = 3
+# Authentication + versions + profile joined with its user
+MY_PROFILE_QUERY_BUDGET = 3
+
+
+@pytest.mark.django_db
+class TestUsersQueryBudget:
+    """Test users endpoints query budget"""
+
+    @pytest.mark.parametrize("size", [1, 10])
+    def test_get_users_query_budget(self, admin_api_client, user_factory, size):
+        for index in range(size):
+            user_factory.create(
+                username=f"user{index}", email=f"user{index}@example.com"
+            )
+
+        response, queries = count_queries(admin_api_client.get, reverse("get-users"))
+
+        assert response.status_code == 200
+        assert len(response.json()) == size + 1
+        assert queries == USERS_QUERY_BUDGET
+
+    def test_get_user_query_budget(self, admin_api_client):
+        url = get_dynamic_url(User, "get-user")
+        response, queries = count_queries(admin_api_client.get, url)
+
+        assert response.status_code == 200
+        assert queries == USER_QUERY_BUDGET
+
+    def test_get_user_profile_query_budget(self, admin_api_client):
+        url = get_dynamic_url(User, "user-profile")
+        response, queries = count_queries(admin_api_client.get, url)
+
+        assert response.status_code == 200
+        assert queries == USER_PROFILE_QUERY_BUDGET
+
+    def test_get_my_profile_query_budget(self, auth_api_client):
+        response, queries = count_queries(auth_api_client.get, reverse("my-profile"))
+
+        assert response.status_code == 200
+        assert queries == MY_PROFILE_QUERY_BUDGET
@@ -0,0 +1,75 @@
+import pytest
+
+from apps.common.utils import ConflictException
+from apps.users.error_messages import errors
+from apps.users.models import User
+from apps.users.serializers.user import UserDisplaySerializer, UserSerializer
+
+from ..utils import render_serializers
+
+
+@pytest.mark.django_db
+class TestCompiledUserSerializers:
+    """Test the compiled user serializer matches DRF's output"""
+
+    def test_compiled_output_matches(self, base_user):
+        profile = base_user.profile
+        profile.phone_number = "+250780000000"
+        profile.avatar = "profiles/avatar.png"
+        profile.country = "RW"
+        profile.city = "Kigali"
+        profile.save()
+
+        compiled, reference = render_serializers(
+            UserDisplaySerializer, User.objects.select_related("profile"), many=True
+        )
+
+        assert b"Rwanda" in compiled
+        assert compiled == reference
+
+    def test_compiled_output_matches_with_empty_profile(self, base_user):
+        compiled, reference = render_serializers(UserDisplaySerializer, base_user)
+
+        assert compiled == reference
+
+    def test_compiled_output_matches_with_sparse_fieldsets(self, base_user):
+        compiled, reference = render_serializers(
+            UserDisplaySerializer, base_user, query={"omit": "avatar,country"}
+        )
+
+        assert compiled == reference
+
+
+@pytest.mark.django_db
+class TestUserSerializerUniqueness:
+    """Test the email and username uniqueness checks of signups"""
+
+    data = {
+        "first_name": "Test",
+        "last_name": "User",
+        "email": "Test.User@App.com",
+        "username": "testuser",
+        "password": "Password@1234",
+    }
+
+    def test_email_and_username_are_checked_in_one_query(
+        self, django_assert_num_queries
+    ):
+        serializer = UserSerializer(data=self.data)
+
+        with django_assert_num_queries(1):
+            assert serializer.is_valid()
+
+        assert serializer.validated_data["email"] == "test.user@app.com"
+
+    def test_signup_racing_another_one_is_a_conflict(self, user_factory):
+        serializer = UserSerializer(data=self.data)
+        serializer.is_valid(raise_exception=True)
+        user_factory.create(username="testuser", email="other@example.com")
+
+        with pytest.raises(ConflictException) as error:
+            serializer.save()
+
+        assert error.value.detail["conflicts"] == {
+            "username": errors["username"]["unique"]
+        }
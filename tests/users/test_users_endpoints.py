@@ -1,7 +1,7 @@
 import pytest
 from django.urls import reverse
 
-from apps.users.models import User
+from apps.users.models import Follow, User
 
 from ..utils import get_dynamic_url
 
@@ -36,6 +36,22 @@ class TestGetUsersEndpoint:
         assert response.status_code == 200
         assert len(response.json()) == 2
 
+    def test_get_users_with_cursor_pagination_succeeds(
+        self, admin_api_client, base_user
+    ):
+        response = admin_api_client.get(self.url, {"cursor": "", "limit": 1})
+
+        assert response.status_code == 200
+        assert len(response.json()["results"]) == 1
+        assert response.json()["results"][0]["username"] == base_user.username
+        assert response.json()["next"] is not None
+
+    def test_get_users_with_fields_succeeds(self, admin_api_client, base_user):
+        response = admin_api_client.get(self.url, {"fields": "username,country"})
+
+        assert response.status_code == 200
+        assert response.json()[0] == {"username": base_user.username, "country": None}
+
 
 @pytest.mark.django_db
 class TestGetUserEndpoint:
@@ -74,3 +90,44 @@ class TestGetUserEndpoint:
 
         assert response.status_code == 404
         assert response.json()["detail"] == "Not found."
+
+
+@pytest.mark.django_db
+class TestFollowUserEndpoint:
+    """Test follow user endpoint"""
+
+    @pytest.fixture
+    def followed_user(self, user_factory):
+        return user_factory.create(username="followed", email="followed@example.com")
+
+    def test_follow_user_succeeds(self, auth_api_client, followed_user):
+        url = reverse("follow-user", args=[followed_user.id])
+        response = auth_api_client.post(url)
+        auth_api_client.post(url)
+
+        assert response.status_code == 200
+        assert response.json() == {"following": True}
+        assert list(
+            followed_user.followers.values_list("follower__email", flat=True)
+        ) == ["active@example.com"]
+
+    def test_follow_yourself_fails(self, auth_api_client):
+        user = User.objects.get(email="active@example.com")
+        response = auth_api_client.post(reverse("follow-user", args=[user.id]))
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "You can't follow yourself"
+        assert not Follow.objects.exists()
+
+    def test_follow_unexisted_user_fails(self, auth_api_client):
+        response = auth_api_client.post(reverse("follow-user", args=["sdfdd"]))
+
+        assert response.status_code == 404
+
+    def test_unfollow_user_succeeds(self, auth_api_client, followed_user):
+        url = reverse("follow-user", args=[followed_user.id])
+        auth_api_client.post(url)
+        response = auth_api_client.delete(url)
+
+        assert response.status_code == 204
+        assert not Follow.objects.exists()
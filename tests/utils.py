@@ -1,4 +1,10 @@
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
 
 from apps.articles.models import Article
 
@@ -15,3 +21,31 @@ def get_article_dynamic_url():
     url = reverse("single-article", args=[article.slug])
 
     return url
+
+
+def count_queries(request, *args, **kwargs):
+    """Call a client method and return its response and the number of queries"""
+
+    with CaptureQueriesContext(connection) as context:
+        response = request(*args, **kwargs)
+
+    return response, len(context.captured_queries)
+
+
+def render_serializers(serializer_class, instance, many=False, query=None):
+    """
+    Render a serializer output as JSON with the compiled representation and
+    with DRF's own to_representation
+    """
+
+    request = Request(APIRequestFactory().get("/", query))
+    rendered = []
+
+    for compiled in [True, False]:
+        with override_settings(COMPILED_SERIALIZERS=compiled):
+            serializer = serializer_class(
+                instance, many=many, context={"request": request}
+            )
+            rendered.append(JSONRenderer().render(serializer.data))
+
+    return rendered